@@ -0,0 +1,58 @@
+"""
+Micro-benchmark: per-frame room background cost.
+
+Compares the old path (scaling room-N.png to the screen size every frame)
+with the pre-scaled cache in RoomBackgroundManager.
+
+Run from the project root:
+    python benchmarks/bench_background.py
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pygame
+
+from src.managers.background_manager import RoomBackgroundManager
+
+RESOLUTIONS = [(1920, 1080), (2560, 1440)]
+FRAMES = 200
+
+
+def _time_frames(draw_frame, frames=FRAMES):
+    """Return average milliseconds per call of draw_frame."""
+    start = time.perf_counter()
+    for _ in range(frames):
+        draw_frame()
+    return (time.perf_counter() - start) * 1000.0 / frames
+
+
+def main():
+    pygame.display.init()
+    for width, height in RESOLUTIONS:
+        screen = pygame.display.set_mode((width, height))
+        bg_manager = RoomBackgroundManager()
+        raw_bg = bg_manager.level1_backgrounds[0]
+        cached_bg, _ = bg_manager.get_random_background(level=1)
+
+        def old_frame():
+            screen.fill((0, 0, 0))
+            scaled = pygame.transform.scale(raw_bg, (width, height))
+            screen.blit(scaled, (0, 0))
+
+        def new_frame():
+            screen.fill((0, 0, 0))
+            screen.blit(cached_bg, (0, 0))
+
+        old_ms = _time_frames(old_frame)
+        new_ms = _time_frames(new_frame)
+        print(f"{width}x{height}: per-frame scale {old_ms:.3f} ms, "
+              f"cached {new_ms:.3f} ms ({old_ms / max(new_ms, 1e-9):.1f}x faster)")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
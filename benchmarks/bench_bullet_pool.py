@@ -0,0 +1,70 @@
+"""
+Benchmark: BulletPool with many live bullets.
+
+Measures the per-frame cost of integrate + cull + player hit test, and of
+drawing, for 1k/10k live bullets. The budget for one frame at 60 FPS is
+16.7 ms.
+
+Run from the project root:
+    python benchmarks/bench_bullet_pool.py
+"""
+import math
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pygame
+
+from src.entities.bullet_pool import BulletPool
+from src.managers.resource_manager import resource_manager
+
+WIDTH, HEIGHT = 1920, 1080
+FRAMES = 120
+
+
+def fill_pool(pool, count, sprite_id):
+    """Spawn bullets until the pool holds `count` of them."""
+    while len(pool) < count:
+        angle = random.uniform(0, 2 * math.pi)
+        pool.spawn(random.uniform(0, WIDTH), random.uniform(0, HEIGHT),
+                   math.cos(angle) * 6, math.sin(angle) * 6,
+                   radius=16, damage=30, sprite_id=sprite_id,
+                   rotation=-math.degrees(angle), hit_offset=16)
+
+
+def main():
+    pygame.display.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    sprite = resource_manager.load_image("coal-boss-fire.png", scale=(48, 48))
+    random.seed(0)
+
+    for count in (1_000, 10_000):
+        pool = BulletPool()
+        sprite_id = pool.register_sprite("coal-boss-fire.png", [sprite])
+        fill_pool(pool, count, sprite_id)
+
+        update_s = draw_s = 0.0
+        for _ in range(FRAMES):
+            t0 = time.perf_counter()
+            pool.integrate()
+            pool.cull_outside(WIDTH, HEIGHT)
+            pool.remove(pool.collide_circle(WIDTH / 2, HEIGHT / 2, 50))
+            t1 = time.perf_counter()
+            pool.draw(screen)
+            t2 = time.perf_counter()
+            update_s += t1 - t0
+            draw_s += t2 - t1
+            # Keep the pool at the target size (like a steady bullet hell)
+            fill_pool(pool, count, sprite_id)
+
+        print(f"{count:>6} bullets: update {update_s * 1000 / FRAMES:.3f} ms/frame, "
+              f"draw {draw_s * 1000 / FRAMES:.3f} ms/frame")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Benchmark: entity update cost, per-object classes vs. ECS systems.
+
+A crowd of enemies chases a player that walks in a circle while player
+bullets fly through them (80% enemies, 20% bullets). Spent bullets are
+replaced every tick and enemies cannot die, so the entity count stays
+constant.
+
+- objects: Enemy.update for every enemy, BulletPool for the bullets and
+  Simulation's per-enemy bullet and contact checks
+- ecs: the same work as AISystem, MovementSystem, AnimationSystem,
+  CollisionSystem, DamageSystem and CleanupSystem over one World
+- ecs+binding: ecs plus EntityBinding.pull() copying the state back to
+  the Enemy objects (the cost while code still reads the objects)
+
+Reports milliseconds per tick and per 1000 entities.
+
+Run from the project root:
+    python benchmarks/bench_ecs.py
+"""
+import math
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import numpy as np
+import pygame
+
+ENTITY_COUNTS = [250, 1000, 4000]
+TICKS = 200
+BULLET_SHARE = 0.2
+ENEMY_HP = 10 ** 9
+BULLET_SPEED = 10.0
+BULLET_RADIUS = 10
+
+
+def _player_position(tick):
+    """Player position: a slow circle around the screen centre."""
+    angle = tick / 60.0
+    return 960 + math.cos(angle) * 400, 540 + math.sin(angle) * 250
+
+
+def _bullet_spawns(rand, count, px, py):
+    """Start positions and velocities of `count` bullets fired from the player."""
+    angles = [rand.uniform(0, 2 * math.pi) for _ in range(count)]
+    return [(px, py, math.cos(a) * BULLET_SPEED, math.sin(a) * BULLET_SPEED) for a in angles]
+
+
+def _make_enemies(count):
+    from src.entities.enemy import Enemy
+    from src.entities.enemy_type import EnemyType
+
+    rand = random.Random(count)
+    kinds = [EnemyType.WEAK, EnemyType.MEDIUM, EnemyType.STRONG]
+    enemies = []
+    for i in range(count):
+        enemy = Enemy(rand.uniform(0, 1860), rand.uniform(0, 1020), kinds[i % len(kinds)])
+        enemy.hp = enemy.max_hp = ENEMY_HP
+        enemies.append(enemy)
+    return enemies
+
+
+def run_objects(total):
+    """Per-object update, as Simulation does it today."""
+    from src.entities.bullet_pool import BulletPool
+    from src.utils.hitbox import HitBox
+    from src.utils.spatial_hash import SpatialHashGrid
+
+    enemies = _make_enemies(int(total * (1 - BULLET_SHARE)))
+    bullet_count = total - len(enemies)
+    pool = BulletPool()
+    grid = SpatialHashGrid()
+    player_box = HitBox(0, 0, 45, 70)
+    rand = random.Random(1)
+    elapsed = 0.0
+    for tick in range(TICKS):
+        px, py = _player_position(tick)
+        spawns = _bullet_spawns(rand, bullet_count - pool.count, px, py)
+        start = time.perf_counter()
+        for x, y, vx, vy in spawns:
+            pool.spawn(x, y, vx, vy, radius=BULLET_RADIUS, damage=10)
+        player_box.update_position(px, py)
+        for enemy in enemies:
+            enemy.update(px, py)
+        pool.integrate()
+        pool.build_grid(grid)
+        spent = np.zeros(pool.count, dtype=bool)
+        contact = 0
+        for enemy in enemies:
+            hits = grid.query_hitbox(enemy.hit_box)
+            for i in hits[~spent[hits]]:
+                spent[i] = True
+                enemy.hp -= int(pool.damage[i])
+            if player_box.collide(enemy.hit_box):
+                contact += enemy.ad
+        pool.remove(spent)
+        pool.cull_outside(1920, 1080)
+        elapsed += time.perf_counter() - start
+    return elapsed * 1000.0 / TICKS
+
+
+def run_ecs(total, with_binding=False):
+    """The same tick as ECS systems over one World."""
+    from src.core.ecs import (DAMAGE, ENEMY_TEAM, HEALTH, HITBOX, PLAYER_TEAM, POSITION,
+                              PROJECTILE, VELOCITY, World)
+    from src.core.ecs_systems import (AISystem, AnimationSystem, CleanupSystem, CollisionSystem,
+                                      DamageSystem, MovementSystem, SystemSchedule)
+    from src.entities.ecs_adapters import EntityBinding, spawn_enemy
+
+    world = World()
+    binding = EntityBinding(world)
+    enemies = _make_enemies(int(total * (1 - BULLET_SHARE)))
+    for enemy in enemies:
+        binding.bind(enemy, spawn_enemy(world, enemy))
+    bullet_count = total - len(enemies)
+    player = world.spawn((POSITION, HITBOX, HEALTH, PLAYER_TEAM), radius=45, hit_offset=70, hp=ENEMY_HP)
+
+    ai = AISystem()
+    shots = CollisionSystem((PROJECTILE, PLAYER_TEAM), (HEALTH, ENEMY_TEAM))
+    contact = CollisionSystem((DAMAGE, ENEMY_TEAM), (HEALTH, PLAYER_TEAM), first_only=False,
+                              exclude_attackers=(PROJECTILE,))
+    schedule = SystemSchedule([ai, MovementSystem(), AnimationSystem(), shots, DamageSystem(shots),
+                               contact, DamageSystem(contact, consume_attackers=False),
+                               CleanupSystem((0, 0, 1920, 1080))])
+    bullet_components = (POSITION, VELOCITY, HITBOX, DAMAGE, PROJECTILE, PLAYER_TEAM)
+    rand = random.Random(1)
+    elapsed = 0.0
+    for tick in range(TICKS):
+        px, py = _player_position(tick)
+        spawns = _bullet_spawns(rand, bullet_count - world.count(PROJECTILE), px, py)
+        start = time.perf_counter()
+        if spawns:
+            x, y, vx, vy = (np.array(column) for column in zip(*spawns))
+            world.spawn_many(bullet_components, len(spawns), x=x, y=y, vx=vx, vy=vy,
+                             radius=BULLET_RADIUS, damage=10)
+        world.set(player, x=px, y=py)
+        ai.target = (px, py)
+        schedule.run(world)
+        if with_binding:
+            binding.pull()
+        elapsed += time.perf_counter() - start
+    return elapsed * 1000.0 / TICKS
+
+
+def main():
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    print(f"{TICKS} ticks, {int((1 - BULLET_SHARE) * 100)}% chasing enemies, "
+          f"{int(BULLET_SHARE * 100)}% player bullets")
+    for total in ENTITY_COUNTS:
+        results = [("objects", run_objects(total)), ("ecs", run_ecs(total)),
+                   ("ecs+binding", run_ecs(total, with_binding=True))]
+        line = ", ".join(f"{name} {ms:7.3f} ms/tick ({ms * 1000.0 / total:6.3f} ms/1000)"
+                         for name, ms in results)
+        print(f"{total:5d} entities: {line}, speedup x{results[0][1] / results[1][1]:.1f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark: flow-field steering for many enemies.
+
+Moves a target around a room with a few pillars and, every frame, updates
+the FlowField and looks up a direction for every enemy. The field is only
+recomputed when the target changes cell, so the per-frame cost is one list
+lookup per enemy plus an occasional recompute. For comparison the
+cost of every enemy running its own search is estimated as enemies x one
+field computation.
+
+Run from the project root:
+    python benchmarks/bench_flow_field.py
+"""
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pygame
+
+from src.utils.flow_field import FlowField
+
+ROOM = (100, 100, 1720, 880)
+PILLARS = [pygame.Rect(500, 250, 80, 400), pygame.Rect(1000, 500, 80, 480),
+           pygame.Rect(1400, 100, 80, 450), pygame.Rect(700, 800, 300, 60)]
+ENEMY_COUNTS = [50, 200, 1000]
+FRAMES = 600
+PLAYER_SPEED = 6.0
+
+
+def _player_path(frame):
+    """Player position: a loop around the room centre."""
+    angle = frame * PLAYER_SPEED / 350.0
+    return 960 + math.cos(angle) * 700, 540 + math.sin(angle) * 330
+
+
+def run(enemy_count):
+    """Return (ms per frame, recomputes, ms per recompute) for enemy_count enemies."""
+    rng = random.Random(enemy_count)
+    field = FlowField(ROOM, PILLARS, clearance=24)
+    enemies = [[rng.uniform(120, 1800), rng.uniform(120, 960)] for _ in range(enemy_count)]
+
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        px, py = _player_path(frame)
+        field.update(px, py)
+        for enemy in enemies:
+            direction = field.detour_direction(enemy[0], enemy[1])
+            if direction is None:
+                dx, dy = px - enemy[0], py - enemy[1]
+                dist = math.hypot(dx, dy) or 1.0
+                direction = (dx / dist, dy / dist)
+            enemy[0] += direction[0] * 2.0
+            enemy[1] += direction[1] * 2.0
+    total_ms = (time.perf_counter() - start) * 1000.0
+
+    # Cost of one field computation
+    compute_start = time.perf_counter()
+    for i in range(50):
+        field._compute((i % field.cols, (i * 7) % field.rows))
+    compute_ms = (time.perf_counter() - compute_start) * 1000.0 / 50
+    return total_ms / FRAMES, field.recomputes, compute_ms
+
+
+def main():
+    print(f"{FRAMES} frames, room {ROOM[2]}x{ROOM[3]}, {len(PILLARS)} pillars")
+    for count in ENEMY_COUNTS:
+        frame_ms, recomputes, compute_ms = run(count)
+        per_enemy_search_ms = count * compute_ms
+        print(f"{count:5d} enemies: {frame_ms:6.3f} ms/frame, {recomputes} field recomputes "
+              f"({compute_ms:.2f} ms each); one search per enemy would cost "
+              f"~{per_enemy_search_ms:.0f} ms/frame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark: drawing the HP hearts above enemies.
+
+Compares blitting every heart of every enemy each frame (full hearts,
+dim hearts and a clipped partial heart, as Enemy used to) with one blit
+of a cached HP strip per enemy. Enemies of all three regular sizes are
+mixed and lose HP over time, so the strip cache also sees misses.
+
+Run from the project root:
+    python benchmarks/bench_hp_strip.py
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pygame
+
+from src.entities.enemy import Enemy
+from src.entities.enemy_type import EnemyType
+from src.ui.hp_strip import hp_strip_cache
+
+SCREEN_SIZE = (1920, 1080)
+ENEMY_COUNTS = [10, 50, 200]
+FRAMES = 300
+ENEMY_TYPES = [EnemyType.WEAK, EnemyType.MEDIUM, EnemyType.STRONG]
+
+
+def draw_per_heart(screen, enemy):
+    """Blit each heart separately (the previous Enemy drawing)."""
+    hp_per_heart = hp_strip_cache.hp_per_heart
+    spacing = hp_strip_cache.spacing
+    heart_size = hp_strip_cache.heart_size_for(enemy.size)
+    heart, dim = hp_strip_cache._heart_images(heart_size)
+    total_hearts = max(1, (enemy.max_hp + hp_per_heart - 1) // hp_per_heart)
+    total_width = total_hearts * heart_size + (total_hearts - 1) * spacing
+    x0 = enemy.x + (enemy.size - total_width) // 2
+    y0 = enemy.y - heart_size - 4
+    hearts_value = max(0, min(enemy.hp, enemy.max_hp)) / float(hp_per_heart)
+    for i in range(total_hearts):
+        x = x0 + i * (heart_size + spacing)
+        filled = hearts_value - i
+        if filled >= 1:
+            screen.blit(heart, (x, y0))
+        else:
+            screen.blit(dim, (x, y0))
+            if filled > 0:
+                screen.blit(heart, (x, y0), area=pygame.Rect(0, 0, max(1, int(filled * heart_size)), heart_size))
+    return pygame.Rect(x0, y0, total_width, heart_size)
+
+
+def make_enemies(count):
+    rand = random.Random(count)
+    enemies = []
+    for i in range(count):
+        enemy = Enemy(rand.randint(50, SCREEN_SIZE[0] - 100), rand.randint(50, SCREEN_SIZE[1] - 100),
+                      ENEMY_TYPES[i % len(ENEMY_TYPES)])
+        enemies.append(enemy)
+    return enemies
+
+
+def run(screen, count, draw):
+    """Draw all enemies' HP for FRAMES frames; return milliseconds per frame."""
+    enemies = make_enemies(count)
+    rand = random.Random(1)
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        # A few enemies get hit every frame
+        for enemy in rand.sample(enemies, max(1, count // 20)):
+            enemy.hp = max(1, enemy.hp - rand.choice((1, 2, 5)))
+        for enemy in enemies:
+            draw(screen, enemy)
+    return (time.perf_counter() - start) * 1000.0 / FRAMES
+
+
+def main():
+    pygame.display.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+    print(f"{FRAMES} frames, enemies of sizes {[Enemy(0, 0, t).size for t in ENEMY_TYPES]}")
+    for count in ENEMY_COUNTS:
+        per_heart_ms = run(screen, count, draw_per_heart)
+        strip_ms = run(screen, count, lambda surface, enemy: enemy._draw_enemy_hearts(surface))
+        print(f"{count:4d} enemies: per-heart {per_heart_ms:6.3f} ms/frame, "
+              f"cached strip {strip_ms:6.3f} ms/frame, speedup x{per_heart_ms / strip_ms:.1f}")
+    print(hp_strip_cache)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark: many simultaneous particles.
+
+Compares the per-object Particle path (one Python object and one freshly
+allocated surface per particle per frame) with the batched ParticleEngine
+at 50k live particles. The legacy path is measured at a smaller count and
+scaled, since it is far too slow to run at 50k.
+
+Run from the project root:
+    python benchmarks/bench_particles.py
+"""
+import math
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pygame
+
+from src.utils.particles import Particle, ParticleEngine
+
+WIDTH, HEIGHT = 1920, 1080
+PARTICLES = 50_000
+LEGACY_PARTICLES = 5_000
+FRAMES = 60
+BURST = 25
+COLOR = (0, 255, 0)
+
+
+def legacy_frame_ms(screen, count):
+    """Average ms per frame for `count` Particle objects, kept topped up."""
+    def burst():
+        x, y = random.uniform(0, WIDTH), random.uniform(0, HEIGHT)
+        for _ in range(BURST):
+            angle = random.uniform(0, 2 * math.pi)
+            speed = random.uniform(2, 8)
+            particles.append(Particle(x, y, COLOR, (math.cos(angle) * speed, math.sin(angle) * speed),
+                                      random.randint(30, 60)))
+
+    particles = []
+    while len(particles) < count:
+        burst()
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        particles = [p for p in particles if p.update()]
+        for p in particles:
+            p.draw(screen)
+        while len(particles) < count:
+            burst()
+    return (time.perf_counter() - start) * 1000.0 / FRAMES
+
+
+def engine_frame_ms(screen, count):
+    """Average (update ms, draw ms) per frame for `count` engine particles."""
+    engine = ParticleEngine(seed=0)
+
+    def top_up():
+        while len(engine) < count:
+            engine.emit_burst(random.uniform(0, WIDTH), random.uniform(0, HEIGHT), BURST, COLOR)
+
+    top_up()
+    update_s = draw_s = 0.0
+    for _ in range(FRAMES):
+        t0 = time.perf_counter()
+        engine.update()
+        t1 = time.perf_counter()
+        engine.draw(screen)
+        t2 = time.perf_counter()
+        update_s += t1 - t0
+        draw_s += t2 - t1
+        top_up()
+    return update_s * 1000.0 / FRAMES, draw_s * 1000.0 / FRAMES
+
+
+def main():
+    pygame.display.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    random.seed(0)
+
+    legacy_ms = legacy_frame_ms(screen, LEGACY_PARTICLES)
+    print(f"Particle objects, {LEGACY_PARTICLES} particles: {legacy_ms:.2f} ms/frame "
+          f"(~{legacy_ms * PARTICLES / LEGACY_PARTICLES:.0f} ms/frame at {PARTICLES})")
+
+    for count in (LEGACY_PARTICLES, PARTICLES):
+        update_ms, draw_ms = engine_frame_ms(screen, count)
+        print(f"ParticleEngine, {count} particles: update {update_ms:.2f} ms/frame, "
+              f"draw {draw_ms:.2f} ms/frame")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Micro-benchmark: loading the startup images with and without the disk cache.
+
+Loads the start screen, level maps, room backgrounds and game over screen
+the way the game does, first with an empty cache directory (cold: PNG
+decode + scale, cache files written) and then again from the filled cache
+(warm: mmap + frombuffer + convert).
+
+Run from the project root:
+    python benchmarks/bench_startup.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pygame
+
+from src.managers.resource_manager import ResourceManager
+
+SCREEN_SIZE = (1920, 1080)
+REPEATS = 5
+
+# (filename, scale, convert_alpha) as requested at startup
+STARTUP_IMAGES = (
+    [("ekran_startowy.png", None, False)]
+    + [(name, None, False) for name in ("map.png", "map2.png", "map3.png", "map4.png")]
+    + [(f"room-{n}.png", None, False) for n in range(1, 10)]
+    + [("gameover.png", SCREEN_SIZE, True)]
+)
+
+
+def _load_all(cache_dir):
+    """Load every startup image with an empty in-memory cache; return milliseconds."""
+    manager = ResourceManager()
+    manager.clear_cache()
+    manager.enable_disk_cache(cache_dir)
+    start = time.perf_counter()
+    for filename, scale, convert_alpha in STARTUP_IMAGES:
+        manager.load_image(filename, scale=scale, convert_alpha=convert_alpha)
+    return (time.perf_counter() - start) * 1000.0, manager.disk_cache
+
+
+def main():
+    pygame.display.init()
+    pygame.display.set_mode(SCREEN_SIZE)
+
+    cold, warm = [], []
+    for _ in range(REPEATS):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cold_ms, _ = _load_all(cache_dir)
+            warm_ms, cache = _load_all(cache_dir)
+            cold.append(cold_ms)
+            warm.append(warm_ms)
+
+    stats = cache.get_stats() if cache else {}
+    cold_ms, warm_ms = min(cold), min(warm)
+    print(f"{len(STARTUP_IMAGES)} images, best of {REPEATS}")
+    print(f"cold (decode + write cache): {cold_ms:8.1f} ms")
+    print(f"warm (disk cache):           {warm_ms:8.1f} ms "
+          f"({cold_ms / max(warm_ms, 1e-9):.1f}x faster)")
+    print(f"warm run: {stats.get('hits', 0)} hits, {stats.get('misses', 0)} misses")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
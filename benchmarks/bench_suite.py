@@ -0,0 +1,447 @@
+"""
+Benchmark suite: scripted gameplay scenarios run headless through the game code.
+
+Every scenario starts a seeded Simulation, sets up a situation (enemies,
+bosses, particles, bullets), keeps it going with a per-tick hook and feeds
+scripted input (aim at the nearest enemy, fire, small strafing moves).
+For each scenario it measures:
+
+- update: ms per Simulation.step()
+- render: ms per Simulation.render() onto a 1920x1080 surface
+- allocations: net memory blocks / KB kept per tick and peak traced
+  memory, over an extra run under tracemalloc (timings are taken
+  without tracing), plus garbage collector runs during the timed ticks
+
+Results are written as JSON. With --baseline the results are compared
+against an earlier JSON file and the run fails (exit code 1) when a metric
+got worse by more than --threshold (relative) and a small absolute margin.
+
+Run from the project root:
+    python benchmarks/bench_suite.py
+    python benchmarks/bench_suite.py --output baseline.json
+    python benchmarks/bench_suite.py --baseline baseline.json --threshold 0.2
+    python benchmarks/bench_suite.py --only boss_level_1 bullet_stress_1000
+"""
+import argparse
+import datetime
+import gc
+import json
+import math
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pygame
+
+from src.core.ecs import PLAYER_TEAM, PROJECTILE
+from src.core.simulation import InputState, Simulation
+from src.entities.enemy import Enemy
+from src.entities.enemy_bullet import EnemyBullet
+from src.entities.enemy_type import EnemyType
+from src.utils.particles import BloodParticleSystem
+
+SCREEN_SIZE = (1920, 1080)
+DEFAULT_SEED = 1234
+DEFAULT_TICKS = 300
+DEFAULT_WARMUP = 60
+DEFAULT_ALLOC_TICKS = 100
+DEFAULT_THRESHOLD = 0.2
+PLAYER_HP = 10 ** 9
+
+# (section, statistic, absolute margin) compared against the baseline
+COMPARED_METRICS = [
+    ("update_ms", "mean", 0.05),
+    ("update_ms", "p95", 0.1),
+    ("render_ms", "mean", 0.05),
+    ("render_ms", "p95", 0.1),
+    ("alloc", "net_kb_per_tick", 1.0),
+]
+
+
+class Scenario(NamedTuple):
+    """
+    One scripted situation.
+
+    Attributes:
+        name: Identifier used in the JSON results and --only
+        description: One-line summary
+        setup: Prepares a freshly created Simulation
+        on_tick: Called before every tick to keep the situation going (untimed)
+    """
+    name: str
+    description: str
+    setup: Callable
+    on_tick: Optional[Callable] = None
+
+
+# ----------------------------------------------------------------------
+# Scenario helpers
+# ----------------------------------------------------------------------
+def _start_level(sim, level):
+    """Start a level with an invulnerable player and the spawner switched off."""
+    sim.current_level = level
+    sim.start_new_game(keep_current_level=True)
+    sim.player.hp = PLAYER_HP
+    spawner = sim.enemy_spawner
+    spawner.max_enemies_for_room = spawner.enemies_spawned_in_room = 10 ** 6
+
+
+def _spawn(sim, enemy_type, level, count=1):
+    """Add enemies at random room edge positions (bosses get the boss bar)."""
+    for _ in range(count):
+        x, y = sim.room_manager.get_random_spawn_position()
+        enemy = Enemy(x, y, enemy_type, sim.room_manager, level=level)
+        sim.enemies.append(enemy)
+        if enemy.is_boss:
+            sim.boss_bar_manager.activate(enemy, sim.notifications, sim.font, sim.player.x, sim.player.y)
+
+
+def _keep_enemies(enemy_type, level, count):
+    """Per-tick hook respawning killed enemies."""
+    def on_tick(sim, tick):
+        missing = count - len(sim.enemies)
+        if missing > 0:
+            _spawn(sim, enemy_type, level, missing)
+    return on_tick
+
+
+def _room_point(sim, u, v):
+    """Point at fractions (u, v) of the room rect."""
+    x, y, w, h = sim.room_manager.get_bounds()
+    return x + u * w, y + v * h
+
+
+def scripted_input(sim, tick):
+    """Aim at the nearest enemy (or the room centre), hold fire, strafe a little."""
+    player = sim.player
+    px, py = player.hit_box.x, player.hit_box.y
+    target = min(sim.enemies, key=lambda e: (e.hit_box.x - px) ** 2 + (e.hit_box.y - py) ** 2,
+                 default=None)
+    if target is not None:
+        aim = (int(target.hit_box.x), int(target.hit_box.y))
+    else:
+        aim = tuple(int(c) for c in _room_point(sim, 0.5, 0.5))
+    # Short moves in a square so the player never walks into a corridor
+    move = (pygame.K_w, pygame.K_d, pygame.K_s, pygame.K_a)[(tick // 30) % 4]
+    return InputState((move,), aim, (True, False, False))
+
+
+# ----------------------------------------------------------------------
+# Scenarios
+# ----------------------------------------------------------------------
+def _setup_empty(sim):
+    _start_level(sim, 1)
+
+
+def _setup_weak(sim):
+    _start_level(sim, 1)
+    _spawn(sim, EnemyType.WEAK, 1, 6)
+
+
+def _boss_scenario(level):
+    enemy_type = EnemyType.FINAL_BOSS if level == 4 else EnemyType.BOSS
+
+    def setup(sim):
+        _start_level(sim, level)
+        _spawn(sim, enemy_type, level)
+
+    name = "final boss" if level == 4 else f"level {level} boss"
+    return Scenario(f"boss_level_{level}", f"Fight against the {name}",
+                    setup, _keep_enemies(enemy_type, level, 1))
+
+
+_keep_final_boss = _keep_enemies(EnemyType.FINAL_BOSS, 4, 1)
+
+
+def _final_boss_full_auto_tick(sim, tick):
+    _keep_final_boss(sim, tick)
+    for enemy in sim.enemies:
+        if enemy.is_boss:
+            # Never enter the cooldown phase
+            enemy.is_firing_phase = True
+            enemy.phase_timer = 0
+
+
+def _particle_storm_tick(sim, tick, target=500):
+    while len(sim.particles) < target:
+        k = len(sim.blood_systems) + tick
+        x, y = _room_point(sim, 0.1 + 0.8 * ((k * 0.618) % 1.0), 0.1 + 0.8 * ((k * 0.382) % 1.0))
+        sim.blood_systems.append(BloodParticleSystem(x, y, num_particles=25, engine=sim.particles))
+
+
+def _bullet_stress_tick(sim, tick, target=1000):
+    bullets = sim.enemy_bullet_manager.get_bullets()
+    k = tick * 7919
+    while len(bullets) < target:
+        k += 1
+        # From a point on the room border towards a point on the opposite side
+        angle = (k * 2.399963) % (2 * math.pi)
+        cx, cy = _room_point(sim, 0.5, 0.5)
+        sx, sy = cx + math.cos(angle) * 800, cy + math.sin(angle) * 420
+        tx, ty = cx - math.cos(angle + 0.3) * 800, cy - math.sin(angle + 0.3) * 420
+        bullets.append(EnemyBullet(sx, sy, tx, ty, level=1))
+
+
+SCENARIOS = [
+    Scenario("empty_room", "Level 1 room without enemies", _setup_empty),
+    Scenario("weak_enemies_6", "Six weak enemies chasing the player (respawned)",
+             _setup_weak, _keep_enemies(EnemyType.WEAK, 1, 6)),
+    _boss_scenario(1),
+    _boss_scenario(2),
+    _boss_scenario(3),
+    _boss_scenario(4),
+    Scenario("final_boss_full_auto", "Final boss held in its full-auto firing phase",
+             _boss_scenario(4).setup, _final_boss_full_auto_tick),
+    Scenario("particle_storm_500", "About 500 live blood particles from death bursts",
+             _setup_empty, _particle_storm_tick),
+    Scenario("bullet_stress_1000", "1000 enemy bullets crossing the room",
+             _setup_empty, _bullet_stress_tick),
+]
+
+
+# ----------------------------------------------------------------------
+# Measurement
+# ----------------------------------------------------------------------
+def _stats(samples: List[float]) -> Dict[str, float]:
+    """Mean, median, 95th percentile and maximum of millisecond samples."""
+    ordered = sorted(samples)
+    n = len(ordered)
+    if n == 0:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+    return {
+        "mean": round(sum(ordered) / n, 4),
+        "p50": round(ordered[n // 2], 4),
+        "p95": round(ordered[min(n - 1, int(n * 0.95))], 4),
+        "max": round(ordered[-1], 4),
+    }
+
+
+def _tick(sim, scenario, screen, tick, timings=None):
+    """Run the hook, one step and one render; optionally record their times."""
+    if scenario.on_tick is not None:
+        scenario.on_tick(sim, tick)
+    inputs = scripted_input(sim, tick)
+    start = time.perf_counter()
+    sim.step(inputs)
+    middle = time.perf_counter()
+    sim.render(screen)
+    end = time.perf_counter()
+    if timings is not None:
+        timings[0].append((middle - start) * 1000.0)
+        timings[1].append((end - middle) * 1000.0)
+
+
+def run_scenario(scenario: Scenario, screen, seed=DEFAULT_SEED, ticks=DEFAULT_TICKS,
+                 warmup=DEFAULT_WARMUP, alloc_ticks=DEFAULT_ALLOC_TICKS) -> Dict:
+    """
+    Run one scenario and collect its metrics.
+
+    Args:
+        scenario: Scenario to run
+        screen: Surface to render onto
+        seed: Simulation seed
+        ticks: Timed ticks
+        warmup: Untimed ticks before measuring (fills caches)
+        alloc_ticks: Ticks run under tracemalloc after the timed ticks
+
+    Returns:
+        Result dictionary (see module docstring)
+    """
+    sim = Simulation(*SCREEN_SIZE, seed=seed)
+    scenario.setup(sim)
+
+    tick = 0
+    for _ in range(warmup):
+        _tick(sim, scenario, screen, tick)
+        tick += 1
+
+    timings = ([], [])
+    gc_before = sum(stat["collections"] for stat in gc.get_stats())
+    for _ in range(ticks):
+        _tick(sim, scenario, screen, tick, timings)
+        tick += 1
+    gc_runs = sum(stat["collections"] for stat in gc.get_stats()) - gc_before
+
+    entities = {
+        "enemies": len(sim.enemies),
+        "bullets": sim.world.count(PROJECTILE, PLAYER_TEAM),
+        "enemy_bullets": len(sim.enemy_bullet_manager.get_bullets()),
+        "particles": len(sim.particles),
+    }
+
+    alloc = {"net_blocks_per_tick": 0.0, "net_kb_per_tick": 0.0, "peak_kb": 0.0}
+    if alloc_ticks > 0:
+        ignore = (tracemalloc.Filter(False, tracemalloc.__file__),)
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot().filter_traces(ignore)
+        base_memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for _ in range(alloc_ticks):
+            _tick(sim, scenario, screen, tick)
+            tick += 1
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot().filter_traces(ignore)
+        tracemalloc.stop()
+        diff = after.compare_to(before, "filename")
+        alloc = {
+            "net_blocks_per_tick": round(sum(stat.count_diff for stat in diff) / alloc_ticks, 2),
+            "net_kb_per_tick": round(sum(stat.size_diff for stat in diff) / 1024.0 / alloc_ticks, 3),
+            "peak_kb": round((peak - base_memory) / 1024.0, 1),
+        }
+
+    return {
+        "description": scenario.description,
+        "update_ms": _stats(timings[0]),
+        "render_ms": _stats(timings[1]),
+        "alloc": alloc,
+        "gc_collections": gc_runs,
+        "entities": entities,
+    }
+
+
+def run_suite(names: Optional[List[str]] = None, seed=DEFAULT_SEED, ticks=DEFAULT_TICKS,
+              warmup=DEFAULT_WARMUP, alloc_ticks=DEFAULT_ALLOC_TICKS) -> Dict:
+    """
+    Run the selected scenarios (all by default).
+
+    Returns:
+        {"meta": {...}, "scenarios": {name: result}}
+    """
+    selected = [s for s in SCENARIOS if not names or s.name in names]
+    unknown = set(names or ()) - {s.name for s in SCENARIOS}
+    if unknown:
+        raise ValueError(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+    results = {}
+    for scenario in selected:
+        results[scenario.name] = run_scenario(scenario, screen, seed, ticks, warmup, alloc_ticks)
+    pygame.quit()
+
+    # Summary after all scenarios (the game code prints while setting up rooms)
+    print(f"\n{'scenario':22s} {'update ms':>10s} {'p95':>8s} {'render ms':>10s} {'p95':>8s} "
+          f"{'KB/tick':>8s} {'gc':>4s}")
+    for name, result in results.items():
+        print(f"{name:22s} {result['update_ms']['mean']:10.3f} {result['update_ms']['p95']:8.3f} "
+              f"{result['render_ms']['mean']:10.3f} {result['render_ms']['p95']:8.3f} "
+              f"{result['alloc']['net_kb_per_tick']:8.2f} {result['gc_collections']:4d}")
+
+    return {
+        "meta": {
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "seed": seed,
+            "ticks": ticks,
+            "warmup": warmup,
+            "alloc_ticks": alloc_ticks,
+        },
+        "scenarios": results,
+    }
+
+
+# ----------------------------------------------------------------------
+# Baseline comparison
+# ----------------------------------------------------------------------
+def compare(results: Dict, baseline: Dict, threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """
+    Compare results against a baseline.
+
+    A metric regresses when it grew by more than `threshold` (relative)
+    and by more than its absolute margin (see COMPARED_METRICS), which
+    keeps tiny timings from flagging noise.
+
+    Args:
+        results: Output of run_suite()
+        baseline: Earlier output of run_suite()
+        threshold: Allowed relative growth (0.2 = 20%)
+
+    Returns:
+        One row per scenario and metric with keys scenario, metric, base,
+        new, change and status ("ok", "improved", "regression" or "new")
+    """
+    rows = []
+    base_scenarios = baseline.get("scenarios", {})
+    for name, result in results["scenarios"].items():
+        base = base_scenarios.get(name)
+        for section, stat, margin in COMPARED_METRICS:
+            metric = f"{section}.{stat}"
+            new_value = result[section][stat]
+            if base is None or stat not in base.get(section, {}):
+                rows.append({"scenario": name, "metric": metric, "base": None, "new": new_value,
+                             "change": None, "status": "new"})
+                continue
+            base_value = base[section][stat]
+            delta = new_value - base_value
+            change = delta / base_value if base_value else (0.0 if delta == 0 else math.inf)
+            if delta > margin and change > threshold:
+                status = "regression"
+            elif -delta > margin and -change > threshold:
+                status = "improved"
+            else:
+                status = "ok"
+            rows.append({"scenario": name, "metric": metric, "base": base_value, "new": new_value,
+                         "change": change, "status": status})
+    return rows
+
+
+def print_report(rows: List[Dict], threshold: float) -> int:
+    """Print a comparison table; return the number of regressions."""
+    print(f"\nComparison against baseline (threshold {threshold:.0%}):")
+    for row in rows:
+        if row["status"] == "new":
+            print(f"  {row['scenario']:22s} {row['metric']:22s} {'':>10s} -> {row['new']:10.3f}  new")
+            continue
+        change = "inf" if math.isinf(row["change"]) else f"{row['change']:+.1%}"
+        marker = {"regression": "REGRESSION", "improved": "improved", "ok": "ok"}[row["status"]]
+        print(f"  {row['scenario']:22s} {row['metric']:22s} {row['base']:10.3f} -> {row['new']:10.3f} "
+              f"{change:>8s}  {marker}")
+    regressions = sum(1 for row in rows if row["status"] == "regression")
+    print(f"{'FAIL' if regressions else 'PASS'}: {regressions} regression(s)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless gameplay benchmark suite")
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="run only these scenarios")
+    parser.add_argument("--list", action="store_true", help="list scenarios and exit")
+    parser.add_argument("--ticks", type=int, default=DEFAULT_TICKS, help="timed ticks per scenario")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="untimed ticks before measuring")
+    parser.add_argument("--alloc-ticks", type=int, default=DEFAULT_ALLOC_TICKS,
+                        help="ticks run under tracemalloc (0 = skip)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="simulation seed")
+    parser.add_argument("--output", default="bench_results.json", help="JSON results file")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed relative slowdown before a metric fails")
+    args = parser.parse_args()
+
+    if args.list:
+        for scenario in SCENARIOS:
+            print(f"{scenario.name:22s} {scenario.description}")
+        return 0
+
+    results = run_suite(args.only, args.seed, args.ticks, args.warmup, args.alloc_ticks)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows = compare(results, baseline, args.threshold)
+        if print_report(rows, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""
+Startup check: time until the start screen's first frame is on screen.
+
+Starts main.py in a fresh interpreter (dummy video driver) whose
+pygame.display.update/flip report the time of the first presented frame
+and exit, and measures from just before the process was launched. Exits
+with status 1 when the median over several runs exceeds the budget, so it
+can guard against startup regressions (e.g. a heavy module imported
+before the start screen again).
+
+With --importtime the interpreter runs with `-X importtime`; the modules
+with the largest self time and the total time of the game's own src.*
+modules imported before the first frame are printed.
+
+Run from the project root:
+    python benchmarks/check_first_frame.py
+    python benchmarks/check_first_frame.py --budget-ms 1500 --importtime
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+DEFAULT_RUNS = 5
+DEFAULT_BUDGET_MS = 2000.0
+TOP_MODULES = 15
+
+FIRST_FRAME_MARKER = "FIRST_FRAME"
+
+# Runs main.py and exits as soon as the first frame is presented
+_WRAPPER = f"""
+import os, sys, time, runpy
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+def _first_frame(*args, **kwargs):
+    print("{FIRST_FRAME_MARKER}", repr(time.time()), flush=True)
+    os._exit(0)
+
+pygame.display.update = _first_frame
+pygame.display.flip = _first_frame
+sys.argv = ["main.py"]
+runpy.run_path("main.py", run_name="__main__")
+"""
+
+
+def run_once(importtime=False):
+    """
+    Start the game once.
+
+    Args:
+        importtime: Run the interpreter with -X importtime
+
+    Returns:
+        (milliseconds to the first frame, interpreter stderr)
+
+    Raises:
+        RuntimeError: If the game exited without presenting a frame
+    """
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["-c", _WRAPPER]
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy")
+    start = time.time()
+    result = subprocess.run(command, cwd=ROOT, env=env, capture_output=True, text=True, timeout=120)
+    for line in result.stdout.splitlines():
+        if line.startswith(FIRST_FRAME_MARKER):
+            return (float(line.split()[1]) - start) * 1000.0, result.stderr
+    raise RuntimeError(f"main.py exited ({result.returncode}) without drawing a frame:\n"
+                       f"{result.stdout}{result.stderr}")
+
+
+def parse_importtime(stderr):
+    """
+    Parse `-X importtime` output.
+
+    Args:
+        stderr: Interpreter stderr ("import time: self [us] | cumulative | name" lines)
+
+    Returns:
+        List of (module name, self microseconds, cumulative microseconds)
+    """
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # column header
+        name = fields[2].strip()
+        modules.append((name, int(fields[0]), int(fields[1])))
+    return modules
+
+
+def print_import_profile(modules):
+    """Print the slowest modules and the src.* total."""
+    print(f"\n{len(modules)} modules imported before the first frame")
+    print(f"{'self ms':>8} {'cumul ms':>9}  module")
+    for name, self_us, cumulative_us in sorted(modules, key=lambda m: -m[1])[:TOP_MODULES]:
+        print(f"{self_us / 1000:8.1f} {cumulative_us / 1000:9.1f}  {name}")
+
+    game_modules = [m for m in modules if m[0] == "src" or m[0].startswith("src.")]
+    game_self_ms = sum(self_us for _, self_us, _ in game_modules) / 1000
+    print(f"\nsrc.* modules: {len(game_modules)}, {game_self_ms:.1f} ms self time")
+    for name, _, _ in sorted(game_modules):
+        print(f"    {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="number of game starts")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="fail when the median time to the first frame is above this")
+    parser.add_argument("--importtime", action="store_true",
+                        help="also print an import-time profile of the startup")
+    args = parser.parse_args()
+
+    times = [run_once()[0] for _ in range(args.runs)]
+    median_ms = statistics.median(times)
+    print(f"time to first frame over {args.runs} runs: median {median_ms:.0f} ms "
+          f"(min {min(times):.0f}, max {max(times):.0f})")
+
+    if args.importtime:
+        _, stderr = run_once(importtime=True)
+        print_import_profile(parse_importtime(stderr))
+
+    if median_ms > args.budget_ms:
+        print(f"\nFAIL: {median_ms:.0f} ms is over the {args.budget_ms:.0f} ms budget")
+        return 1
+    print(f"\nOK: within the {args.budget_ms:.0f} ms budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
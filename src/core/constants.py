@@ -5,7 +5,9 @@ Stałe konfiguracyjne gry.
 # Ustawienia ekranu
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
-FPS = 60
+FPS = 60  # Ticki symulacji na sekundę (prędkości i cooldowny liczone są w tickach)
+RENDER_FPS = 60  # Limit klatek rysowania, np. 120/144 albo 30 (0 = bez limitu); nie zmienia tempa gry
+MAX_TICKS_PER_FRAME = 5  # Maks. ticków nadrabianych w jednej klatce (przy dłuższym zacięciu gra zwalnia)
 
 # Obszar gry
 GAME_AREA_WIDTH = 800
@@ -47,3 +49,17 @@ STRENGTH_DURATION = 3
 SPEED_BOOST_CHARGES = 3
 SHIELD_CHARGES = 3
 STRENGTH_CHARGES = 2
+
+# Renderowanie
+DIRTY_RECT_RENDERING = False  # Odświeżaj tylko zmienione fragmenty ekranu (opcjonalne)
+DIRTY_RECT_FULL_UPDATE_RATIO = 0.4  # Powyżej tej części ekranu odświeżany jest cały ekran
+TEXTURE_ATLAS = True  # Sprite'y rozgrywki spakowane w atlas (cache/atlas)
+DISK_CACHE = True  # Zdekodowane obrazy zapisywane na dysku (szybszy start)
+DISK_CACHE_DIR = "cache/decoded"
+PRELOAD_WORKERS = 4  # Wątki dekodujące obrazy w tle (ekran startowy)
+ASSET_CACHE_BUDGET_MB = 256  # Limit pamięci obrazów w cache (LRU, zasoby poziomu przypięte)
+
+# Profilowanie
+PROFILER_ENABLED = False  # Mierz czasy poszczególnych etapów klatki (F3 pokazuje nakładkę)
+PROFILER_WINDOW = 300  # Liczba ostatnich klatek do percentyli (p50/p95/p99)
+PROFILER_DUMP_PATH = "profile.json"  # Zapis statystyk przy wyjściu (.json lub .csv)
@@ -0,0 +1,634 @@
+"""
+Entity-component-system storage.
+
+Entities are plain integer handles. Their data lives in components (position,
+velocity, hitbox, ...), and all entities with the same set of components
+share one Archetype: a structure of arrays with one NumPy column per
+component field, the same layout BulletPool and ParticleEngine use. Systems
+(see src.core.ecs_systems) query the archetypes that have the components
+they need and process every matching entity with a few array operations
+instead of calling update() on one object at a time.
+
+Live rows always occupy [0, count) of an archetype and removal keeps their
+order, so iteration order is creation order and the simulation stays
+deterministic. destroy() is deferred until flush() (run by CleanupSystem),
+which keeps array views valid while systems run.
+"""
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Sequence, Tuple
+
+import numpy as np
+import pygame
+
+from src.managers.resource_manager import resource_manager
+
+# Component names
+POSITION = "position"  # x, y (drawn sprite center = x + draw_dx, y + draw_dy)
+VELOCITY = "velocity"  # vx, vy in pixels per tick
+HITBOX = "hitbox"  # Circle of `radius` centered at (x + hit_offset, y + hit_offset), as HitBox
+SPRITE = "sprite"  # Animated, optionally rotated/flipped frames from a SpriteTable
+HEALTH = "health"  # hp, max_hp
+DAMAGE = "damage"  # Damage dealt on contact
+AI = "ai"  # Steering behaviour (ai_kind) and speed
+LIFETIME = "lifetime"  # Ticks left before the entity is destroyed
+
+# Tag components (no data), used to pick sides in collision queries
+PLAYER_TEAM = "player_team"
+ENEMY_TEAM = "enemy_team"
+PROJECTILE = "projectile"
+
+# Fields of each component; field names are unique across components
+COMPONENT_FIELDS: Dict[str, Tuple[Tuple[str, type], ...]] = {
+    POSITION: (('x', np.float64), ('y', np.float64)),
+    VELOCITY: (('vx', np.float64), ('vy', np.float64)),
+    HITBOX: (('radius', np.float64), ('hit_offset', np.float64)),
+    SPRITE: (('sprite_id', np.int32), ('frame', np.int32), ('frame_timer', np.int32),
+             ('frame_speed', np.int32), ('frame_count', np.int32), ('rotation', np.float64),
+             ('facing_left', np.bool_), ('draw_dx', np.float64), ('draw_dy', np.float64)),
+    HEALTH: (('hp', np.int64), ('max_hp', np.int64)),
+    DAMAGE: (('damage', np.int64),),
+    AI: (('ai_kind', np.int32), ('speed', np.float64)),
+    LIFETIME: (('ttl', np.int32),),
+    PLAYER_TEAM: (),
+    ENEMY_TEAM: (),
+    PROJECTILE: (),
+}
+
+_FIELD_COMPONENTS = {field: name for name, fields in COMPONENT_FIELDS.items() for field, _ in fields}
+
+
+def register_component(name: str, fields: Sequence[Tuple[str, type]] = ()) -> None:
+    """
+    Add a component type (call before creating entities that use it).
+
+    Args:
+        name: Component name
+        fields: (field name, NumPy dtype) pairs; empty for a tag component
+
+    Raises:
+        ValueError: If the component exists with different fields, or a
+                    field name is already used by another component
+    """
+    fields = tuple((field, np.dtype(dtype).type) for field, dtype in fields)
+    existing = COMPONENT_FIELDS.get(name)
+    if existing is not None:
+        if existing != fields:
+            raise ValueError(f"Component {name!r} is already registered with fields {existing}")
+        return
+    for field, _ in fields:
+        if field in _FIELD_COMPONENTS:
+            raise ValueError(f"Field {field!r} already belongs to component {_FIELD_COMPONENTS[field]!r}")
+    COMPONENT_FIELDS[name] = fields
+    for field, _ in fields:
+        _FIELD_COMPONENTS[field] = name
+
+
+class Archetype:
+    """
+    Storage of all entities that have exactly one set of components.
+
+    Every component field is a NumPy column; row i of all columns (and of
+    `entity`) belongs to the same entity. Columns returned by column() are
+    views of the live rows, so systems can update them in place.
+
+    Attributes:
+        index (int): Position of the archetype in World.archetypes
+        components (FrozenSet[str]): Component names
+        count (int): Number of live entities
+        capacity (int): Allocated rows in every column
+        entity (np.ndarray): Entity id of every row
+    """
+
+    INITIAL_CAPACITY = 64
+
+    def __init__(self, index: int, components: FrozenSet[str], capacity: int = INITIAL_CAPACITY) -> None:
+        """
+        Initialize an empty archetype.
+
+        Args:
+            index: Position of the archetype in World.archetypes
+            components: Component names (must be registered)
+            capacity: Number of preallocated rows (grows automatically)
+
+        Raises:
+            KeyError: If a component is not registered
+        """
+        self.index = index
+        self.components = components
+        self.capacity = max(1, int(capacity))
+        self.count = 0
+        self.entity = np.zeros(self.capacity, dtype=np.int64)
+        self._fields: Dict[str, type] = {}
+        for name in sorted(components):
+            for field, dtype in COMPONENT_FIELDS[name]:
+                self._fields[field] = dtype
+        self._columns: Dict[str, np.ndarray] = {
+            field: np.zeros(self.capacity, dtype=dtype) for field, dtype in self._fields.items()}
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        """Names of all columns."""
+        return tuple(self._fields)
+
+    def has(self, *components: str) -> bool:
+        """Check whether entities of this archetype have all given components."""
+        return self.components.issuperset(components)
+
+    def column(self, field: str) -> np.ndarray:
+        """
+        Get the live rows of a column.
+
+        Args:
+            field: Field name (e.g. 'x', 'hp')
+
+        Returns:
+            Writable view of rows [0, count) (valid until rows are added or removed)
+
+        Raises:
+            KeyError: If the archetype has no such field
+        """
+        return self._columns[field][:self.count]
+
+    def entities(self) -> np.ndarray:
+        """Get the entity ids of the live rows (a view, see column())."""
+        return self.entity[:self.count]
+
+    def _grow(self, needed: int) -> None:
+        """Grow all columns so at least `needed` rows are available."""
+        new_capacity = self.capacity
+        while new_capacity < needed:
+            new_capacity *= 2
+        if new_capacity == self.capacity:
+            return
+        for field, old in self._columns.items():
+            new = np.zeros(new_capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            self._columns[field] = new
+        entity = np.zeros(new_capacity, dtype=np.int64)
+        entity[:self.count] = self.entity[:self.count]
+        self.entity = entity
+        self.capacity = new_capacity
+
+    def append(self, entity_ids: np.ndarray, values: Dict[str, object]) -> int:
+        """
+        Add rows at the end.
+
+        Args:
+            entity_ids: Ids of the new entities
+            values: Field -> scalar or per-entity array (missing fields are 0)
+
+        Returns:
+            Row of the first new entity
+
+        Raises:
+            KeyError: If a value is given for a field the archetype does not have
+        """
+        added = len(entity_ids)
+        start = self.count
+        if start + added > self.capacity:
+            self._grow(start + added)
+        end = start + added
+        self.entity[start:end] = entity_ids
+        for field, value in values.items():
+            if field not in self._columns:
+                raise KeyError(f"Archetype {sorted(self.components)} has no field {field!r}")
+            self._columns[field][start:end] = value
+        for field, column in self._columns.items():
+            if field not in values:
+                column[start:end] = 0
+        self.count = end
+        return start
+
+    def row_values(self, row: int) -> Dict[str, object]:
+        """Get all field values of one row."""
+        return {field: column[row] for field, column in self._columns.items()}
+
+    def remove(self, remove_mask: np.ndarray) -> int:
+        """
+        Remove rows, compacting the remaining ones to the front in order.
+
+        Args:
+            remove_mask: Boolean mask over the live rows
+
+        Returns:
+            Row of the first moved entity (== count if none moved)
+        """
+        n = self.count
+        keep = ~remove_mask[:n]
+        kept = int(keep.sum())
+        if kept == n:
+            return n
+        first = int(np.argmax(~keep))
+        for column in self._columns.values():
+            column[first:kept] = column[first:n][keep[first:]]
+        self.entity[first:kept] = self.entity[first:n][keep[first:]]
+        self.count = kept
+        return first
+
+    def __len__(self) -> int:
+        """Get the number of live entities."""
+        return self.count
+
+    def __repr__(self) -> str:
+        """
+        String representation for debugging.
+
+        Returns:
+            String showing the components and entity count
+        """
+        return f"Archetype({sorted(self.components)}, count={self.count}, capacity={self.capacity})"
+
+
+class SpriteTable:
+    """
+    Animation frames referenced by the sprite_id field of SPRITE.
+
+    Rotated frames come from ResourceManager's rotation cache (quantized
+    to its angle buckets); flipped frames are made once per frame.
+    """
+
+    def __init__(self) -> None:
+        self._frames: List[List[pygame.Surface]] = []
+        self._keys: List[str] = []
+        self._ids: Dict[str, int] = {}
+        # (sprite_id, frame, bucket, flipped) -> (surface, half width, half height)
+        self._images: Dict[Tuple[int, int, int, bool], Tuple[pygame.Surface, int, int]] = {}
+        self._bucket_count = resource_manager.rotation_buckets
+
+    def register(self, key: str, frames: Sequence[pygame.Surface]) -> int:
+        """
+        Register animation frames under a key and return their sprite id.
+
+        Registering the same key again returns the existing id.
+
+        Args:
+            key: Unique name of the sprite (e.g. "enemy1.png")
+            frames: Animation frames (may be empty for fallback rendering)
+
+        Returns:
+            Sprite id, or -1 if there are no frames
+        """
+        sprite_id = self._ids.get(key)
+        if sprite_id is not None:
+            return sprite_id
+        if not frames:
+            return -1
+        sprite_id = len(self._frames)
+        self._frames.append(list(frames))
+        self._keys.append(key)
+        self._ids[key] = sprite_id
+        return sprite_id
+
+    def frame_count(self, sprite_id: int) -> int:
+        """Get the number of frames of a sprite (1 for -1)."""
+        return len(self._frames[sprite_id]) if sprite_id >= 0 else 1
+
+    def image(self, sprite_id: int, frame: int, bucket: int, flipped: bool) -> Tuple[pygame.Surface, int, int]:
+        """
+        Get a frame as drawn, with its half size for centering.
+
+        Args:
+            sprite_id: Registered sprite id (>= 0)
+            frame: Frame index
+            bucket: ResourceManager rotation bucket (0 = unrotated)
+            flipped: Mirror horizontally (before rotating)
+
+        Returns:
+            (surface, half width, half height)
+        """
+        key = (sprite_id, frame, bucket, flipped)
+        entry = self._images.get(key)
+        if entry is None:
+            surface = self._frames[sprite_id][frame]
+            name = f"{self._keys[sprite_id]}#{frame}"
+            if flipped:
+                surface = pygame.transform.flip(surface, True, False)
+                name += "#flipped"
+            surface = resource_manager.get_rotated_bucket(name, surface, bucket)
+            entry = (surface, surface.get_width() // 2, surface.get_height() // 2)
+            self._images[key] = entry
+        return entry
+
+    def clear_images(self) -> None:
+        """Drop the prepared images (e.g. after the rotation bucket count changed)."""
+        self._images.clear()
+
+    def sync_rotation_buckets(self) -> None:
+        """Drop the prepared images if the ResourceManager bucket count changed."""
+        buckets = resource_manager.rotation_buckets
+        if buckets != self._bucket_count:
+            self._bucket_count = buckets
+            self.clear_images()
+
+    def __len__(self) -> int:
+        """Get the number of registered sprites."""
+        return len(self._frames)
+
+    def __repr__(self) -> str:
+        return f"SpriteTable(sprites={len(self._frames)}, images={len(self._images)})"
+
+
+class World:
+    """
+    All entities and their components, grouped into archetypes.
+
+    An entity id is a handle: the slot index in the low INDEX_BITS bits and
+    the slot's generation above them. Slots are reused after their entity
+    is flushed, but every flush bumps the slot's generation, so a stale id
+    is no longer alive (locate() raises KeyError) instead of aliasing the
+    entity that now uses the slot.
+
+    Attributes:
+        archetypes (List[Archetype]): Archetypes in creation order
+        sprites (SpriteTable): Frames used by SPRITE components
+
+    Example:
+        >>> world = World()
+        >>> bullet = world.spawn((POSITION, VELOCITY, LIFETIME), x=10, y=20, vx=5, ttl=60)
+        >>> for arch in world.query(POSITION, VELOCITY):
+        ...     x = arch.column('x')
+        ...     x += arch.column('vx')
+        >>> world.destroy(bullet)
+        >>> world.flush()
+    """
+
+    INITIAL_ENTITIES = 256
+    INDEX_BITS = 32
+    INDEX_MASK = (1 << INDEX_BITS) - 1
+    GENERATION_MASK = (1 << 31) - 1  # Keeps handles positive int64
+
+    def __init__(self) -> None:
+        self.archetypes: List[Archetype] = []
+        self.sprites = SpriteTable()
+        self._by_components: Dict[FrozenSet[str], Archetype] = {}
+        self._queries: Dict[Tuple[FrozenSet[str], FrozenSet[str]], List[Archetype]] = {}
+        # Per slot index: archetype index (-1 = free), row and generation
+        self._archetype_of = np.full(self.INITIAL_ENTITIES, -1, dtype=np.int32)
+        self._row_of = np.zeros(self.INITIAL_ENTITIES, dtype=np.int64)
+        self._generation = np.zeros(self.INITIAL_ENTITIES, dtype=np.int64)
+        self._next_id = 0
+        self._free_ids: deque = deque()
+        self._pending: List[int] = []
+        self.alive = 0
+
+    # ------------------------------------------------------------------
+    # Archetypes and queries
+    # ------------------------------------------------------------------
+    def archetype(self, components: Iterable[str]) -> Archetype:
+        """
+        Get (creating if needed) the archetype of a component set.
+
+        Args:
+            components: Component names
+
+        Returns:
+            The Archetype storing entities with exactly these components
+        """
+        key = frozenset(components)
+        arch = self._by_components.get(key)
+        if arch is None:
+            arch = Archetype(len(self.archetypes), key)
+            self.archetypes.append(arch)
+            self._by_components[key] = arch
+            self._queries.clear()
+        return arch
+
+    def query(self, *components: str, exclude: Iterable[str] = ()) -> List[Archetype]:
+        """
+        Get all archetypes whose entities have (at least) the given components.
+
+        Args:
+            *components: Required component names
+            exclude: Component names the entities must not have
+
+        Returns:
+            Matching archetypes in creation order (may include empty ones)
+        """
+        key = (frozenset(components), frozenset(exclude))
+        matches = self._queries.get(key)
+        if matches is None:
+            required, excluded = key
+            matches = [arch for arch in self.archetypes
+                       if arch.components >= required and not arch.components & excluded]
+            self._queries[key] = matches
+        return matches
+
+    def count(self, *components: str, exclude: Iterable[str] = ()) -> int:
+        """Get the number of live entities with the given components (see query())."""
+        return sum(arch.count for arch in self.query(*components, exclude=exclude))
+
+    # ------------------------------------------------------------------
+    # Entities
+    # ------------------------------------------------------------------
+    def _allocate_ids(self, count: int) -> np.ndarray:
+        """Take `count` entity ids, reusing freed slots first."""
+        ids = []
+        while self._free_ids and len(ids) < count:
+            ids.append(self._free_ids.popleft())
+        fresh = count - len(ids)
+        if fresh:
+            start = self._next_id
+            self._next_id += fresh
+            if self._next_id > len(self._archetype_of):
+                capacity = len(self._archetype_of)
+                while capacity < self._next_id:
+                    capacity *= 2
+                archetype_of = np.full(capacity, -1, dtype=np.int32)
+                archetype_of[:start] = self._archetype_of[:start]
+                row_of = np.zeros(capacity, dtype=np.int64)
+                row_of[:start] = self._row_of[:start]
+                # All generations survive clear(), not just the ones below start
+                generation = np.zeros(capacity, dtype=np.int64)
+                generation[:len(self._generation)] = self._generation
+                self._archetype_of = archetype_of
+                self._row_of = row_of
+                self._generation = generation
+            ids.extend(range(start, start + fresh))
+        index = np.asarray(ids, dtype=np.int64)
+        return (self._generation[index] << self.INDEX_BITS) | index
+
+    def spawn(self, components: Iterable[str], **values) -> int:
+        """
+        Create one entity.
+
+        Args:
+            components: Component names
+            **values: Initial field values (missing fields are 0)
+
+        Returns:
+            Entity id
+        """
+        return int(self.spawn_many(components, 1, **values)[0])
+
+    def spawn_many(self, components: Iterable[str], count: int, **values) -> np.ndarray:
+        """
+        Create several entities with the same components at once.
+
+        Args:
+            components: Component names
+            count: Number of entities
+            **values: Field -> scalar or array of `count` values
+
+        Returns:
+            Entity ids (in row order)
+        """
+        arch = self.archetype(components)
+        ids = self._allocate_ids(count)
+        start = arch.append(ids, values)
+        index = ids & self.INDEX_MASK
+        self._archetype_of[index] = arch.index
+        self._row_of[index] = np.arange(start, start + count)
+        self.alive += count
+        return ids
+
+    def is_alive(self, entity: int) -> bool:
+        """Check whether an entity exists (destroyed entities live until flush())."""
+        if entity < 0:
+            return False
+        index = entity & self.INDEX_MASK
+        return (index < self._next_id and self._archetype_of[index] >= 0
+                and self._generation[index] == entity >> self.INDEX_BITS)
+
+    def locate(self, entity: int) -> Tuple[Archetype, int]:
+        """
+        Find where an entity is stored.
+
+        Args:
+            entity: Entity id
+
+        Returns:
+            (archetype, row); the row is valid until rows are added or removed
+
+        Raises:
+            KeyError: If the entity does not exist (or its id is stale)
+        """
+        if not self.is_alive(entity):
+            raise KeyError(f"No entity {entity}")
+        index = entity & self.INDEX_MASK
+        return self.archetypes[self._archetype_of[index]], int(self._row_of[index])
+
+    def get(self, entity: int, field: str):
+        """Get one field of an entity (as a NumPy scalar)."""
+        arch, row = self.locate(entity)
+        return arch.column(field)[row]
+
+    def set(self, entity: int, **values) -> None:
+        """Set fields of an entity."""
+        arch, row = self.locate(entity)
+        for field, value in values.items():
+            arch.column(field)[row] = value
+
+    def has(self, entity: int, *components: str) -> bool:
+        """Check whether an existing entity has all given components."""
+        return self.locate(entity)[0].has(*components)
+
+    def set_components(self, entity: int, components: Iterable[str], **values) -> None:
+        """
+        Move an entity to another component set, keeping the fields both share.
+
+        This is a structural change: do not call it while a system iterates
+        over the entity's archetypes.
+
+        Args:
+            entity: Entity id
+            components: New component names
+            **values: Values of fields (e.g. of added components)
+        """
+        old, row = self.locate(entity)
+        new = self.archetype(components)
+        if new is old:
+            self.set(entity, **values)
+            return
+        kept = {field: value for field, value in old.row_values(row).items() if field in new._fields}
+        kept.update(values)
+        mask = np.zeros(old.count, dtype=np.bool_)
+        mask[row] = True
+        self._remove_rows(old, mask)
+        start = new.append(np.asarray([entity], dtype=np.int64), kept)
+        index = entity & self.INDEX_MASK
+        self._archetype_of[index] = new.index
+        self._row_of[index] = start
+
+    def add_component(self, entity: int, component: str, **values) -> None:
+        """Add a component to an entity (see set_components())."""
+        self.set_components(entity, self.locate(entity)[0].components | {component}, **values)
+
+    def remove_component(self, entity: int, component: str) -> None:
+        """Remove a component from an entity (see set_components())."""
+        self.set_components(entity, self.locate(entity)[0].components - {component})
+
+    def destroy(self, entity: int) -> None:
+        """Mark an entity for removal at the next flush()."""
+        self._pending.append(entity)
+
+    def destroy_many(self, entities: Iterable[int]) -> None:
+        """Mark several entities for removal at the next flush()."""
+        self._pending.extend(int(entity) for entity in entities)
+
+    def destroy_rows(self, arch: Archetype, rows: np.ndarray) -> None:
+        """Mark the entities in some rows of an archetype for removal at the next flush()."""
+        self._pending.extend(arch.entity[rows].tolist())
+
+    def _remove_rows(self, arch: Archetype, mask: np.ndarray) -> None:
+        """Remove rows now and fix the rows of the entities that moved."""
+        first = arch.remove(mask)
+        if first < arch.count:
+            self._row_of[arch.entity[first:arch.count] & self.INDEX_MASK] = np.arange(first, arch.count)
+
+    def flush(self) -> int:
+        """
+        Remove all entities marked by destroy().
+
+        Returns:
+            Number of removed entities
+        """
+        if not self._pending:
+            return 0
+        ids = np.unique(np.asarray(self._pending, dtype=np.int64))
+        self._pending.clear()
+        ids = ids[ids >= 0]
+        slots = ids & self.INDEX_MASK
+        # Skip ids that are already gone or stale
+        valid = slots < self._next_id
+        slots = slots[valid]
+        valid = ((self._archetype_of[slots] >= 0)
+                 & (self._generation[slots] == ids[valid] >> self.INDEX_BITS))
+        slots = slots[valid]
+        if not len(slots):
+            return 0
+        arch_of = self._archetype_of[slots]
+        for index in np.unique(arch_of).tolist():
+            arch = self.archetypes[index]
+            mask = np.zeros(arch.count, dtype=np.bool_)
+            mask[self._row_of[slots[arch_of == index]]] = True
+            self._remove_rows(arch, mask)
+        self._archetype_of[slots] = -1
+        self._generation[slots] = (self._generation[slots] + 1) & self.GENERATION_MASK
+        self._free_ids.extend(slots.tolist())
+        self.alive -= len(slots)
+        return len(slots)
+
+    def clear(self) -> None:
+        """Remove all entities (archetypes and sprites are kept)."""
+        for arch in self.archetypes:
+            arch.count = 0
+        self._archetype_of[:] = -1
+        # Ids handed out before clear() must not match the slots' next users
+        self._generation[:self._next_id] = (self._generation[:self._next_id] + 1) & self.GENERATION_MASK
+        self._next_id = 0
+        self._free_ids.clear()
+        self._pending.clear()
+        self.alive = 0
+
+    def __len__(self) -> int:
+        """Get the number of live entities (including ones pending destruction)."""
+        return self.alive
+
+    def __repr__(self) -> str:
+        """
+        String representation for debugging.
+
+        Returns:
+            String showing entity and archetype counts
+        """
+        return f"World(entities={self.alive}, archetypes={len(self.archetypes)}, pending={len(self._pending)})"
@@ -0,0 +1,488 @@
+"""
+Systems operating on a World (see src.core.ecs).
+
+Each system handles every entity with the components it needs in bulk:
+one set of NumPy operations per archetype instead of one method call per
+object. A tick runs them in a fixed order, e.g.:
+
+    AISystem -> MovementSystem -> AnimationSystem -> CollisionSystem
+    -> DamageSystem -> CleanupSystem
+
+RenderSystem only reads the world and is called from the draw code.
+"""
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pygame
+
+from src.core.ecs import (AI, HEALTH, HITBOX, LIFETIME, PLAYER_TEAM, POSITION,
+                          PROJECTILE, SPRITE, VELOCITY, World)
+from src.managers.resource_manager import resource_manager
+from src.utils.profiler import profiler
+from src.utils.spatial_hash import SpatialHashGrid
+
+# AI kinds (ai_kind field of AI)
+AI_IDLE = 0  # Keeps its velocity
+AI_CHASE = 1  # Walks straight towards AISystem.target at `speed`
+
+
+class AISystem:
+    """
+    Steers entities with an AI component.
+
+    Chasing entities get a velocity of `speed` pixels per tick towards the
+    target and face the way they walk, like Enemy.update without a flow
+    field. An entity standing exactly on the target does not move.
+
+    Attributes:
+        target (Tuple[float, float]): Position chasers walk towards (e.g. the player)
+    """
+
+    name = "ai"
+
+    def __init__(self, target: Tuple[float, float] = (0.0, 0.0)) -> None:
+        self.target = target
+
+    def run(self, world: World) -> None:
+        """Set the velocity of every chasing entity."""
+        tx, ty = self.target
+        for arch in world.query(POSITION, VELOCITY, AI):
+            if not arch.count:
+                continue
+            chasing = arch.column('ai_kind') == AI_CHASE
+            dx = tx - arch.column('x')
+            dy = ty - arch.column('y')
+            dist = np.hypot(dx, dy)
+            moving = chasing & (dist > 0)
+            scale = np.divide(arch.column('speed'), dist, out=np.zeros_like(dist), where=moving)
+            vx = arch.column('vx')
+            vy = arch.column('vy')
+            vx[chasing] = (dx * scale)[chasing]
+            vy[chasing] = (dy * scale)[chasing]
+            if arch.has(SPRITE):
+                # Enemy.update's rule: the sheets face left, so walking right
+                # draws them flipped (facing_left is the flip flag; mirrored
+                # sheets are registered pre-flipped by spawn_enemy)
+                facing_left = arch.column('facing_left')
+                facing_left[moving & (dx > 0)] = True
+                facing_left[moving & (dx < 0)] = False
+
+    def __repr__(self) -> str:
+        return f"AISystem(target={self.target})"
+
+
+class MovementSystem:
+    """Moves every entity with a velocity by one tick."""
+
+    name = "movement"
+
+    def run(self, world: World) -> None:
+        """Add the velocity to the position of every moving entity."""
+        for arch in world.query(POSITION, VELOCITY):
+            if arch.count:
+                x = arch.column('x')
+                x += arch.column('vx')
+                y = arch.column('y')
+                y += arch.column('vy')
+
+    def __repr__(self) -> str:
+        return "MovementSystem()"
+
+
+class AnimationSystem:
+    """Advances sprite animations (frame_speed ticks per frame, 0 = static)."""
+
+    name = "animation"
+
+    def run(self, world: World) -> None:
+        """Step the animation timers and frames of all animated sprites."""
+        for arch in world.query(SPRITE):
+            if not arch.count:
+                continue
+            speed = arch.column('frame_speed')
+            animated = speed > 0
+            if not animated.any():
+                continue
+            timer = arch.column('frame_timer')
+            timer[animated] += 1
+            step = animated & (timer >= speed)
+            if step.any():
+                timer[step] = 0
+                frame = arch.column('frame')
+                frame[step] = (frame[step] + 1) % arch.column('frame_count')[step]
+
+    def __repr__(self) -> str:
+        return "AnimationSystem()"
+
+
+class Hits:
+    """
+    Attacker/target pairs found by a CollisionSystem.
+
+    Archetype indices and rows are valid until the world's next structural
+    change (destroyed entities stay in place until flush()).
+
+    Attributes:
+        attacker (np.ndarray): Attacker entity ids, ascending in attacker order
+        target (np.ndarray): Target entity id of each pair
+        attacker_arch (np.ndarray): Archetype index of each attacker
+        attacker_row (np.ndarray): Row of each attacker
+        target_arch (np.ndarray): Archetype index of each target
+        target_row (np.ndarray): Row of each target
+    """
+
+    def __init__(self, attacker=None, target=None, attacker_arch=None, attacker_row=None,
+                 target_arch=None, target_row=None) -> None:
+        empty = np.empty(0, dtype=np.int64)
+        self.attacker = empty if attacker is None else attacker
+        self.target = empty if target is None else target
+        self.attacker_arch = empty if attacker_arch is None else attacker_arch
+        self.attacker_row = empty if attacker_row is None else attacker_row
+        self.target_arch = empty if target_arch is None else target_arch
+        self.target_row = empty if target_row is None else target_row
+
+    def __len__(self) -> int:
+        """Get the number of pairs."""
+        return len(self.attacker)
+
+    def __repr__(self) -> str:
+        return f"Hits(pairs={len(self.attacker)})"
+
+
+def _gather(world: World, archetypes) -> Optional[Tuple[np.ndarray, ...]]:
+    """Concatenate hitbox centers, radii, entity ids, archetype indices and rows."""
+    archetypes = [arch for arch in archetypes if arch.count]
+    if not archetypes:
+        return None
+    cx = np.concatenate([arch.column('x') + arch.column('hit_offset') for arch in archetypes])
+    cy = np.concatenate([arch.column('y') + arch.column('hit_offset') for arch in archetypes])
+    r = np.concatenate([arch.column('radius') for arch in archetypes])
+    entity = np.concatenate([arch.entities() for arch in archetypes])
+    arch_index = np.concatenate([np.full(arch.count, arch.index, dtype=np.int64) for arch in archetypes])
+    row = np.concatenate([np.arange(arch.count, dtype=np.int64) for arch in archetypes])
+    return cx, cy, r, entity, arch_index, row
+
+
+class CollisionSystem:
+    """
+    Finds attackers overlapping targets (circle hitboxes, as HitBox.collide).
+
+    Targets are binned into a SpatialHashGrid and every attacker is only
+    tested against the targets in the cells around it. With first_only, each attacker hits only the first
+    target (in target order) it overlaps, the way Simulation resolves
+    player bullets; otherwise every overlapping pair is a hit (contact
+    damage).
+
+    Attributes:
+        attackers (Tuple[str, ...]): Components attackers must have
+        targets (Tuple[str, ...]): Components targets must have
+        exclude_attackers (Tuple[str, ...]): Components attackers must not have
+        exclude_targets (Tuple[str, ...]): Components targets must not have
+        first_only (bool): Keep only the first target of each attacker
+        grid (SpatialHashGrid): Broad phase over the targets, rebuilt every run()
+        hits (Hits): Pairs found by the last run()
+        candidate_pairs (int): Pairs tested by the last run()
+    """
+
+    name = "collision"
+
+    def __init__(self, attackers: Sequence[str], targets: Sequence[str], first_only: bool = True,
+                 exclude_attackers: Iterable[str] = (), exclude_targets: Iterable[str] = ()) -> None:
+        """
+        Initialize the system.
+
+        Args:
+            attackers: Components attackers must have (POSITION and HITBOX are implied)
+            targets: Components targets must have (POSITION and HITBOX are implied)
+            first_only: Each attacker hits at most one target
+            exclude_attackers: Components attackers must not have
+            exclude_targets: Components targets must not have
+        """
+        self.attackers = tuple(attackers) + (POSITION, HITBOX)
+        self.targets = tuple(targets) + (POSITION, HITBOX)
+        self.exclude_attackers = tuple(exclude_attackers)
+        self.exclude_targets = tuple(exclude_targets)
+        self.first_only = first_only
+        self.grid = SpatialHashGrid(min_cell_size=1.0)
+        self.hits = Hits()
+        self.candidate_pairs = 0
+
+    def run(self, world: World) -> Hits:
+        """
+        Find the hits of this tick.
+
+        Args:
+            world: World to search
+
+        Returns:
+            The found Hits (also stored in self.hits)
+        """
+        self.hits = Hits()
+        self.candidate_pairs = 0
+        attackers = _gather(world, world.query(*self.attackers, exclude=self.exclude_attackers))
+        targets = _gather(world, world.query(*self.targets, exclude=self.exclude_targets))
+        if attackers is None or targets is None:
+            return self.hits
+        ax, ay, ar, a_entity, a_arch, a_row = attackers
+        tx, ty, tr, t_entity, t_arch, t_row = targets
+
+        # Overlapping circles are never more than one cell apart; pairs come
+        # back in attacker order, then target order
+        self.grid.build(tx, ty, tr, cell_size=float(ar.max() + tr.max()))
+        first, second = self.grid.query_pairs(ax, ay, ar)
+        self.candidate_pairs = self.grid.candidate_pairs_tested
+        if not len(first):
+            return self.hits
+
+        if self.first_only:
+            keep = np.ones(len(first), dtype=np.bool_)
+            keep[1:] = first[1:] != first[:-1]
+            first = first[keep]
+            second = second[keep]
+
+        self.hits = Hits(a_entity[first], t_entity[second], a_arch[first], a_row[first],
+                         t_arch[second], t_row[second])
+        return self.hits
+
+    def __repr__(self) -> str:
+        return (f"CollisionSystem(attackers={list(self.attackers)}, targets={list(self.targets)}, "
+                f"hits={len(self.hits)})")
+
+
+class DamageSystem:
+    """
+    Applies the hits of a CollisionSystem.
+
+    Every hit subtracts the attacker's damage from the target's hp (all
+    hits of a tick count, also several on one target). Attackers are
+    destroyed when consume_attackers is set (projectiles are spent).
+
+    Attributes:
+        collisions (CollisionSystem): System whose hits are applied
+        consume_attackers (bool): Destroy attackers that hit something
+        killed (np.ndarray): Entities whose hp dropped to 0 or below in the last run()
+    """
+
+    name = "damage"
+
+    def __init__(self, collisions: CollisionSystem, consume_attackers: bool = True) -> None:
+        """
+        Initialize the system.
+
+        Args:
+            collisions: CollisionSystem to take hits from (attackers need
+                        DAMAGE, targets need HEALTH)
+            consume_attackers: Destroy attackers that hit something
+        """
+        self.collisions = collisions
+        self.consume_attackers = consume_attackers
+        self.killed = np.empty(0, dtype=np.int64)
+
+    def run(self, world: World) -> np.ndarray:
+        """
+        Apply damage of the last collision run.
+
+        Args:
+            world: World the hits were found in
+
+        Returns:
+            Entity ids of the targets killed by this run (also in self.killed)
+        """
+        hits = self.collisions.hits
+        self.killed = np.empty(0, dtype=np.int64)
+        if not len(hits):
+            return self.killed
+
+        damage = np.empty(len(hits), dtype=np.int64)
+        for index in np.unique(hits.attacker_arch).tolist():
+            arch = world.archetypes[index]
+            mask = hits.attacker_arch == index
+            rows = hits.attacker_row[mask]
+            damage[mask] = arch.column('damage')[rows]
+            if self.consume_attackers:
+                world.destroy_rows(arch, np.unique(rows))
+
+        killed = []
+        for index in np.unique(hits.target_arch).tolist():
+            arch = world.archetypes[index]
+            mask = hits.target_arch == index
+            rows = hits.target_row[mask]
+            hp = arch.column('hp')
+            hit_rows = np.unique(rows)
+            alive_before = hp[hit_rows] > 0
+            np.subtract.at(hp, rows, damage[mask])
+            dead = hit_rows[alive_before & (hp[hit_rows] <= 0)]
+            if len(dead):
+                killed.append(arch.entities()[dead])
+        if killed:
+            self.killed = np.concatenate(killed)
+        return self.killed
+
+    def __repr__(self) -> str:
+        return f"DamageSystem(killed={len(self.killed)})"
+
+
+class CleanupSystem:
+    """
+    Destroys finished entities and flushes the world.
+
+    Removes entities whose lifetime ran out, entities whose hp dropped to
+    0 (except the player team, whose death ends the game instead) and, if
+    bounds are given, projectiles whose center left them.
+
+    Attributes:
+        bounds (Optional[Tuple[float, float, float, float]]): (x, y, width, height) projectiles must stay in
+        removed (int): Entities removed by the last run()
+    """
+
+    name = "cleanup"
+
+    def __init__(self, bounds: Optional[Tuple[float, float, float, float]] = None) -> None:
+        self.bounds = bounds
+        self.removed = 0
+
+    def run(self, world: World) -> int:
+        """
+        Remove finished entities.
+
+        Args:
+            world: World to clean up
+
+        Returns:
+            Number of removed entities
+        """
+        for arch in world.query(LIFETIME):
+            if arch.count:
+                ttl = arch.column('ttl')
+                ttl -= 1
+                expired = np.flatnonzero(ttl <= 0)
+                if len(expired):
+                    world.destroy_rows(arch, expired)
+
+        for arch in world.query(HEALTH, exclude=(PLAYER_TEAM,)):
+            if arch.count:
+                dead = np.flatnonzero(arch.column('hp') <= 0)
+                if len(dead):
+                    world.destroy_rows(arch, dead)
+
+        if self.bounds is not None:
+            bx, by, bw, bh = self.bounds
+            for arch in world.query(POSITION, PROJECTILE):
+                if arch.count:
+                    x = arch.column('x')
+                    y = arch.column('y')
+                    outside = np.flatnonzero((x < bx) | (x > bx + bw) | (y < by) | (y > by + bh))
+                    if len(outside):
+                        world.destroy_rows(arch, outside)
+
+        self.removed = world.flush()
+        return self.removed
+
+    def __repr__(self) -> str:
+        return f"CleanupSystem(bounds={self.bounds}, removed={self.removed})"
+
+
+class RenderSystem:
+    """
+    Draws every entity with a position and a sprite.
+
+    Frames are centered on (x + draw_dx, y + draw_dy), flipped when
+    facing_left and rotated by `rotation` degrees (quantized to
+    ResourceManager's rotation buckets). All sprites of a frame go to the
+    screen in one Surface.blits call; entities without frames
+    (sprite_id -1) are drawn as circles.
+    """
+
+    name = "render"
+
+    FALLBACK_COLOR = (255, 50, 50)
+    FALLBACK_RADIUS = 8
+
+    def draw(self, world: World, screen: pygame.Surface, doreturn: bool = False,
+             alpha: float = 1.0) -> Optional[List[pygame.Rect]]:
+        """
+        Draw all sprites.
+
+        Args:
+            world: World to draw
+            screen: Pygame surface to draw on
+            doreturn: Return the screen areas drawn to (for dirty-rect rendering)
+            alpha: Interpolation between the previous (0.0) and current (1.0)
+                   tick; moving entities are drawn one velocity step back
+                   scaled by 1 - alpha
+
+        Returns:
+            List of drawn Rects if doreturn is set, None otherwise
+        """
+        world.sprites.sync_rotation_buckets()
+        buckets = resource_manager.rotation_buckets
+        image = world.sprites.image
+        batch = []
+        drawn = []
+        for arch in world.query(POSITION, SPRITE):
+            n = arch.count
+            if not n:
+                continue
+            x = arch.column('x') + arch.column('draw_dx')
+            y = arch.column('y') + arch.column('draw_dy')
+            if alpha < 1.0 and arch.has(VELOCITY):
+                back = 1.0 - alpha
+                x = x - arch.column('vx') * back
+                y = y - arch.column('vy') * back
+            xs = x.astype(np.int64).tolist()
+            ys = y.astype(np.int64).tolist()
+            sprite_ids = arch.column('sprite_id').tolist()
+            frames = arch.column('frame').tolist()
+            rotations = (np.rint(arch.column('rotation') * buckets / 360.0).astype(np.int64) % buckets).tolist()
+            flipped = arch.column('facing_left').tolist()
+            radii = arch.column('radius').astype(np.int64).tolist() if arch.has(HITBOX) else None
+            for i in range(n):
+                sid = sprite_ids[i]
+                if sid < 0:
+                    radius = radii[i] if radii is not None else self.FALLBACK_RADIUS
+                    drawn.append(pygame.draw.circle(screen, self.FALLBACK_COLOR, (xs[i], ys[i]), radius))
+                    continue
+                surface, half_w, half_h = image(sid, frames[i], rotations[i], flipped[i])
+                batch.append((surface, (xs[i] - half_w, ys[i] - half_h)))
+        if not doreturn:
+            if batch:
+                screen.blits(batch, doreturn=False)
+            return None
+        if batch:
+            drawn.extend(screen.blits(batch))
+        return drawn
+
+    def __repr__(self) -> str:
+        return "RenderSystem()"
+
+
+class SystemSchedule:
+    """
+    Systems run in a fixed order once per tick.
+
+    Each system is timed in its own profiler section ("ecs_<name>").
+
+    Example:
+        >>> ai = AISystem()
+        >>> hits = CollisionSystem(attackers=(PROJECTILE, PLAYER_TEAM), targets=(HEALTH, ENEMY_TEAM))
+        >>> schedule = SystemSchedule([ai, MovementSystem(), AnimationSystem(), hits,
+        ...                            DamageSystem(hits), CleanupSystem((0, 0, 1920, 1080))])
+        >>> ai.target = (player.x, player.y)
+        >>> schedule.run(world)
+    """
+
+    def __init__(self, systems: Sequence) -> None:
+        """
+        Args:
+            systems: Objects with a name and a run(world) method, in tick order
+        """
+        self.systems = list(systems)
+
+    def run(self, world: World) -> None:
+        """Run every system once."""
+        for system in self.systems:
+            with profiler.section(f"ecs_{system.name}"):
+                system.run(world)
+
+    def __repr__(self) -> str:
+        return f"SystemSchedule({[system.name for system in self.systems]})"
@@ -0,0 +1,96 @@
+"""
+Fixed-timestep accumulator for the game loop.
+
+Movement speeds, cooldowns and power-up timers are counted in simulation
+ticks, so the simulation must advance a fixed number of ticks per second
+no matter how fast frames are drawn. The loop adds each frame's real
+duration to an accumulator, runs as many whole ticks as fit, and renders
+with the leftover fraction (alpha) as interpolation factor between the
+previous and the current tick.
+"""
+from src.core.constants import FPS
+
+
+class FixedTimestep:
+    """
+    Converts elapsed real time into a whole number of simulation ticks.
+
+    Attributes:
+        tick_rate (float): Simulation ticks per second
+        dt (float): Seconds per tick
+        max_ticks_per_frame (int): Most ticks run for one frame; time beyond
+                                   that is dropped so a long stall (loading,
+                                   window drag) does not snowball
+        accumulator (float): Real time not simulated yet, in seconds
+        ticks (int): Total ticks handed out
+
+    Example:
+        >>> timestep = FixedTimestep(60)
+        >>> for _ in range(timestep.advance(clock.tick(144) / 1000.0)):
+        ...     sim.step(inputs)
+        >>> sim.render(screen, alpha=timestep.alpha)
+    """
+
+    DEFAULT_MAX_TICKS_PER_FRAME = 5
+
+    def __init__(self, tick_rate: float = FPS,
+                 max_ticks_per_frame: int = DEFAULT_MAX_TICKS_PER_FRAME) -> None:
+        """
+        Initialize the accumulator.
+
+        Args:
+            tick_rate: Simulation ticks per second
+            max_ticks_per_frame: Upper limit of ticks per advance() call
+
+        Raises:
+            ValueError: If tick_rate or max_ticks_per_frame is not positive
+        """
+        if tick_rate <= 0:
+            raise ValueError(f"Tick rate must be positive, got {tick_rate}")
+        if max_ticks_per_frame < 1:
+            raise ValueError(f"max_ticks_per_frame must be at least 1, got {max_ticks_per_frame}")
+        self.tick_rate = tick_rate
+        self.dt = 1.0 / tick_rate
+        self.max_ticks_per_frame = max_ticks_per_frame
+        self.accumulator = 0.0
+        self.ticks = 0
+
+    def advance(self, elapsed: float) -> int:
+        """
+        Add a frame's duration and get the number of ticks to simulate.
+
+        Args:
+            elapsed: Real time since the previous frame, in seconds
+
+        Returns:
+            Number of ticks to run this frame (0 when rendering faster than
+            the tick rate)
+        """
+        self.accumulator += max(0.0, elapsed)
+        # Small tolerance so e.g. 1/60 s of frame time always yields one tick
+        ticks = int(self.accumulator / self.dt + 1e-6)
+        if ticks > self.max_ticks_per_frame:
+            ticks = self.max_ticks_per_frame
+            self.accumulator = ticks * self.dt
+        self.accumulator = max(0.0, self.accumulator - ticks * self.dt)
+        self.ticks += ticks
+        return ticks
+
+    @property
+    def alpha(self) -> float:
+        """Interpolation factor between the previous and the current tick (0.0 - 1.0)."""
+        return min(self.accumulator / self.dt, 1.0)
+
+    def reset(self) -> None:
+        """Drop accumulated time (after blocking screens such as the map)."""
+        self.accumulator = 0.0
+
+    def __repr__(self) -> str:
+        """
+        String representation for debugging.
+
+        Returns:
+            String showing tick rate, ticks run and accumulated time
+        """
+        return (f"FixedTimestep(tick_rate={self.tick_rate}, ticks={self.ticks}, "
+                f"accumulator={self.accumulator * 1000:.1f}ms)")
@@ -2,21 +2,58 @@
 Game state initialization and management.
 """
 from src.entities.player import Player
+from src.entities.bullet import Bullet
+from src.entities.enemy_bullet import EnemyBullet
 from src.managers.enemy_spawner import EnemySpawner
+from src.managers.resource_manager import resource_manager
 from src.managers.room_manager import RoomManager
 from src.managers.final_room_manager import FinalRoomManager
+from src.managers.powerup_manager import PowerUpManager
+from src.managers.enemy_bullet_manager import EnemyBulletManager
+from src.managers.powerup_pickup_manager import PowerUpPickupManager
 from src.ui.hud import HeartsHUD
+from src.ui.boss_bar import BossBarManager
+from src.ui.text_cache import get_font
+from src.utils.particles import ParticleEngine
 from src.core.constants import URANEK_FRAME_WIDTH, FPS
+from src.core.ecs import World
+from src.core.rng import rng, VISUAL
 
 
 class GameState:
-    """Manages all game state variables."""
-    
-    def __init__(self, screen_width, screen_height, bg_manager):
+    """
+    Holds everything that makes up a run: rooms, player, enemies, bullets,
+    power-ups and level progression.
+
+    Attributes:
+        screen_width (int): Width of the play area in pixels
+        screen_height (int): Height of the play area in pixels
+        bg_manager: RoomBackgroundManager choosing room backgrounds (optional)
+        font (pygame.font.Font): Font used for notifications
+        particles (ParticleEngine): Engine holding this run's blood particles
+        world (World): ECS world holding the player's bullets
+        flow_field (FlowField): Enemy pathfinding field of the current room
+                                (None until the first step in a room)
+    """
+
+    def __init__(self, screen_width, screen_height, bg_manager=None, font=None):
+        """
+        Initialize an empty game state (call start_new_game() to begin a run).
+
+        Args:
+            screen_width: Width of the play area in pixels
+            screen_height: Height of the play area in pixels
+            bg_manager: RoomBackgroundManager for room backgrounds (None = no backgrounds)
+            font: Notification font (default: Calibri 30)
+        """
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.bg_manager = bg_manager
-        
+        self.font = font if font is not None else get_font("Calibri.ttf", 30)
+        # Backgrounds are purely visual, so they get their own stream and
+        # never shift the gameplay random sequence
+        self.visual_rng = rng.stream(VISUAL)
+
         # Core game objects
         self.room_manager = None
         self.player = None
@@ -24,123 +61,105 @@ class GameState:
         self.level = 1
         self.enemy_spawner = None
         self.notifications = []
-        self.bullets = []
-        self.enemy_bullets = []
-        self.hud = None
+        self.world = World()
+        self.bullets_cooldown = 0
         self.blood_systems = []
-        
+        self.particles = ParticleEngine()
+        self.flow_field = None
+        self.hud = None
+
         # Game progression
         self.visited_rooms = {0}
         self.cleared_rooms = set()
         self.boss_killed = False
+        self.room_cleared = False
         self.current_level = 1
-        
-        # Cooldowns
-        self.bullets_cooldown = 0
-        self.damage_cooldown = 0
-        
-        # Power-up state
-        self.shoe_item = None
-        self.speed_boost_timer = 0
-        self.speed_boost_charges = 0
-        self.shield_timer = 0
-        self.shield_charges = 0
-        self.strength_timer = 0
-        self.strength_charges = 0
-        self._prev_e_pressed = False
-        self._prev_r_pressed = False
-        self._prev_t_pressed = False
-        self.original_movement = None
-        self.original_ad = None
-        
-        # Drop tracking
-        self.current_room_death_counter = 0
-        self.current_room_drop_index = None
-        self.shoe_dropped_this_level = False
-        self.last_powerup_type = None
-        
-        # Boss bar / intro animation
-        self.boss_bar_active = False
-        self.boss_bar_target_enemy = None
-        self.boss_intro_timer = 0
-        self.boss_intro_duration = int(FPS * 1.0)
-        self.boss_intro_progress = 0.0
-        
+
+        # Managers
+        self.powerup_manager = PowerUpManager()
+        self.boss_bar_manager = BossBarManager(screen_width, screen_height)
+        self.enemy_bullet_manager = EnemyBulletManager(screen_width, screen_height, FPS)
+        self.powerup_pickup_manager = PowerUpPickupManager()
+
         # Room background
         self.room_background = None
-    
+
+    def choose_background(self):
+        """Pick a random background for the current level (if backgrounds are used)."""
+        if self.bg_manager is None:
+            self.room_background = None
+        else:
+            self.room_background, _ = self.bg_manager.get_random_background(
+                level=self.current_level, rng=self.visual_rng)
+
     def start_new_game(self, keep_current_level=False):
         """
         Reset all game state to start a fresh run.
-        
+
         Args:
-            keep_current_level: If True, preserve the current_level value (for level transitions)
+            keep_current_level: If True, preserve the current_level value and
+                                power-up charges (for level transitions)
         """
         # Store current level if we need to keep it
         saved_level = self.current_level if keep_current_level else 1
-        
-        # Store power-up charges and type if transitioning between levels
-        saved_speed_charges = self.speed_boost_charges if keep_current_level else 0
-        saved_shield_charges = self.shield_charges if keep_current_level else 0
-        saved_strength_charges = self.strength_charges if keep_current_level else 0
-        saved_powerup_type = self.last_powerup_type if keep_current_level else None
-        
-        # 🎲 Choose random background for the level
-        self.room_background, _ = self.bg_manager.get_random_background(level=saved_level)
-        
-        # Create room manager with corridors
+
+        # Store power-up charges if transitioning between levels
+        if keep_current_level:
+            saved_charges = self.powerup_manager.get_charges()
+            saved_last_powerup = self.powerup_pickup_manager.last_powerup_type
+        else:
+            saved_charges = {'speed': 0, 'shield': 0, 'strength': 0}
+            saved_last_powerup = None
+
+        # Load (and pin) this level's sprites and backgrounds before play starts
+        resource_manager.prefetch_level(saved_level)
+
+        # Choose random background for the level
+        self.current_level = saved_level
+        self.choose_background()
+
+        # Pre-rotate projectile sprites so bullets never rotate during play
+        Bullet.prebake_sprites()
+        EnemyBullet.prebake_sprites(saved_level)
+
+        # Create room manager
         # For level 4 (after 3 bosses), use FinalRoomManager (single room with final boss)
         if saved_level == 4:
             self.room_manager = FinalRoomManager(self.screen_width, self.screen_height, margin_pixels=100)
         else:
             self.room_manager = RoomManager(self.screen_width, self.screen_height, margin_pixels=100)
-        
+
         # Create player in center of game area
         player_start_x = self.room_manager.room_x + self.room_manager.room_width // 2 - URANEK_FRAME_WIDTH // 2
         player_start_y = self.room_manager.room_y + self.room_manager.room_height // 2 - URANEK_FRAME_WIDTH // 2
         self.player = Player(player_start_x, player_start_y)
-        
-        # Initialize all game state variables
+
+        # Initialize game state
         self.enemies = []
         self.level = saved_level
         self.enemy_spawner = EnemySpawner(self.level, self.room_manager)
         self.notifications = []
-        self.bullets = []
-        self.enemy_bullets = []
+        self.world.clear()
         self.bullets_cooldown = 0
-        self.damage_cooldown = 0
         self.blood_systems = []
+        self.particles.clear()
+        self.flow_field = None
         self.visited_rooms = {0}
         self.cleared_rooms = set()
         self.boss_killed = False
-        self.current_level = saved_level
+        self.room_cleared = False
         self.hud = HeartsHUD()
-        
-        # Initialize power-up state
-        self.shoe_item = None
-        self.speed_boost_timer = 0
-        self.speed_boost_charges = saved_speed_charges
-        self.shield_timer = 0
-        self.shield_charges = saved_shield_charges
-        self.strength_timer = 0
-        self.strength_charges = saved_strength_charges
-        self._prev_e_pressed = False
-        self._prev_r_pressed = False
-        self._prev_t_pressed = False
-        self.original_movement = None
-        self.original_ad = None
-        
-        # Reset boss bar/intro
-        self.boss_bar_active = False
-        self.boss_bar_target_enemy = None
-        self.boss_intro_timer = 0
-        self.boss_intro_progress = 0.0
-        
-        # Reset drop tracking
-        self.current_room_death_counter = 0
-        self.shoe_dropped_this_level = False
-        self.last_powerup_type = saved_powerup_type
-        
-        # Initialize spawner for first room
+
+        # Reset managers and restore state
+        self.powerup_manager.reset(keep_charges=False)
+        self.powerup_manager.set_charges(**saved_charges)
+        self.boss_bar_manager.reset()
+        self.enemy_bullet_manager.clear()
+        self.powerup_pickup_manager.reset_for_new_level()
+        self.powerup_pickup_manager.last_powerup_type = saved_last_powerup
+
         self.enemy_spawner.reset_for_new_room()
-        self.current_room_drop_index = None
+
+    def is_final_room(self):
+        """Check whether the run is in the final (level 4) room."""
+        return isinstance(self.room_manager, FinalRoomManager)
@@ -0,0 +1,393 @@
+"""
+Compact binary recording and replay of per-tick player input.
+
+Together with a seeded Simulation (see src.core.rng) the input of every
+tick is all that is needed to reproduce a run exactly, so a recording from
+a play session can be replayed headless, much faster than real time, to
+reproduce bugs and performance problems.
+
+File layout (little endian):
+    header:    magic "URRP", version u8, flags u8 (bit 0: seeded), seed i64,
+               tick rate u16, screen width u16, screen height u16
+    records:   tag u8 followed by
+               RECORD_INPUT:    repeat u16, keys/buttons u16, mouse x i16, mouse y i16
+                                (the same input held for `repeat` ticks)
+               RECORD_NEW_GAME: level u8, keep_current_level u8
+                                (start_new_game() before the next tick)
+
+Held input usually stays the same for many ticks, so a minute of play
+typically takes a few kilobytes.
+
+Replay a recording headless from the project root:
+    python -m src.core.replay session.urr
+"""
+import os
+import struct
+import sys
+import time
+from typing import BinaryIO, Callable, List, Optional, Tuple, Union
+
+import pygame
+
+from src.core.constants import FPS
+from src.core.simulation import (EVENT_GAME_OVER, EVENT_NEXT_LEVEL, EVENT_VICTORY, TRACKED_KEYS,
+                                 InputState, Simulation)
+
+MAGIC = b"URRP"
+VERSION = 1
+
+RECORD_INPUT = 1
+RECORD_NEW_GAME = 2
+
+_HEADER = struct.Struct("<4sBBqHHH")
+_TAG = struct.Struct("<B")
+_INPUT = struct.Struct("<HHhh")
+_NEW_GAME = struct.Struct("<BB")
+
+_MAX_REPEAT = 0xFFFF
+# Mouse buttons are stored above the key bits
+_BUTTON_SHIFT = 8
+
+# (repeat, flags, mouse x, mouse y) or (level, keep_current_level)
+Record = Tuple[int, ...]
+
+
+def pack_input(inputs: InputState) -> Tuple[int, int, int]:
+    """
+    Encode an input state.
+
+    Args:
+        inputs: Input of one tick
+
+    Returns:
+        (flags, mouse x, mouse y); flags holds one bit per TRACKED_KEYS
+        entry and the three mouse buttons from bit 8 on
+    """
+    flags = 0
+    keys = inputs.keys
+    for bit, key in enumerate(TRACKED_KEYS):
+        if keys[key]:
+            flags |= 1 << bit
+    for bit, pressed in enumerate(inputs.mouse_buttons):
+        if pressed:
+            flags |= 1 << (_BUTTON_SHIFT + bit)
+    mx, my = inputs.mouse_pos
+    return flags, max(-32768, min(mx, 32767)), max(-32768, min(my, 32767))
+
+
+def unpack_input(flags: int, mouse_x: int, mouse_y: int) -> InputState:
+    """
+    Decode an input state written by pack_input().
+
+    Args:
+        flags: Key and mouse button bits
+        mouse_x: Mouse X position
+        mouse_y: Mouse Y position
+
+    Returns:
+        Equivalent InputState
+    """
+    keys = [key for bit, key in enumerate(TRACKED_KEYS) if flags & (1 << bit)]
+    buttons = tuple(bool(flags & (1 << (_BUTTON_SHIFT + bit))) for bit in range(3))
+    return InputState(keys, (mouse_x, mouse_y), buttons)
+
+
+class ReplayRecorder:
+    """
+    Writes per-tick input to a replay file.
+
+    Example:
+        >>> with ReplayRecorder("session.urr", seed, 1920, 1080) as recorder:
+        ...     recorder.record_new_game(1, False)
+        ...     for tick_input in inputs:
+        ...         recorder.record_tick(tick_input)
+    """
+
+    def __init__(self, path: str, seed: Optional[int], screen_width: int, screen_height: int,
+                 tick_rate: int = FPS) -> None:
+        """
+        Create the file and write the header.
+
+        Args:
+            path: Output file path
+            seed: Seed the Simulation was created with (None = unseeded, which
+                  makes the recording non-reproducible)
+            screen_width: Play area width in pixels
+            screen_height: Play area height in pixels
+            tick_rate: Simulation ticks per second
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.ticks = 0
+        self._file: Optional[BinaryIO] = open(path, "wb")
+        self._file.write(_HEADER.pack(MAGIC, VERSION, 0 if seed is None else 1, seed or 0,
+                                      tick_rate, screen_width, screen_height))
+        self._run: Optional[Tuple[int, int, int]] = None
+        self._run_length = 0
+
+    def record_tick(self, inputs: InputState) -> None:
+        """
+        Record the input of one tick.
+
+        Args:
+            inputs: Input passed to Simulation.step()
+        """
+        packed = pack_input(inputs)
+        if packed == self._run and self._run_length < _MAX_REPEAT:
+            self._run_length += 1
+        else:
+            self._flush_run()
+            self._run = packed
+            self._run_length = 1
+        self.ticks += 1
+
+    def record_new_game(self, level: int, keep_current_level: bool) -> None:
+        """
+        Record a start_new_game() call (new run, restart or next level).
+
+        Args:
+            level: current_level when start_new_game() was called
+            keep_current_level: Argument passed to start_new_game()
+        """
+        self._flush_run()
+        self._file.write(_TAG.pack(RECORD_NEW_GAME) + _NEW_GAME.pack(level, int(keep_current_level)))
+
+    def _flush_run(self) -> None:
+        """Write the pending run of identical inputs."""
+        if self._run_length:
+            self._file.write(_TAG.pack(RECORD_INPUT) + _INPUT.pack(self._run_length, *self._run))
+        self._run = None
+        self._run_length = 0
+
+    def close(self) -> None:
+        """Write pending input and close the file."""
+        if self._file is not None:
+            self._flush_run()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> 'ReplayRecorder':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        """
+        String representation for debugging.
+
+        Returns:
+            String showing the path and recorded ticks
+        """
+        return f"ReplayRecorder(path={self.path!r}, ticks={self.ticks})"
+
+
+class Replay:
+    """
+    A loaded recording.
+
+    Attributes:
+        seed (Optional[int]): Seed of the recorded run
+        tick_rate (int): Simulation ticks per second
+        screen_width (int): Play area width in pixels
+        screen_height (int): Play area height in pixels
+        records (List[Tuple[int, Record]]): (tag, record) in file order
+        ticks (int): Number of recorded ticks
+    """
+
+    def __init__(self, seed: Optional[int], tick_rate: int, screen_width: int,
+                 screen_height: int, records: List[Tuple[int, Record]]) -> None:
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.records = records
+        self.ticks = sum(record[0] for tag, record in records if tag == RECORD_INPUT)
+
+    @classmethod
+    def load(cls, path: str) -> 'Replay':
+        """
+        Read a replay file.
+
+        Args:
+            path: File written by ReplayRecorder
+
+        Returns:
+            Loaded Replay
+
+        Raises:
+            ValueError: If the file is not a replay or uses another version
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < _HEADER.size:
+            raise ValueError(f"{path} is too short to be a replay")
+        magic, version, flags, seed, tick_rate, width, height = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a replay file")
+        if version != VERSION:
+            raise ValueError(f"{path} has replay version {version}, expected {VERSION}")
+
+        records: List[Tuple[int, Record]] = []
+        offset = _HEADER.size
+        while offset < len(data):
+            tag = data[offset]
+            offset += 1
+            body = _INPUT if tag == RECORD_INPUT else _NEW_GAME if tag == RECORD_NEW_GAME else None
+            if body is None or offset + body.size > len(data):
+                # Truncated (e.g. the game crashed while writing): keep what is complete
+                break
+            records.append((tag, body.unpack_from(data, offset)))
+            offset += body.size
+        return cls(seed if flags & 1 else None, tick_rate, width, height, records)
+
+    def __repr__(self) -> str:
+        """
+        String representation for debugging.
+
+        Returns:
+            String showing seed, tick count and screen size
+        """
+        return (f"Replay(seed={self.seed}, ticks={self.ticks}, "
+                f"screen={self.screen_width}x{self.screen_height})")
+
+
+class ReplayPlayer:
+    """
+    Hands out the recorded input tick by tick.
+
+    Example:
+        >>> player = ReplayPlayer(Replay.load("session.urr"))
+        >>> while (inputs := player.next_input(start_game)) is not None:
+        ...     sim.step(inputs)
+    """
+
+    def __init__(self, replay: Replay) -> None:
+        """
+        Start at the beginning of a recording.
+
+        Args:
+            replay: Loaded recording
+        """
+        self.replay = replay
+        self.tick = 0
+        self._index = 0
+        self._remaining = 0
+        self._current: Optional[InputState] = None
+
+    @property
+    def finished(self) -> bool:
+        """True once every recorded tick has been handed out."""
+        return self._remaining == 0 and self._index >= len(self.replay.records)
+
+    def apply_new_games(self, on_new_game: Callable[[int, bool], None]) -> None:
+        """
+        Apply start_new_game() records due before the next tick.
+
+        Args:
+            on_new_game: Called with (level, keep_current_level) per record
+        """
+        records = self.replay.records
+        while self._remaining == 0 and self._index < len(records) and records[self._index][0] == RECORD_NEW_GAME:
+            level, keep = records[self._index][1]
+            self._index += 1
+            on_new_game(level, bool(keep))
+
+    def next_input(self, on_new_game: Callable[[int, bool], None]) -> Optional[InputState]:
+        """
+        Get the input of the next tick.
+
+        Args:
+            on_new_game: Called with (level, keep_current_level) for each
+                         start_new_game() recorded before this tick
+
+        Returns:
+            InputState, or None at the end of the recording
+        """
+        self.apply_new_games(on_new_game)
+        if self._remaining == 0:
+            if self._index >= len(self.replay.records):
+                return None
+            repeat, flags, mouse_x, mouse_y = self.replay.records[self._index][1]
+            self._index += 1
+            self._remaining = repeat
+            self._current = unpack_input(flags, mouse_x, mouse_y)
+        self._remaining -= 1
+        self.tick += 1
+        return self._current
+
+
+def start_game(sim: Simulation, level: int, keep_current_level: bool) -> None:
+    """
+    Start a new game the way the main loop did when recording.
+
+    Args:
+        sim: Simulation to reset
+        level: Recorded current_level
+        keep_current_level: Recorded start_new_game() argument
+    """
+    sim.current_level = level
+    sim.start_new_game(keep_current_level)
+
+
+def run_headless(replay: Union[Replay, str], max_ticks: Optional[int] = None) -> Tuple[Simulation, int]:
+    """
+    Replay a recording without a display, as fast as possible.
+
+    Args:
+        replay: Loaded Replay or path to a replay file
+        max_ticks: Stop after this many ticks (None = whole recording)
+
+    Returns:
+        (final Simulation, number of ticks simulated)
+    """
+    if isinstance(replay, str):
+        replay = Replay.load(replay)
+    sim = Simulation(replay.screen_width, replay.screen_height, seed=replay.seed)
+    player = ReplayPlayer(replay)
+
+    def on_new_game(level, keep_current_level):
+        start_game(sim, level, keep_current_level)
+
+    player.apply_new_games(on_new_game)
+    if sim.player is None:
+        # Recordings always begin with a new game; be lenient with hand-made ones
+        sim.start_new_game()
+    while max_ticks is None or player.tick < max_ticks:
+        inputs = player.next_input(on_new_game)
+        if inputs is None:
+            break
+        events = sim.step(inputs)
+        if EVENT_VICTORY in events:
+            break
+        if (EVENT_GAME_OVER in events or EVENT_NEXT_LEVEL in events) and player.finished:
+            break
+    return sim, player.tick
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Replay a recording headless and print timing and the final state."""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("usage: python -m src.core.replay RECORDING [MAX_TICKS]")
+        return 2
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    replay = Replay.load(argv[0])
+    max_ticks = int(argv[1]) if len(argv) > 1 else None
+    print(replay)
+    start = time.perf_counter()
+    sim, ticks = run_headless(replay, max_ticks)
+    elapsed = time.perf_counter() - start
+    speed = ticks / replay.tick_rate / elapsed if elapsed > 0 else float("inf")
+    print(f"{ticks} ticks in {elapsed:.2f}s ({ticks / max(elapsed, 1e-9):.0f} ticks/s, "
+          f"x{speed:.1f} real time)")
+    print(sim)
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+Seeded random number streams, one per subsystem.
+
+Every subsystem draws from its own named random.Random stream derived
+from the run seed, so one seed reproduces the whole run, and an extra
+random draw in one subsystem (e.g. a new particle effect) does not shift
+the sequence seen by the others (e.g. the room layout).
+
+Streams are created once and reseeded in place, so modules may keep a
+reference to their stream at import time.
+"""
+import hashlib
+import random
+from typing import Dict, Optional
+
+# Stream names
+ROOMS = "rooms"  # Room graph and room enemy types
+SPAWNS = "spawns"  # Enemy spawn positions
+POWERUPS = "powerups"  # Power-up drops
+ENEMIES = "enemies"  # Enemy behaviour
+PARTICLES = "particles"  # Blood particle spread
+VISUAL = "visual"  # Purely cosmetic choices (backgrounds)
+
+
+class RandomStreams:
+    """
+    Named random streams derived from one run seed.
+
+    Attributes:
+        seed (Optional[int]): Run seed (None = unseeded, streams seeded from the OS)
+
+    Example:
+        >>> rng.reseed(42)
+        >>> rng.stream(ROOMS).choice(['top', 'left'])
+        >>> rng.derive_seed(PARTICLES)  # for NumPy generators
+    """
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """
+        Initialize the streams.
+
+        Args:
+            seed: Run seed (None = unseeded)
+        """
+        self.seed = seed
+        self._streams: Dict[str, random.Random] = {}
+
+    def derive_seed(self, name: str) -> Optional[int]:
+        """
+        Get the seed of a named stream.
+
+        Args:
+            name: Stream name
+
+        Returns:
+            64-bit seed derived from the run seed and the name, or None if
+            the run is unseeded
+        """
+        if self.seed is None:
+            return None
+        digest = hashlib.sha256(f"{self.seed}:{name}".encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "little")
+
+    def stream(self, name: str) -> random.Random:
+        """
+        Get (creating if needed) a named stream.
+
+        Args:
+            name: Stream name (see the module constants)
+
+        Returns:
+            The stream's random.Random instance (the same object on every call)
+        """
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = random.Random(self.derive_seed(name))
+            self._streams[name] = stream
+        return stream
+
+    def reseed(self, seed: Optional[int]) -> None:
+        """
+        Set a new run seed and reseed all existing streams in place.
+
+        Args:
+            seed: New run seed (None = unseeded)
+        """
+        self.seed = seed
+        for name, stream in self._streams.items():
+            stream.seed(self.derive_seed(name))
+
+    def __repr__(self) -> str:
+        """
+        String representation for debugging.
+
+        Returns:
+            String showing the seed and stream names
+        """
+        return f"RandomStreams(seed={self.seed}, streams={sorted(self._streams)})"
+
+
+# Global streams shared by all subsystems
+rng = RandomStreams()
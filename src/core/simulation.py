@@ -0,0 +1,516 @@
+"""
+Headless, deterministic game simulation.
+
+The Simulation advances the game one fixed timestep at a time from an
+explicit InputState, without polling events or touching the display, so it
+can be driven by the real game loop, by a test, or by a balancing script
+running thousands of ticks per second (SDL dummy driver or no display mode
+at all). Drawing is a separate render() call that only reads the state and
+can interpolate between the previous and the current tick, so the display
+may run at a different rate than the simulation (see FixedTimestep).
+"""
+from contextlib import contextmanager
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+import pygame
+
+from src.core.constants import FPS
+from src.core.ecs import PLAYER_TEAM
+from src.core.ecs_systems import AnimationSystem, CleanupSystem, MovementSystem, RenderSystem
+from src.core.game_state import GameState
+from src.core.rng import rng, PARTICLES
+from src.entities.bullet import Bullet
+from src.entities.ecs_adapters import PROJECTILE_COMPONENTS, spawn_projectile
+from src.ui.notification import Notification
+from src.ui.text_cache import text_cache
+from src.utils.compact import compact
+from src.utils.particles import BloodParticleSystem
+from src.utils.crowd import CrowdSeparation
+from src.utils.flow_field import FlowField
+from src.utils.profiler import profiler
+from src.utils.spatial_hash import SpatialHashGrid
+
+
+# Events returned by Simulation.step()
+EVENT_ROOM_CHANGED = "room_changed"
+EVENT_NEXT_LEVEL = "next_level"
+EVENT_VICTORY = "victory"
+EVENT_GAME_OVER = "game_over"
+
+# Keys the game reads (movement + power-ups)
+TRACKED_KEYS = (pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d, pygame.K_e, pygame.K_r, pygame.K_t)
+
+
+class KeyState:
+    """
+    Pressed keys, indexable like the result of pygame.key.get_pressed().
+
+    Example:
+        >>> keys = KeyState({pygame.K_w, pygame.K_d})
+        >>> keys[pygame.K_w]
+        True
+    """
+
+    __slots__ = ("_pressed",)
+
+    def __init__(self, pressed: Iterable[int] = ()) -> None:
+        """
+        Initialize the key state.
+
+        Args:
+            pressed: Key codes that are held down
+        """
+        self._pressed = frozenset(pressed)
+
+    def __getitem__(self, key: int) -> bool:
+        """Check whether a key is held down."""
+        return key in self._pressed
+
+    def __iter__(self):
+        """Iterate over the held key codes."""
+        return iter(self._pressed)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, KeyState) and self._pressed == other._pressed
+
+    def __hash__(self) -> int:
+        return hash(self._pressed)
+
+    def __repr__(self) -> str:
+        return f"KeyState({sorted(self._pressed)})"
+
+
+class InputState:
+    """
+    Player input for a single simulation tick.
+
+    Attributes:
+        keys (KeyState): Held keys
+        mouse_pos (Tuple[int, int]): Mouse position in screen coordinates
+        mouse_buttons (Tuple[bool, bool, bool]): Left, middle and right button state
+    """
+
+    __slots__ = ("keys", "mouse_pos", "mouse_buttons")
+
+    def __init__(self, keys: Iterable[int] = (), mouse_pos: Tuple[int, int] = (0, 0),
+                 mouse_buttons: Tuple[bool, bool, bool] = (False, False, False)) -> None:
+        """
+        Initialize the input state.
+
+        Args:
+            keys: Held key codes (or a KeyState)
+            mouse_pos: Mouse position in screen coordinates
+            mouse_buttons: Left, middle and right button state
+        """
+        self.keys = keys if isinstance(keys, KeyState) else KeyState(keys)
+        self.mouse_pos = (int(mouse_pos[0]), int(mouse_pos[1]))
+        self.mouse_buttons = tuple(bool(b) for b in mouse_buttons[:3])
+
+    @classmethod
+    def from_pygame(cls) -> 'InputState':
+        """
+        Sample the current keyboard and mouse state from pygame.
+
+        Returns:
+            InputState with the keys the game reads and the mouse state
+        """
+        pressed = pygame.key.get_pressed()
+        return cls((key for key in TRACKED_KEYS if pressed[key]),
+                   pygame.mouse.get_pos(), pygame.mouse.get_pressed())
+
+    def __repr__(self) -> str:
+        return f"InputState(keys={self.keys!r}, mouse_pos={self.mouse_pos}, mouse_buttons={self.mouse_buttons})"
+
+
+# Input with nothing pressed
+NO_INPUT = InputState()
+
+
+class Simulation(GameState):
+    """
+    Game state that advances in fixed timesteps from explicit inputs.
+
+    step() contains all gameplay logic of the main loop; it never draws,
+    polls events or waits. The same seed and the same input sequence give
+    the same run.
+
+    Level transitions are left to the caller: when step() returns
+    EVENT_NEXT_LEVEL, current_level has already been increased and the
+    caller starts the next level with start_new_game(keep_current_level=True)
+    (the game shows the map screen in between).
+
+    Attributes:
+        DT (float): Simulated seconds per tick
+        seed (Optional[int]): Seed the run was started with
+        tick (int): Ticks simulated since construction
+        crowd (CrowdSeparation): Separation pass for overlapping enemies
+        bullet_grid (SpatialHashGrid): Broad phase over player bullets, rebuilt every tick
+        bullet_systems (tuple): Movement and animation systems run on the world every tick
+        cleanup (CleanupSystem): Removes spent and off-screen bullets at the end of a tick
+        renderer (RenderSystem): Draws the world's bullets
+        previous_positions (dict): Player/enemy -> (x, y) before the last tick
+        powerup_icons (tuple): Shoe, shield and sword icons for the HUD
+
+    Example:
+        >>> sim = Simulation(1920, 1080, seed=42)
+        >>> sim.start_new_game()
+        >>> for _ in range(10_000):
+        ...     events = sim.step(NO_INPUT)
+        ...     if EVENT_GAME_OVER in events:
+        ...         break
+    """
+
+    DT = 1.0 / FPS
+
+    def __init__(self, screen_width, screen_height, seed: Optional[int] = None,
+                 bg_manager=None, font=None) -> None:
+        """
+        Initialize the simulation.
+
+        Args:
+            screen_width: Width of the play area in pixels
+            screen_height: Height of the play area in pixels
+            seed: Seed for all gameplay randomness (None = unseeded)
+            bg_manager: RoomBackgroundManager for room backgrounds (None = no backgrounds)
+            font: Notification font (default: Calibri 30)
+        """
+        if not pygame.font.get_init():
+            pygame.font.init()
+        super().__init__(screen_width, screen_height, bg_manager, font)
+        self.seed = seed
+        self.tick = 0
+        self.powerup_icons = (None, None, None)
+        self.crowd = CrowdSeparation()
+        self.bullet_grid = SpatialHashGrid()
+        self.bullet_systems = (MovementSystem(), AnimationSystem())
+        self.cleanup = CleanupSystem((0, 0, screen_width, screen_height))
+        self.renderer = RenderSystem()
+        self.previous_positions = {}
+        self.reseed(seed)
+
+    def reseed(self, seed: Optional[int]) -> None:
+        """
+        Reseed gameplay randomness (call before start_new_game()).
+
+        Args:
+            seed: New seed (None = unseeded)
+        """
+        self.seed = seed
+        # Rooms, spawns, drops and backgrounds draw from the shared streams
+        rng.reseed(seed)
+        self.particles.reseed(rng.derive_seed(PARTICLES))
+
+    def step(self, inputs: InputState = NO_INPUT) -> List[str]:
+        """
+        Advance the game by one tick.
+
+        Args:
+            inputs: Player input for this tick
+
+        Returns:
+            List of events (EVENT_* constants) that happened during the tick
+        """
+        self.tick += 1
+        events = []
+        player = self.player
+        room_manager = self.room_manager
+        enemies = self.enemies
+        self._remember_positions()
+        notifications = self.notifications
+        powerup_manager = self.powerup_manager
+        enemy_bullet_manager = self.enemy_bullet_manager
+        pickup_manager = self.powerup_pickup_manager
+        font = self.font
+        keys = inputs.keys
+
+        # Check if current room is cleared
+        self.room_cleared = room_manager.current_room_id in self.cleared_rooms
+
+        # Update door animation
+        room_manager.update_door_animation(self.room_cleared)
+
+        # Shooting
+        if inputs.mouse_buttons[0]:
+            mx, my = inputs.mouse_pos
+            if self.bullets_cooldown <= 0:
+                spawn_projectile(self.world, Bullet(player, mx, my, powerup_manager.is_strength_active()))
+                self.bullets_cooldown = FPS / 3
+
+        did_teleport = player.update(keys, room_manager, self.visited_rooms, enemies, self.boss_killed)
+
+        # Handle special corridor (NEXT LEVEL after boss)
+        if did_teleport == "next_level":
+            self.current_level += 1
+            events.append(EVENT_NEXT_LEVEL)
+            return events
+
+        # Handle room transition
+        if did_teleport:
+            self.flow_field = None
+            # Nothing to interpolate across a room change
+            self.previous_positions.clear()
+            self.choose_background()
+            self.visited_rooms.add(room_manager.current_room_id)
+            enemies.clear()
+
+            if room_manager.current_room_id not in self.cleared_rooms:
+                self.enemy_spawner.reset_for_new_room()
+            else:
+                self.enemy_spawner.enemies_spawned_in_room = self.enemy_spawner.max_enemies_for_room
+            pickup_manager.reset_for_new_room()
+
+            notifications.append(Notification(player.x, player.y, f"Room {room_manager.current_room_id}", "cyan", font))
+            events.append(EVENT_ROOM_CHANGED)
+
+        with profiler.section("spawner"):
+            # Spawn enemies only if room is not cleared
+            if room_manager.current_room_id not in self.cleared_rooms:
+                prev_enemies_len = len(enemies)
+                self.enemy_spawner.update(enemies)
+
+                # Detect newly spawned boss
+                for new_enemy in enemies[prev_enemies_len:]:
+                    if getattr(new_enemy, 'is_boss', False):
+                        self.boss_bar_manager.activate(new_enemy, notifications, font, player.x, player.y)
+                        break
+
+            # Check if room is now cleared
+            if (room_manager.current_room_id not in self.cleared_rooms and
+                    self.enemy_spawner.enemies_spawned_in_room >= self.enemy_spawner.max_enemies_for_room and
+                    len(enemies) == 0):
+
+                self.cleared_rooms.add(room_manager.current_room_id)
+
+                if self.current_level == 4 and room_manager.current_room_id == 0:
+                    # Final boss defeated
+                    notifications.append(Notification(player.x, player.y, "FINAL BOSS DEFEATED!", "gold", font))
+                    events.append(EVENT_VICTORY)
+                    return events
+                elif room_manager.current_room_id == 5:
+                    self.boss_killed = True
+                    notifications.append(Notification(player.x, player.y, "NASTĘPNY POZIOM!", "gold", font))
+                else:
+                    notifications.append(Notification(player.x, player.y, "Room Cleared!", "green", font))
+
+        with profiler.section("enemies"):
+            # One distance map per player cell change, shared by all enemies
+            if self.flow_field is None:
+                self.flow_field = FlowField.for_room(room_manager)
+            self.flow_field.update(player.hit_box.x, player.hit_box.y)
+            flow_field = self.flow_field
+
+            # Update enemies
+            for enemy in enemies:
+                enemy.update(player.x, player.y, enemy_bullet_manager.get_bullets(), flow_field)
+
+            # Push overlapping enemies apart (all pairs at once)
+            self.crowd.separate(enemies, room_manager)
+
+            for enemy in enemies:
+                # Contact damage
+                if player.hit_box.collide(enemy.hit_box):
+                    if powerup_manager.is_shield_active():
+                        pass  # no damage while shielded
+                    elif enemy_bullet_manager.get_damage_cooldown() <= 0:
+                        player.hp = max(0, player.hp - enemy.ad)
+                        enemy_bullet_manager.damage_cooldown = int(FPS * 0.75)
+
+        # Update notifications; finished ones are dropped in one pass
+        compact(notifications, Notification.update)
+
+        # Check power-up collection
+        pickup_manager.check_collection(player, powerup_manager, notifications, font)
+
+        with profiler.section("collisions"):
+            # Update bullets
+            world = self.world
+            for system in self.bullet_systems:
+                system.run(world)
+
+            # Check bullet collisions with enemies
+            # Each bullet hits the first enemy (in list order) it overlaps;
+            # the grid is built once so every enemy only tests nearby bullets
+            bullets = world.archetype(PROJECTILE_COMPONENTS + (PLAYER_TEAM,))
+            offset = bullets.column('hit_offset')
+            grid = self.bullet_grid
+            grid.build(bullets.column('x') + offset, bullets.column('y') + offset, bullets.column('radius'))
+            damage = bullets.column('damage')
+            spent = np.zeros(bullets.count, dtype=bool)
+            killed = set()
+            for enemy in enemies:
+                hits = grid.query_hitbox(enemy.hit_box)
+                for i in hits[~spent[hits]]:
+                    spent[i] = True
+                    enemy.hp -= int(damage[i])
+                    if enemy.hp <= 0:
+                        # Create green blood particle explosion
+                        self.blood_systems.append(BloodParticleSystem(enemy.x, enemy.y, num_particles=25,
+                                                                      engine=self.particles))
+                        # Handle potential power-up drop
+                        pickup_manager.handle_enemy_death(enemy)
+                        killed.add(enemy)
+                        player.points += 1
+                        break
+            world.destroy_rows(bullets, np.flatnonzero(spent))
+            if killed:
+                compact(enemies, lambda enemy: enemy not in killed)
+
+        with profiler.section("particles"):
+            # Update blood particles (one step of the shared engine for all systems)
+            self.particles.update()
+            compact(self.blood_systems, BloodParticleSystem.is_alive)
+
+        with profiler.section("enemy_bullets"):
+            # Update enemy bullets
+            enemy_bullet_manager.update(player, powerup_manager)
+
+        self.bullets_cooldown -= 1
+
+        with profiler.section("powerups"):
+            # Handle power-up input and timers
+            powerup_manager.handle_input(keys, player, notifications, font)
+            powerup_manager.update_timers(player, notifications, font)
+
+        # Remove spent and off-screen bullets
+        self.cleanup.run(world)
+
+        # Update boss HP bar
+        self.boss_bar_manager.update(enemies)
+
+        # Check for game over
+        if player.hp <= 0:
+            events.append(EVENT_GAME_OVER)
+
+        return events
+
+    def _remember_positions(self) -> None:
+        """Store player and enemy positions before the tick (for interpolated rendering)."""
+        previous = {enemy: (enemy.x, enemy.y) for enemy in self.enemies}
+        previous[self.player] = (self.player.x, self.player.y)
+        self.previous_positions = previous
+
+    @contextmanager
+    def _interpolated(self, alpha: float):
+        """
+        Temporarily move the player and enemies between their previous and
+        current positions for drawing.
+
+        Args:
+            alpha: 0.0 = previous tick, 1.0 = current tick
+        """
+        moved = []
+        if alpha < 1.0:
+            previous = self.previous_positions
+            for entity in [self.player] + self.enemies:
+                old = previous.get(entity)
+                if old is None:
+                    continue  # Spawned this tick
+                x, y = entity.x, entity.y
+                moved.append((entity, x, y))
+                entity.x = old[0] + (x - old[0]) * alpha
+                entity.y = old[1] + (y - old[1]) * alpha
+        try:
+            yield
+        finally:
+            for entity, x, y in moved:
+                entity.x = x
+                entity.y = y
+
+    def draw_static_layer(self, surface: pygame.Surface) -> None:
+        """
+        Draw the parts of the frame that only change with the room state.
+
+        Args:
+            surface: Surface to draw on (screen or a cached static layer)
+        """
+        with profiler.section("background"):
+            if self.room_background and not self.is_final_room():
+                surface.blit(self.room_background, (0, 0))
+        with profiler.section("room"):
+            self.room_manager.draw(surface, self.boss_killed, self.room_cleared)
+
+    def get_static_key(self):
+        """
+        Get a key describing everything the static layer depends on.
+
+        Returns:
+            Hashable key (changes whenever draw_static_layer() would draw differently)
+        """
+        background_key = id(self.room_background) if not self.is_final_room() else None
+        return background_key, self.room_manager.get_static_key(self.boss_killed, self.room_cleared)
+
+    def render(self, screen: pygame.Surface, dirty_renderer=None, alpha: float = 1.0) -> None:
+        """
+        Draw the current state (does not update the display).
+
+        Args:
+            screen: Surface to draw on
+            dirty_renderer: DirtyRectRenderer to restore the static layer and
+                            collect drawn areas with (None = full redraw)
+            alpha: Interpolation between the previous (0.0) and the current
+                   (1.0) tick for player, enemy and bullet positions
+        """
+        if dirty_renderer is not None:
+            # Restore last frame's dirty areas from the cached background + room layer
+            # (the background/room sections only run when a layer is composited)
+            with profiler.section("restore"):
+                dirty_renderer.begin_frame(self.get_static_key(), self.draw_static_layer)
+            mark = dirty_renderer.mark
+        else:
+            with profiler.section("background"):
+                screen.fill((0, 0, 0))
+            self.draw_static_layer(screen)
+
+            def mark(rects):
+                pass
+        doreturn = dirty_renderer is not None
+        font = self.font
+        width = self.screen_width
+
+        with self._interpolated(alpha):
+            with profiler.section("draw_entities"):
+                for enemy in self.enemies:
+                    mark(enemy.draw(screen))
+
+                for notification in self.notifications:
+                    mark(notification.draw(screen))
+
+                mark(self.powerup_pickup_manager.update_and_draw(screen))
+                mark(self.renderer.draw(self.world, screen, doreturn=doreturn, alpha=alpha))
+            with profiler.section("draw_particles"):
+                mark(self.particles.draw(screen))
+            with profiler.section("draw_enemy_bullets"):
+                mark(self.enemy_bullet_manager.draw(screen, doreturn=doreturn, alpha=alpha))
+            with profiler.section("draw_entities"):
+                mark(self.player.draw(screen))
+
+        with profiler.section("hud"):
+            mark(self.hud.draw(screen, self.player))
+            mark(self.boss_bar_manager.draw(screen, self.enemies))
+            mark(self.powerup_manager.draw_hud(screen, font, self.screen_height, *self.powerup_icons))
+
+            # Display room info
+            room_text = text_cache.render(font, f"Room: {self.room_manager.current_room_id}", True, (255, 255, 255))
+            mark(screen.blit(room_text, (width - room_text.get_width() - 20, 20)))
+
+            visited_text = text_cache.render(font, f"Visited: {sorted(self.visited_rooms)}", True, (200, 200, 200))
+            mark(screen.blit(visited_text, (width - visited_text.get_width() - 20, 60)))
+
+            level_text = text_cache.render(font, f"Level: {self.current_level}", True, (255, 215, 0))
+            mark(screen.blit(level_text, (20, 100)))
+
+            if self.cleared_rooms:
+                cleared_text = text_cache.render(font, f"Cleared: {sorted(self.cleared_rooms)}", True, (100, 255, 100))
+                mark(screen.blit(cleared_text, (width - cleared_text.get_width() - 20, 100)))
+
+    def __repr__(self) -> str:
+        """
+        String representation for debugging.
+
+        Returns:
+            String showing tick, level, room and player HP
+        """
+        room_id = self.room_manager.current_room_id if self.room_manager else None
+        hp = self.player.hp if self.player else None
+        return f"Simulation(tick={self.tick}, level={self.current_level}, room={room_id}, hp={hp})"
@@ -49,30 +49,39 @@ class Bullet:
         self.frames = self._load_fireball_animation()
         self.current_sprite = self.frames[0] if self.frames else None
     
-    def _load_fireball_animation(self) -> list:
-        """Ładuje animację fireball."""
+    @staticmethod
+    def _load_fireball_frames() -> list:
+        """Ładuje nieobrócone klatki fireball (wspólne dla wszystkich pocisków)."""
         frame_width = 150
         frame_height = 100
         scale = 0.5
         
-        frames = resource_manager.load_spritesheet(
+        return resource_manager.load_spritesheet(
             "fireball.png", 
             frame_width, 
             frame_height,
             scale=(int(frame_width * scale), int(frame_height * scale))
         )
+    
+    @classmethod
+    def prebake_sprites(cls):
+        """Wypełnia cache obrotów fireball dla wszystkich kątów (np. na starcie poziomu)."""
+        frames = cls._load_fireball_frames()
+        if frames:
+            resource_manager.prebake_rotations("fireball.png", frames)
+    
+    def _load_fireball_animation(self) -> list:
+        """Ładuje animację fireball."""
+        # Dane dla spawn_projectile (ECS): klatki bazowe + kąt obrotu
+        self.sprite_key = "fireball.png"
+        self.sprite_frames = self._load_fireball_frames()
+        self.rotation = math.degrees(-self.angle)
         
-        if not frames:
+        if not self.sprite_frames:
             return []
         
-        # Obróć klatki zgodnie z kierunkiem lotu
-        angle_degrees = math.degrees(-self.angle)
-        rotated_frames = []
-        for frame in frames:
-            rotated = pygame.transform.rotate(frame, angle_degrees)
-            rotated_frames.append(rotated)
-        
-        return rotated_frames
+        # Obrócone klatki z cache ResourceManager (bez nowych powierzchni)
+        return resource_manager.get_rotated_frames(self.sprite_key, self.sprite_frames, self.rotation)
     
     def update(self):
         """Aktualizuje pozycję i animację pocisku."""
@@ -91,10 +100,10 @@ class Bullet:
         """Rysuje pocisk."""
         if self.current_sprite:
             sprite_rect = self.current_sprite.get_rect(center=(int(self.x), int(self.y)))
-            screen.blit(self.current_sprite, sprite_rect)
+            return screen.blit(self.current_sprite, sprite_rect)
         else:
             # Fallback - prosty fireball
-            self._draw_simple_fireball(screen)
+            return self._draw_simple_fireball(screen)
     
     def _draw_simple_fireball(self, screen: pygame.Surface):
         """Rysuje prosty fireball jako fallback."""
@@ -105,7 +114,7 @@ class Bullet:
         glow_surface = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
         pygame.draw.circle(glow_surface, (255, 100, 0, 80), 
                          (glow_size, glow_size), glow_size)
-        screen.blit(glow_surface, (int(self.x) - glow_size, int(self.y) - glow_size))
+        glow_rect = screen.blit(glow_surface, (int(self.x) - glow_size, int(self.y) - glow_size))
         
         # Środkowa warstwa
         pygame.draw.circle(screen, (255, 150, 0), (int(self.x), int(self.y)), 
@@ -118,3 +127,6 @@ class Bullet:
         # Centrum
         pygame.draw.circle(screen, (255, 255, 255), (int(self.x), int(self.y)), 
                          max(2, int(self.r * 0.5)))
+
+        # Poświata jest największą warstwą - obejmuje cały narysowany obszar
+        return glow_rect
@@ -0,0 +1,476 @@
+"""
+Structure-of-arrays bullet storage.
+
+This module keeps every live projectile of one kind (boss fire) in
+preallocated NumPy arrays instead of one Python object per bullet.
+Movement, animation, off-screen culling and circle hit tests run as
+single vectorized operations over all bullets.
+
+Bullet and EnemyBullet stay as small "spawn descriptions": BulletList
+accepts them through append() and copies their state into the pool, so
+code such as Enemy.update can keep appending bullets to a list.
+"""
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pygame
+
+from src.managers.resource_manager import resource_manager
+from src.utils.spatial_hash import SpatialHashGrid
+
+
+class BulletPool:
+    """
+    Pool of projectiles stored as parallel NumPy arrays.
+
+    Live bullets always occupy slots [0, count). Removing bullets compacts
+    the arrays while keeping spawn order, so index order equals firing
+    order (the same order the old per-object lists had).
+
+    Arrays (one entry per slot):
+        x, y: Sprite center position
+        vx, vy: Velocity in pixels per frame
+        radius: Hitbox radius
+        hit_offset: Offset from (x, y) to the hitbox center
+        damage: Damage dealt on hit
+        sprite_id: Index into the registered sprite table (-1 = fallback)
+        frame, frame_timer, frame_speed: Animation state (speed 0 = static)
+        rotation: Degrees passed to pygame.transform.rotate when drawing
+        rot_bucket: Rotation quantized to ResourceManager's angle buckets
+
+    Example:
+        >>> pool = BulletPool()
+        >>> sid = pool.register_sprite("fireball", frames)
+        >>> pool.spawn(100, 100, 10, 0, radius=16, damage=10, sprite_id=sid)
+        >>> pool.integrate()
+        >>> pool.cull_outside(1920, 1080)
+    """
+
+    INITIAL_CAPACITY = 256
+    FALLBACK_COLOR = (255, 50, 50)
+
+    _FLOAT_FIELDS = ('x', 'y', 'vx', 'vy', 'radius', 'hit_offset', 'damage', 'rotation')
+    _INT_FIELDS = ('sprite_id', 'frame', 'frame_timer', 'frame_speed', 'frame_count', 'rot_bucket')
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY) -> None:
+        """
+        Initialize an empty pool.
+
+        Args:
+            capacity: Number of preallocated slots (grows automatically)
+        """
+        self.capacity = max(1, int(capacity))
+        self.count = 0
+        for name in self._FLOAT_FIELDS:
+            setattr(self, name, np.zeros(self.capacity, dtype=np.float64))
+        for name in self._INT_FIELDS:
+            setattr(self, name, np.zeros(self.capacity, dtype=np.int32))
+
+        self._sprites: List[List[pygame.Surface]] = []
+        self._sprite_keys: List[str] = []
+        self._sprite_ids: Dict[str, int] = {}
+        # Per sprite: [frame][bucket] -> (rotated surface, half width, half height)
+        self._rotated: List[List[list]] = []
+        self._bucket_count = resource_manager.rotation_buckets
+
+    # ------------------------------------------------------------------
+    # Sprites
+    # ------------------------------------------------------------------
+    def register_sprite(self, key: str, frames: Sequence[pygame.Surface]) -> int:
+        """
+        Register animation frames under a key and return their sprite id.
+
+        Registering the same key again returns the existing id.
+
+        Args:
+            key: Unique name of the sprite (e.g. "fireball.png")
+            frames: Animation frames (may be empty for fallback rendering)
+
+        Returns:
+            Sprite id to pass to spawn(), or -1 if there are no frames
+        """
+        if key in self._sprite_ids:
+            return self._sprite_ids[key]
+        if not frames:
+            return -1
+        sprite_id = len(self._sprites)
+        self._sprites.append(list(frames))
+        self._sprite_keys.append(key)
+        self._sprite_ids[key] = sprite_id
+        self._rotated.append([[None] * self._bucket_count for _ in frames])
+        return sprite_id
+
+    def _sync_rotation_buckets(self) -> None:
+        """Re-quantize rotations if the ResourceManager bucket count changed."""
+        buckets = resource_manager.rotation_buckets
+        if buckets == self._bucket_count:
+            return
+        self._bucket_count = buckets
+        self._rotated = [[[None] * buckets for _ in frames] for frames in self._sprites]
+        n = self.count
+        self.rot_bucket[:n] = np.rint(self.rotation[:n] * buckets / 360.0).astype(np.int64) % buckets
+
+    # ------------------------------------------------------------------
+    # Spawning / removal
+    # ------------------------------------------------------------------
+    def _grow(self, needed: int) -> None:
+        """Grow all arrays so at least `needed` slots are available."""
+        new_capacity = self.capacity
+        while new_capacity < needed:
+            new_capacity *= 2
+        if new_capacity == self.capacity:
+            return
+        for name in self._FLOAT_FIELDS + self._INT_FIELDS:
+            old = getattr(self, name)
+            new = np.zeros(new_capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.capacity = new_capacity
+
+    def spawn(self, x: float, y: float, vx: float, vy: float, radius: float,
+              damage: float, sprite_id: int = -1, rotation: float = 0.0,
+              frame_speed: int = 0, hit_offset: float = 0.0) -> int:
+        """
+        Add a single bullet.
+
+        Args:
+            x: Sprite center X position
+            y: Sprite center Y position
+            vx: X velocity in pixels per frame
+            vy: Y velocity in pixels per frame
+            radius: Hitbox radius
+            damage: Damage dealt on hit
+            sprite_id: Id returned by register_sprite (-1 for fallback circle)
+            rotation: Sprite rotation in degrees
+            frame_speed: Frames per animation step (0 = no animation)
+            hit_offset: Offset from (x, y) to the hitbox center
+
+        Returns:
+            Slot index of the new bullet (valid until the next removal)
+        """
+        if self.count >= self.capacity:
+            self._grow(self.count + 1)
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.radius[i] = radius
+        self.hit_offset[i] = hit_offset
+        self.damage[i] = damage
+        self.rotation[i] = rotation
+        self.rot_bucket[i] = resource_manager.rotation_bucket(rotation)
+        self.sprite_id[i] = sprite_id
+        self.frame[i] = 0
+        self.frame_timer[i] = 0
+        self.frame_speed[i] = frame_speed
+        self.frame_count[i] = len(self._sprites[sprite_id]) if sprite_id >= 0 else 1
+        self.count += 1
+        return i
+
+    def spawn_from(self, bullet) -> int:
+        """
+        Copy the state of a Bullet or EnemyBullet into the pool.
+
+        The bullet must expose x, y, vx, vy, movement, ad, hit_box,
+        sprite_key, sprite_frames, rotation and frame_speed.
+
+        Args:
+            bullet: Bullet-like object describing the projectile
+
+        Returns:
+            Slot index of the new bullet
+        """
+        sprite_id = self.register_sprite(bullet.sprite_key, bullet.sprite_frames)
+        frame_speed = bullet.frame_speed if sprite_id >= 0 and len(bullet.sprite_frames) > 1 else 0
+        return self.spawn(
+            bullet.x, bullet.y,
+            bullet.vx * bullet.movement, bullet.vy * bullet.movement,
+            radius=bullet.hit_box.r,
+            damage=bullet.ad,
+            sprite_id=sprite_id,
+            rotation=bullet.rotation,
+            frame_speed=frame_speed,
+            hit_offset=bullet.hit_box.size_offset,
+        )
+
+    def remove(self, indices) -> None:
+        """
+        Remove bullets by slot index (or boolean mask over [0, count)).
+
+        Remaining bullets are compacted to the front, keeping their order.
+
+        Args:
+            indices: Integer indices or a boolean mask of bullets to remove
+        """
+        n = self.count
+        if n == 0:
+            return
+        indices = np.asarray(indices)
+        if indices.dtype == np.bool_:
+            remove_mask = indices[:n]
+        else:
+            if indices.size == 0:
+                return
+            remove_mask = np.zeros(n, dtype=np.bool_)
+            remove_mask[indices] = True
+        if not remove_mask.any():
+            return
+
+        keep = ~remove_mask
+        kept = int(keep.sum())
+        for name in self._FLOAT_FIELDS + self._INT_FIELDS:
+            arr = getattr(self, name)
+            arr[:kept] = arr[:n][keep]
+        self.count = kept
+
+    def clear(self) -> None:
+        """Remove all bullets (registered sprites are kept)."""
+        self.count = 0
+
+    # ------------------------------------------------------------------
+    # Simulation
+    # ------------------------------------------------------------------
+    def integrate(self) -> None:
+        """Advance positions and animation frames of all bullets by one frame."""
+        n = self.count
+        if n == 0:
+            return
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+
+        speed = self.frame_speed[:n]
+        animated = speed > 0
+        if animated.any():
+            timer = self.frame_timer[:n]
+            timer[animated] += 1
+            step = animated & (timer >= speed)
+            if step.any():
+                timer[step] = 0
+                frame = self.frame[:n]
+                frame[step] = (frame[step] + 1) % self.frame_count[:n][step]
+
+    def cull_outside(self, width: float, height: float) -> int:
+        """
+        Remove bullets whose center left the [0, width] x [0, height] area.
+
+        Args:
+            width: Screen width in pixels
+            height: Screen height in pixels
+
+        Returns:
+            Number of bullets removed
+        """
+        n = self.count
+        if n == 0:
+            return 0
+        x = self.x[:n]
+        y = self.y[:n]
+        outside = (x < 0) | (x > width) | (y < 0) | (y > height)
+        removed = int(outside.sum())
+        if removed:
+            self.remove(outside)
+        return removed
+
+    def collide_circle(self, cx: float, cy: float, r: float) -> np.ndarray:
+        """
+        Find all bullets whose hitbox overlaps a circle.
+
+        Uses the same squared-distance test as HitBox.collide.
+
+        Args:
+            cx: Circle center X
+            cy: Circle center Y
+            r: Circle radius
+
+        Returns:
+            Ascending array of slot indices (i.e. in firing order)
+        """
+        n = self.count
+        if n == 0:
+            return np.empty(0, dtype=np.intp)
+        dx = self.x[:n] + self.hit_offset[:n] - cx
+        dy = self.y[:n] + self.hit_offset[:n] - cy
+        reach = self.radius[:n] + r
+        return np.flatnonzero(dx * dx + dy * dy <= reach * reach)
+
+    def collide_hitbox(self, hit_box) -> np.ndarray:
+        """
+        Find all bullets overlapping a HitBox.
+
+        Args:
+            hit_box: HitBox to test against
+
+        Returns:
+            Ascending array of slot indices
+        """
+        return self.collide_circle(hit_box.x, hit_box.y, hit_box.r)
+
+    def build_grid(self, grid: SpatialHashGrid) -> SpatialHashGrid:
+        """
+        Bin the hitboxes of all live bullets into a spatial hash grid.
+
+        Grid indices are slot indices and queries use the same test as
+        collide_circle(), so grid.query_hitbox(hb) returns the same bullets
+        as collide_hitbox(hb) while only looking at nearby ones. Rebuild the
+        grid after the bullets move, spawn or are removed.
+
+        Args:
+            grid: Grid to (re)build
+
+        Returns:
+            The grid, for chaining
+        """
+        n = self.count
+        grid.build(self.x[:n] + self.hit_offset[:n], self.y[:n] + self.hit_offset[:n], self.radius[:n])
+        return grid
+
+    # ------------------------------------------------------------------
+    # Rendering
+    # ------------------------------------------------------------------
+    def _rotated_sprite(self, sprite_id: int, frame: int, bucket: int) -> tuple:
+        """Fetch (and remember) a rotated frame from the shared rotation cache."""
+        surf = resource_manager.get_rotated_bucket(
+            f"{self._sprite_keys[sprite_id]}#{frame}", self._sprites[sprite_id][frame], bucket)
+        entry = (surf, surf.get_width() // 2, surf.get_height() // 2)
+        self._rotated[sprite_id][frame][bucket] = entry
+        return entry
+
+    def draw(self, screen: pygame.Surface, doreturn: bool = False,
+             alpha: float = 1.0) -> Optional[List[pygame.Rect]]:
+        """
+        Draw all bullets.
+
+        Rotated frames come from ResourceManager's rotation cache, so
+        drawing does not allocate new surfaces once the cache is warm.
+
+        Args:
+            screen: Pygame surface to draw on
+            doreturn: Return the screen areas drawn to (for dirty-rect rendering)
+            alpha: Interpolation between the previous (0.0) and current (1.0)
+                   tick; velocities are constant, so the previous position
+                   is one velocity step back
+
+        Returns:
+            List of drawn Rects if doreturn is set, None otherwise
+        """
+        n = self.count
+        if n == 0:
+            return [] if doreturn else None
+        self._sync_rotation_buckets()
+        if alpha < 1.0:
+            back = 1.0 - alpha
+            xs = (self.x[:n] - self.vx[:n] * back).astype(np.int64).tolist()
+            ys = (self.y[:n] - self.vy[:n] * back).astype(np.int64).tolist()
+        else:
+            xs = self.x[:n].astype(np.int64).tolist()
+            ys = self.y[:n].astype(np.int64).tolist()
+        sprite_ids = self.sprite_id[:n].tolist()
+        frames = self.frame[:n].tolist()
+        buckets = self.rot_bucket[:n].tolist()
+        rotated = self._rotated
+
+        batch = []
+        drawn = []
+        for i in range(n):
+            sid = sprite_ids[i]
+            if sid < 0:
+                drawn.append(pygame.draw.circle(screen, self.FALLBACK_COLOR, (xs[i], ys[i]), int(self.radius[i])))
+                continue
+            entry = rotated[sid][frames[i]][buckets[i]]
+            if entry is None:
+                entry = self._rotated_sprite(sid, frames[i], buckets[i])
+            surf, half_w, half_h = entry
+            batch.append((surf, (xs[i] - half_w, ys[i] - half_h)))
+        if not doreturn:
+            if batch:
+                screen.blits(batch, doreturn=False)
+            return None
+        if batch:
+            drawn.extend(screen.blits(batch))
+        return drawn
+
+    def __len__(self) -> int:
+        """Get the number of live bullets."""
+        return self.count
+
+    def __repr__(self) -> str:
+        """
+        String representation for debugging.
+
+        Returns:
+            String showing live bullets and capacity
+        """
+        return f"BulletPool(count={self.count}, capacity={self.capacity})"
+
+
+class BulletView:
+    """
+    Read-only view of one pooled bullet.
+
+    Views are only valid until the pool is next modified (spawn, removal
+    or compaction may move bullets to different slots).
+    """
+
+    __slots__ = ('_pool', '_slot')
+
+    def __init__(self, pool: BulletPool, slot: int) -> None:
+        self._pool = pool
+        self._slot = slot
+
+    @property
+    def x(self) -> float:
+        return float(self._pool.x[self._slot])
+
+    @property
+    def y(self) -> float:
+        return float(self._pool.y[self._slot])
+
+    @property
+    def ad(self) -> float:
+        return float(self._pool.damage[self._slot])
+
+    @property
+    def r(self) -> float:
+        return float(self._pool.radius[self._slot])
+
+    def __repr__(self) -> str:
+        return f"BulletView(x={self.x:.1f}, y={self.y:.1f}, ad={self.ad})"
+
+
+class BulletList:
+    """
+    List-like facade over a BulletPool.
+
+    Keeps the old `bullets.append(Bullet(...))` call sites working: each
+    appended bullet object is copied into the pool and can be discarded.
+    """
+
+    def __init__(self, pool: Optional[BulletPool] = None) -> None:
+        """
+        Args:
+            pool: Pool to write into (a new one is created if omitted)
+        """
+        self.pool = pool if pool is not None else BulletPool()
+
+    def append(self, bullet) -> None:
+        """Spawn a pooled copy of a Bullet/EnemyBullet."""
+        self.pool.spawn_from(bullet)
+
+    def extend(self, bullets) -> None:
+        """Spawn pooled copies of several bullets."""
+        for bullet in bullets:
+            self.pool.spawn_from(bullet)
+
+    def clear(self) -> None:
+        """Remove all bullets."""
+        self.pool.clear()
+
+    def __len__(self) -> int:
+        return self.pool.count
+
+    def __bool__(self) -> bool:
+        return self.pool.count > 0
+
+    def __iter__(self) -> Iterator[BulletView]:
+        return (BulletView(self.pool, i) for i in range(self.pool.count))
@@ -0,0 +1,225 @@
+"""
+Adapters between the entity classes and the ECS world (src.core.ecs).
+
+Entities can be moved to the world one kind at a time: spawn_enemy(),
+spawn_projectile() and spawn_player() copy an existing object's state
+into components, and an EntityBinding keeps objects that other code
+still holds (boss bar, power-up drops, HUD, ...) in sync with their
+entities. Projectiles need no binding: like BulletList.append,
+spawn_projectile() only copies a Bullet's state, and the object can be
+dropped afterwards. The player's bullets live in the world this way
+(see Simulation.step).
+"""
+from typing import Dict, List, Tuple
+
+import pygame
+
+from src.core.ecs import (AI, DAMAGE, ENEMY_TEAM, HEALTH, HITBOX, PLAYER_TEAM, POSITION,
+                          PROJECTILE, SPRITE, VELOCITY, World)
+from src.core.ecs_systems import AI_CHASE
+
+ENEMY_COMPONENTS = (POSITION, VELOCITY, HITBOX, SPRITE, HEALTH, DAMAGE, AI, ENEMY_TEAM)
+PROJECTILE_COMPONENTS = (POSITION, VELOCITY, HITBOX, SPRITE, DAMAGE, PROJECTILE)
+PLAYER_COMPONENTS = (POSITION, HITBOX, SPRITE, HEALTH, PLAYER_TEAM)
+
+
+def _register_enemy_sprite(world: World, enemy) -> int:
+    """Register an enemy's frames, pre-flipped for sheets drawn facing the other way."""
+    key = f"enemy:{enemy.enemy_type.name}:{enemy.level}"
+    if not getattr(enemy, 'mirrored_sprite', False):
+        return world.sprites.register(key, enemy.frames)
+    key += "#mirrored"
+    sprite_id = world.sprites.register(key, ())
+    if sprite_id < 0 and enemy.frames:
+        sprite_id = world.sprites.register(key, [pygame.transform.flip(frame, True, False)
+                                                 for frame in enemy.frames])
+    return sprite_id
+
+
+def spawn_enemy(world: World, enemy) -> int:
+    """
+    Create an entity for an Enemy that chases its target.
+
+    Boss shooting and flow-field detours are not ported: bosses keep their
+    bullets coming from Enemy.update.
+
+    Args:
+        world: World to spawn in
+        enemy: Enemy to copy
+
+    Returns:
+        Entity id
+    """
+    sprite_id = _register_enemy_sprite(world, enemy)
+    half = enemy.size // 2
+    return world.spawn(
+        ENEMY_COMPONENTS,
+        x=enemy.x, y=enemy.y,
+        radius=enemy.hit_box.r, hit_offset=enemy.hit_box.size_offset,
+        sprite_id=sprite_id, frame=enemy.frame_index, frame_timer=enemy.frame_timer,
+        frame_speed=enemy.frame_speed if enemy.frames else 0,
+        frame_count=world.sprites.frame_count(sprite_id),
+        facing_left=enemy.facing_left != getattr(enemy, 'mirrored_sprite', False),
+        draw_dx=half, draw_dy=half,
+        hp=enemy.hp, max_hp=enemy.max_hp, damage=enemy.ad,
+        ai_kind=AI_CHASE, speed=enemy.movement,
+    )
+
+
+def spawn_projectile(world: World, bullet, team: str = PLAYER_TEAM) -> int:
+    """
+    Create an entity for a Bullet or EnemyBullet (see BulletPool.spawn_from).
+
+    Args:
+        world: World to spawn in
+        bullet: Bullet-like object describing the projectile
+        team: PLAYER_TEAM for player bullets, ENEMY_TEAM for boss fire
+
+    Returns:
+        Entity id
+    """
+    sprite_id = world.sprites.register(bullet.sprite_key, bullet.sprite_frames)
+    frame_speed = bullet.frame_speed if sprite_id >= 0 and len(bullet.sprite_frames) > 1 else 0
+    return world.spawn(
+        PROJECTILE_COMPONENTS + (team,),
+        x=bullet.x, y=bullet.y,
+        vx=bullet.vx * bullet.movement, vy=bullet.vy * bullet.movement,
+        radius=bullet.hit_box.r, hit_offset=bullet.hit_box.size_offset,
+        sprite_id=sprite_id, frame_speed=frame_speed,
+        frame_count=world.sprites.frame_count(sprite_id),
+        rotation=bullet.rotation, damage=bullet.ad,
+    )
+
+
+def spawn_player(world: World, player) -> int:
+    """
+    Create an entity for the Player.
+
+    The player stays driven by Player.update; bind it and push() it every
+    tick so collisions and rendering see its position.
+
+    Args:
+        world: World to spawn in
+        player: Player to copy
+
+    Returns:
+        Entity id
+    """
+    sprite_id = world.sprites.register("uranek.png", player.frames)
+    width, height = player.frames[0].get_size() if player.frames else (0, 0)
+    return world.spawn(
+        PLAYER_COMPONENTS,
+        x=player.x, y=player.y,
+        radius=player.hit_box.r, hit_offset=player.hit_box.size_offset,
+        sprite_id=sprite_id, frame=player.frame_index,
+        frame_count=world.sprites.frame_count(sprite_id),
+        facing_left=player.facing_left, draw_dx=width // 2, draw_dy=height // 2,
+        hp=player.hp, max_hp=player.max_hp,
+    )
+
+
+class EntityBinding:
+    """
+    Keeps existing objects and their entities in sync.
+
+    push() copies what game code changed on an object into its entity;
+    pull() copies what the systems changed back to all objects (position,
+    hitbox, hp, facing and animation frame) and unbinds objects whose
+    entity was destroyed.
+
+    Example:
+        >>> binding = EntityBinding(world)
+        >>> for enemy in enemies:
+        ...     binding.bind(enemy, spawn_enemy(world, enemy))
+        >>> schedule.run(world)
+        >>> for enemy in binding.pull():
+        ...     enemies.remove(enemy)  # killed or expired
+    """
+
+    def __init__(self, world: World) -> None:
+        """
+        Args:
+            world: World the entities live in
+        """
+        self.world = world
+        self._entities: Dict[object, int] = {}
+
+    def bind(self, obj, entity: int) -> None:
+        """Associate an object with its entity."""
+        self._entities[obj] = entity
+
+    def unbind(self, obj) -> None:
+        """Forget an object (its entity is left alone)."""
+        self._entities.pop(obj, None)
+
+    def entity_of(self, obj) -> int:
+        """
+        Get the entity of a bound object.
+
+        Raises:
+            KeyError: If the object is not bound
+        """
+        return self._entities[obj]
+
+    def push(self, obj) -> None:
+        """Copy an object's position, hp, facing and frame into its entity."""
+        world = self.world
+        arch, row = world.locate(self._entities[obj])
+        arch.column('x')[row] = obj.x
+        arch.column('y')[row] = obj.y
+        if arch.has(HEALTH):
+            arch.column('hp')[row] = obj.hp
+        if arch.has(SPRITE):
+            arch.column('facing_left')[row] = obj.facing_left != getattr(obj, 'mirrored_sprite', False)
+            arch.column('frame')[row] = obj.frame_index
+
+    def pull(self) -> List:
+        """
+        Copy entity state back to every bound object.
+
+        Objects whose entity was flushed are detected by the id's
+        generation, even if its slot was reused by a newer entity.
+
+        Returns:
+            Objects whose entity no longer exists (they are unbound)
+        """
+        world = self.world
+        gone = []
+        rows: Dict[int, List[Tuple[object, int]]] = {}
+        for obj, entity in self._entities.items():
+            if not world.is_alive(entity):
+                gone.append(obj)
+                continue
+            arch, row = world.locate(entity)
+            rows.setdefault(arch.index, []).append((obj, row))
+        for obj in gone:
+            del self._entities[obj]
+
+        for index, bound in rows.items():
+            arch = world.archetypes[index]
+            xs = arch.column('x').tolist()
+            ys = arch.column('y').tolist()
+            hps = arch.column('hp').tolist() if arch.has(HEALTH) else None
+            sprite = arch.has(SPRITE)
+            if sprite:
+                frames = arch.column('frame').tolist()
+                facing = arch.column('facing_left').tolist()
+            for obj, row in bound:
+                obj.x = xs[row]
+                obj.y = ys[row]
+                obj.hit_box.update_position(obj.x, obj.y)
+                if hps is not None:
+                    obj.hp = hps[row]
+                if sprite:
+                    obj.facing_left = facing[row] != getattr(obj, 'mirrored_sprite', False)
+                    obj.frame_index = frames[row]
+                    if obj.frames:
+                        obj.current_sprite = obj.frames[obj.frame_index % len(obj.frames)]
+        return gone
+
+    def __len__(self) -> int:
+        """Get the number of bound objects."""
+        return len(self._entities)
+
+    def __repr__(self) -> str:
+        return f"EntityBinding(bound={len(self._entities)})"
@@ -1,17 +1,14 @@
 import pygame
 from src.core.constants import FPS
+from src.core.rng import rng, ENEMIES
 from src.utils.hitbox import HitBox
 from src.entities.enemy_type import EnemyType, EnemyTypeConfig
-from src.ui.hud import load_heart_images
+from src.ui.hp_strip import hp_strip_cache
 from src.managers.resource_manager import resource_manager
 from src.managers.resource_manager import resource_manager
 
 
 class Enemy:
-    # Cached heart images for all enemies to avoid reloading each frame
-    _heart_img = None
-    _dim_heart_img = None
-
     def __init__(self, x, y, enemy_type=EnemyType.WEAK, room=None, level=1):
         self.x = x
         self.y = y
@@ -85,6 +82,10 @@ class Enemy:
             if self.frames:
                 self.current_sprite = self.frames[0]
 
+        # enemy6 and enemy8 are drawn facing the other way than the other sheets
+        self.mirrored_sprite = ((level == 2 and enemy_type == EnemyType.STRONG) or
+                                (level == 3 and enemy_type == EnemyType.MEDIUM))
+
         # Boss shooting mechanics
         self.is_boss = (enemy_type == EnemyType.BOSS or enemy_type == EnemyType.FINAL_BOSS)
         if self.is_boss:
@@ -108,14 +109,9 @@ class Enemy:
                 self.phase_timer = 0  # Current timer in phase
                 self.is_firing_phase = True  # Start in firing phase
 
-        # Prepare heart icons once (shared)
-        self._ensure_hearts_loaded()
-
-    def _ensure_hearts_loaded(self):
-        if Enemy._heart_img is None or Enemy._dim_heart_img is None:
-            heart, dim = load_heart_images(16, './heart2.png')
-            Enemy._heart_img = heart
-            Enemy._dim_heart_img = dim
+        # HP hearts strip (shared, see hp_strip_cache) and the (hp, max_hp, size) it shows
+        self._hp_strip = None
+        self._hp_strip_key = None
 
     def load_sheet(self, path, frame_width, frame_height):
         """Load sprite sheet and split it into individual frames"""
@@ -129,67 +125,20 @@ class Enemy:
         self.room = room
 
     def _draw_enemy_hearts(self, screen):
-        # Each heart represents 10 HP (as per example: 50 HP -> 5 hearts)
-        hp_per_heart = 10
-        total_hearts = max(1, int((self.max_hp + hp_per_heart - 1) // hp_per_heart))
-
-        # Visual size of hearts relative to enemy size
-        heart_size = max(10, min(20, int(self.size * 0.4)))
-        spacing = 2
-        # If we just loaded default size 16 previously, but heart_size differs, rescale once
-        if Enemy._heart_img is not None and Enemy._heart_img.get_width() != heart_size:
-            try:
-                Enemy._heart_img = pygame.transform.smoothscale(Enemy._heart_img, (heart_size, heart_size))
-                Enemy._dim_heart_img = pygame.transform.smoothscale(Enemy._dim_heart_img, (heart_size, heart_size))
-            except Exception:
-                pass
-
-        total_width = total_hearts * heart_size + (total_hearts - 1) * spacing
-        x0 = self.x + (self.size - total_width) // 2
-
         # For bosses we don't draw the bar here; main will render a centralized animated boss bar.
         if self.is_boss:
-            return
-
-        extra_offset = 0
-        y0 = self.y - heart_size - 4 - extra_offset
-
-        # Compute how many hearts are fully/partially filled based on current HP in units of 10
-        shown_hp = max(0, min(self.hp, self.max_hp))
-        hearts_value = shown_hp / float(hp_per_heart)
-
-        use_fallback = (Enemy._heart_img is None or Enemy._dim_heart_img is None)
-
-        for i in range(total_hearts):
-            x = x0 + i * (heart_size + spacing)
-            filled = hearts_value - i  # 1.0 = full, 0.0 = empty, in-between = partial
-            if filled <= 0:
-                if use_fallback:
-                    # Draw dim rect
-                    s = pygame.Surface((heart_size, heart_size), pygame.SRCALPHA)
-                    pygame.draw.rect(s, (80, 80, 80, 140), s.get_rect(), border_radius=heart_size // 4)
-                    screen.blit(s, (x, y0))
-                else:
-                    screen.blit(Enemy._dim_heart_img, (x, y0))
-                continue
-            if use_fallback:
-                # Draw dim background then filled portion as red rect
-                s = pygame.Surface((heart_size, heart_size), pygame.SRCALPHA)
-                pygame.draw.rect(s, (80, 80, 80, 140), s.get_rect(), border_radius=heart_size // 4)
-                screen.blit(s, (x, y0))
-                w = heart_size if filled >= 1 else max(1, int(filled * heart_size))
-                fg = pygame.Surface((w, heart_size), pygame.SRCALPHA)
-                pygame.draw.rect(fg, (220, 30, 30, 255), fg.get_rect(), border_radius=heart_size // 4)
-                screen.blit(fg, (x, y0))
-            else:
-                if filled >= 1:
-                    screen.blit(Enemy._heart_img, (x, y0))
-                else:
-                    # Draw dim then overlay clipped heart for partial fill
-                    screen.blit(Enemy._dim_heart_img, (x, y0))
-                    w = max(1, int(filled * heart_size))
-                    area = pygame.Rect(0, 0, w, heart_size)
-                    screen.blit(Enemy._heart_img, (x, y0), area=area)
+            return None
+
+        # Look the strip up again only when what it shows may have changed
+        key = (self.hp, self.max_hp, self.size)
+        if key != self._hp_strip_key:
+            self._hp_strip = hp_strip_cache.get(hp_strip_cache.heart_size_for(self.size), self.max_hp, self.hp)
+            self._hp_strip_key = key
+
+        strip = self._hp_strip
+        x0 = self.x + (self.size - strip.get_width()) // 2
+        y0 = self.y - strip.get_height() - 4
+        return screen.blit(strip, (x0, y0))
 
     def draw(self, screen):
         # Draw animated sprite for all enemy types with sprites
@@ -204,13 +153,26 @@ class Enemy:
                 screen.blit(self.current_sprite, sprite_rect)
         else:
             # Fallback: Draw colored square if no sprite loaded
-            pygame.draw.rect(screen, self.color, (self.x, self.y, self.size, self.size))
+            sprite_rect = pygame.draw.rect(screen, self.color, (self.x, self.y, self.size, self.size))
 
 
         # Draw hearts above enemy
-        self._draw_enemy_hearts(screen)
+        hearts_rect = self._draw_enemy_hearts(screen)
+
+        # Area drawn to (used by dirty-rect rendering)
+        return sprite_rect.union(hearts_rect) if hearts_rect else sprite_rect
+
+    def update(self, player_x, player_y, enemy_bullets=None, flow_field=None):
+        """
+        Animate, move towards the player and handle boss shooting.
 
-    def update(self, player_x, player_y, enemy_bullets=None):
+        Args:
+            player_x: Player X position
+            player_y: Player Y position
+            enemy_bullets: List new boss bullets are appended to
+            flow_field: Optional FlowField pointed at the player; where the
+                        straight line is blocked the enemy follows it instead
+        """
         # Update animation for all enemies with frames
         if self.frames:
             self.frame_timer += 1
@@ -219,25 +181,29 @@ class Enemy:
                 self.frame_index = (self.frame_index + 1) % len(self.frames)
                 self.current_sprite = self.frames[self.frame_index]
 
-        # calculating direction to the player
-        vx = self.x - player_x
-        vy = self.y - player_y
-        normalize_factor = (vx ** 2 + vy ** 2) ** 0.5
+        # Detour around obstacles (None when the way to the player is free)
+        detour = flow_field.detour_direction(self.hit_box.x, self.hit_box.y) if flow_field is not None else None
+
+        if detour is not None:
+            vx, vy = -detour[0], -detour[1]
+        else:
+            # calculating direction to the player
+            vx = self.x - player_x
+            vy = self.y - player_y
+            normalize_factor = (vx ** 2 + vy ** 2) ** 0.5
 
-        # Avoid division by zero when enemy is at same position as player
-        if normalize_factor == 0:
-            return
+            # Avoid division by zero when enemy is at same position as player
+            if normalize_factor == 0:
+                return
 
-        vx /= normalize_factor
-        vy /= normalize_factor
+            vx /= normalize_factor
+            vy /= normalize_factor
 
         # Track facing direction based on horizontal movement
         # vx > 0 means enemy is to the right of player, so moving left (towards player) - face right
         # vx < 0 means enemy is to the left of player, so moving right (towards player) - face left
         # Special cases: enemy6 and enemy8 face opposite direction
-        is_enemy6 = (self.level == 2 and self.enemy_type == EnemyType.STRONG)
-        is_enemy8 = (self.level == 3 and self.enemy_type == EnemyType.MEDIUM)
-        needs_flip = is_enemy6 or is_enemy8
+        needs_flip = self.mirrored_sprite
         if vx > 0:
             self.facing_left = True if needs_flip else False  # Enemy is right of player, moving left
         elif vx < 0:
@@ -401,9 +367,9 @@ class Enemy:
 
                 if distance == 0:
                     # Enemies are at exact same position, push randomly
-                    import random
-                    dx = random.choice([-1, 1])
-                    dy = random.choice([-1, 1])
+                    rand = rng.stream(ENEMIES)
+                    dx = rand.choice([-1, 1])
+                    dy = rand.choice([-1, 1])
                     distance = 1.414  # sqrt(2)
 
                 # Normalize
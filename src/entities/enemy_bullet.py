@@ -2,6 +2,7 @@
 import pygame
 from src.utils.hitbox import HitBox
 from src.core.constants import *
+from src.managers.resource_manager import resource_manager
 import math
 
 
@@ -47,103 +48,95 @@ class EnemyBullet:
         # Load appropriate sprite based on level
         self._load_sprite()
 
-    def _load_sprite(self):
-        """Load the appropriate fire sprite based on level and index"""
-        if self.level == 2:
+        # Rotation used for drawing (and by BulletPool)
+        self.rotation = -self.angle
+
+    @classmethod
+    def _ensure_sprites(cls, level):
+        """Load (once) the fire sprites used by the boss of the given level"""
+        if level == 2:
             # Trash boss - load all 3 sprites if not already loaded
             sprite_names = ["trash-boss-fire1.png", "trash-boss-fire2.png", "trash-boss-fire3.png"]
             for i, sprite_name in enumerate(sprite_names):
                 if EnemyBullet._trash_sprites[i] is None:
-                    try:
-                        try:
-                            sprite = pygame.image.load(f"game/{sprite_name}").convert_alpha()
-                        except:
-                            sprite = pygame.image.load(sprite_name).convert_alpha()
-                        EnemyBullet._trash_sprites[i] = pygame.transform.smoothscale(sprite, (self._sprite_size, self._sprite_size))
-                    except Exception as e:
-                        print(f"Error loading {sprite_name}: {e}")
-                        EnemyBullet._trash_sprites[i] = None
-            # Set current sprite for this bullet
-            self.sprite = EnemyBullet._trash_sprites[self.fire_sprite_index]
-        elif self.level == 3:
+                    EnemyBullet._trash_sprites[i] = resource_manager.load_image(
+                        sprite_name, scale=(cls._sprite_size, cls._sprite_size))
+        elif level == 3:
             # Olejman boss (level 3) - Huge 200x200 bullet
             if EnemyBullet._olejman_sprite is None:
-                try:
-                    try:
-                        sprite = pygame.image.load("game/olejman-boss-fire.png").convert_alpha()
-                    except:
-                        sprite = pygame.image.load("olejman-boss-fire.png").convert_alpha()
-                    # Scale to 200x200 (huge bullet)
-                    EnemyBullet._olejman_sprite = pygame.transform.smoothscale(sprite, (200, 200))
-                except Exception as e:
-                    print(f"Error loading olejman-boss-fire.png: {e}")
-                    EnemyBullet._olejman_sprite = None
-            self.sprite = EnemyBullet._olejman_sprite
-        elif self.level == 4:
+                EnemyBullet._olejman_sprite = resource_manager.load_image("olejman-boss-fire.png", scale=(200, 200))
+        elif level == 4:
             # Final boss (level 4) - Load animated sprite sheet (600x100 = 4 frames of 150x100)
             if EnemyBullet._final_sprite_frames is None:
-                EnemyBullet._final_sprite_frames = self._load_sheet("final-boss-fire.png", 150, 100)
+                EnemyBullet._final_sprite_frames = cls._load_sheet("final-boss-fire.png", 150, 100)
+        else:
+            # Coal boss (level 1) and default
+            if EnemyBullet._coal_sprite is None:
+                EnemyBullet._coal_sprite = resource_manager.load_image(
+                    "coal-boss-fire.png", scale=(cls._sprite_size, cls._sprite_size))
+
+    @classmethod
+    def sprite_frames_for(cls, level, fire_sprite_index=0):
+        """Return (sprite_key, frames) for a level's fire sprite (frames may be empty)"""
+        cls._ensure_sprites(level)
+        if level == 4:
+            return "final-boss-fire.png", EnemyBullet._final_sprite_frames or []
+        if level == 2:
+            sprite = EnemyBullet._trash_sprites[fire_sprite_index]
+            key = f"trash-boss-fire{fire_sprite_index + 1}.png"
+        elif level == 3:
+            sprite = EnemyBullet._olejman_sprite
+            key = "olejman-boss-fire.png"
+        else:
+            sprite = EnemyBullet._coal_sprite
+            key = "coal-boss-fire.png"
+        return key, [sprite] if sprite else []
+
+    @classmethod
+    def prebake_sprites(cls, level):
+        """Load a level's fire sprites and fill the rotation cache for all angles"""
+        indices = range(3) if level == 2 else (0,)
+        for index in indices:
+            key, frames = cls.sprite_frames_for(level, index)
+            if frames:
+                resource_manager.prebake_rotations(key, frames)
 
+    def _load_sprite(self):
+        """Load the appropriate fire sprite based on level and index"""
+        self.sprite_key, self.sprite_frames = self.sprite_frames_for(self.level, self.fire_sprite_index)
+        if self.level == 4:
             # Each bullet gets its own frames (reference to cached frames)
-            self.frames = EnemyBullet._final_sprite_frames
+            self.frames = self.sprite_frames
             if self.frames:
                 self.current_sprite = self.frames[0]
             self.sprite = None  # Don't use single sprite for final boss
         else:
-            # Coal boss (level 1) and default
-            if EnemyBullet._coal_sprite is None:
-                try:
-                    try:
-                        sprite = pygame.image.load("game/coal-boss-fire.png").convert_alpha()
-                    except:
-                        sprite = pygame.image.load("coal-boss-fire.png").convert_alpha()
-                    EnemyBullet._coal_sprite = pygame.transform.smoothscale(sprite, (self._sprite_size, self._sprite_size))
-                except Exception as e:
-                    print(f"Error loading coal-boss-fire.png: {e}")
-                    EnemyBullet._coal_sprite = None
-            self.sprite = EnemyBullet._coal_sprite
-
-    def _load_sheet(self, path, frame_width, frame_height):
+            self.sprite = self.sprite_frames[0] if self.sprite_frames else None
+
+    @classmethod
+    def _load_sheet(cls, path, frame_width, frame_height):
         """Load sprite sheet and split it into individual frames (for final boss animation)"""
-        try:
-            try:
-                sheet = pygame.image.load(f"game/{path}").convert_alpha()
-            except:
-                sheet = pygame.image.load(path).convert_alpha()
-
-            sheet_width, sheet_height = sheet.get_size()
-            cols = sheet_width // frame_width
-            frames = []
-
-            for col in range(cols):
-                rect = pygame.Rect(col * frame_width, 0, frame_width, frame_height)
-                frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-                frame.blit(sheet, (0, 0), rect)
-                # Scale frame to sprite size
-                scaled_frame = pygame.transform.smoothscale(frame, (self._sprite_size, self._sprite_size))
-                frames.append(scaled_frame)
-
-            return frames
-        except Exception as e:
-            print(f"Error loading sprite sheet {path}: {e}")
-            return []
+        # Frames scaled to sprite size (served from the texture atlas when packed)
+        return resource_manager.load_spritesheet(path, frame_width, frame_height,
+                                                 scale=(cls._sprite_size, cls._sprite_size))
 
     def draw(self, screen):
         # For final boss (level 4), use animated sprite
         if self.level == 4 and self.current_sprite:
-            # Rotate sprite to face direction of movement
-            rotated_sprite = pygame.transform.rotate(self.current_sprite, -self.angle)
+            # Rotate sprite to face direction of movement (cached rotation)
+            rotated_sprite = resource_manager.get_rotated(f"{self.sprite_key}#{self.frame_index}",
+                                                          self.current_sprite, self.rotation)
             sprite_rect = rotated_sprite.get_rect(center=(int(self.x), int(self.y)))
-            screen.blit(rotated_sprite, sprite_rect)
+            return screen.blit(rotated_sprite, sprite_rect)
         elif self.sprite:
             # For other bosses, use single sprite
-            # Rotate sprite to face direction of movement
-            rotated_sprite = pygame.transform.rotate(self.sprite, -self.angle)
+            # Rotate sprite to face direction of movement (cached rotation)
+            rotated_sprite = resource_manager.get_rotated(f"{self.sprite_key}#0", self.sprite, self.rotation)
             sprite_rect = rotated_sprite.get_rect(center=(int(self.x), int(self.y)))
-            screen.blit(rotated_sprite, sprite_rect)
+            return screen.blit(rotated_sprite, sprite_rect)
         else:
             # Fallback to circle if sprite failed to load
-            pygame.draw.circle(screen, (255, 50, 50), (int(self.x), int(self.y)), self.r)
+            return pygame.draw.circle(screen, (255, 50, 50), (int(self.x), int(self.y)), self.r)
 
     def update(self):
         # Update animation for final boss bullets
@@ -104,6 +104,6 @@ class Player:
         # Flip sprite horizontally if facing left
         if self.facing_left:
             flipped_sprite = pygame.transform.flip(self.current_sprite, True, False)
-            screen.blit(flipped_sprite, (self.x, self.y))
+            return screen.blit(flipped_sprite, (self.x, self.y))
         else:
-            screen.blit(self.current_sprite, (self.x, self.y))
+            return screen.blit(self.current_sprite, (self.x, self.y))
@@ -41,16 +41,16 @@ class BasePowerUp(ABC):
         self.hit_box.update_position(x, y)
     
     def draw(self, screen: pygame.Surface):
-        """Rysuje power-up."""
+        """Rysuje power-up i zwraca zajęty obszar ekranu (Rect lub None)."""
         if not self.alive:
-            return
+            return None
         
         if self.sprite:
-            screen.blit(self.sprite, (int(self.x), int(self.y)))
+            return screen.blit(self.sprite, (int(self.x), int(self.y)))
         else:
             # Fallback - kolorowy kwadrat
-            pygame.draw.rect(screen, (255, 0, 255), 
-                           (int(self.x), int(self.y), self.size, self.size))
+            return pygame.draw.rect(screen, (255, 0, 255), 
+                                    (int(self.x), int(self.y), self.size, self.size))
     
     def collect(self) -> dict:
         """
@@ -3,6 +3,9 @@ Room Background Manager for handling level-specific backgrounds.
 """
 import pygame
 import random
+from typing import Dict, Optional, Tuple
+
+from src.managers.resource_manager import resource_manager
 
 
 class RoomBackgroundManager:
@@ -13,13 +16,27 @@ class RoomBackgroundManager:
     - Level 1: room-1, room-2, room-3
     - Level 2: room-4, room-5, room-6
     - Level 3: room-7, room-8, room-9
+
+    Backgrounds are handed out already scaled to the display resolution.
+    Each room-N.png is scaled and converted to the display pixel format
+    once per resolution, so the game loop only has to blit it.
     """
     
-    def __init__(self):
-        """Initialize background manager and load all backgrounds."""
+    def __init__(self, target_size: Optional[Tuple[int, int]] = None):
+        """
+        Initialize background manager and load all backgrounds.
+
+        Args:
+            target_size: Resolution backgrounds are scaled to. Defaults to
+                         the size of the current display surface.
+        """
         self.level1_backgrounds = []  # room-1, room-2, room-3
         self.level2_backgrounds = []  # room-4, room-5, room-6
         self.level3_backgrounds = []  # room-7, room-8, room-9
+        self._room_numbers: Dict[int, int] = {}  # id(surface) -> room number
+        # (room_num, (width, height)) -> scaled, display-format surface
+        self._scaled_cache: Dict[Tuple[int, Tuple[int, int]], pygame.Surface] = {}
+        self.target_size = target_size
         self.load_backgrounds()
 
     def load_backgrounds(self):
@@ -49,42 +66,97 @@ class RoomBackgroundManager:
             bg_list: List to append the loaded background to
             level: Level number for logging
         """
-        paths = [f"game/room-{room_num}.png", f"room-{room_num}.png"]
+        # Through the resource manager so decoded backgrounds come from the disk cache
+        bg = resource_manager.load_image(f"room-{room_num}.png", convert_alpha=False)
+        if bg is None:
+            print(f"✗ Cannot load room-{room_num}.png")
+            return
         
-        for path in paths:
-            try:
-                bg = pygame.image.load(path).convert()
-                bg_list.append(bg)
-                print(f"✓ Loaded room-{room_num}.png (Level {level})")
-                return
-            except:
-                continue
+        bg_list.append(bg)
+        self._room_numbers[id(bg)] = room_num
+        print(f"✓ Loaded room-{room_num}.png (Level {level})")
         
-        print(f"✗ Cannot load room-{room_num}.png")
+    def _resolve_target_size(self) -> Optional[Tuple[int, int]]:
+        """Return the resolution backgrounds should be scaled to."""
+        if self.target_size is not None:
+            return self.target_size
+        display = pygame.display.get_surface()
+        if display is None:
+            return None
+        return display.get_size()
     
-    def get_random_background(self, level: int = 1):
+    def get_scaled(self, bg: pygame.Surface, room_num: int) -> pygame.Surface:
+        """
+        Get a background scaled to the target resolution.
+
+        The scaled surface is created on first use for each resolution and
+        reused afterwards.
+
+        Args:
+            bg: Original (unscaled) background surface
+            room_num: Room number used as part of the cache key
+
+        Returns:
+            Ready-to-blit surface matching the target resolution
+        """
+        size = self._resolve_target_size()
+        if size is None or bg.get_size() == size:
+            return bg
+
+        key = (room_num, size)
+        scaled = self._scaled_cache.get(key)
+        if scaled is None:
+            scaled = pygame.transform.scale(bg, size)
+            if pygame.display.get_surface() is not None:
+                scaled = scaled.convert()
+            self._scaled_cache[key] = scaled
+        return scaled
+
+    def prescale_all(self):
+        """Scale every loaded background for the current target resolution."""
+        for bg_list in (self.level1_backgrounds, self.level2_backgrounds, self.level3_backgrounds):
+            for bg in bg_list:
+                self.get_scaled(bg, self._room_numbers[id(bg)])
+
+    def set_target_size(self, size: Optional[Tuple[int, int]]):
+        """
+        Change the resolution backgrounds are scaled to.
+
+        Call this after the display mode changes. Scaled surfaces for the
+        old resolution are dropped.
+
+        Args:
+            size: New (width, height), or None to follow the display surface
+        """
+        self.target_size = size
+        self.invalidate_cache()
+
+    def invalidate_cache(self):
+        """Drop all scaled backgrounds (e.g. after a display mode change)."""
+        self._scaled_cache.clear()
+
+    def get_random_background(self, level: int = 1, rng: Optional[random.Random] = None):
         """
         Get a random background for the specified level.
         
         Args:
             level: Level number (1, 2, or 3+)
+            rng: Random generator to choose with (default: the random module)
             
         Returns:
-            Tuple of (background_surface, room_number) or (None, None) if no backgrounds available
+            Tuple of (background_surface, room_number) or (None, None) if no backgrounds available.
+            The surface is already scaled to the target resolution.
         """
         if level == 1:
             backgrounds = self.level1_backgrounds
-            start_idx = 1
         elif level == 2:
             backgrounds = self.level2_backgrounds
-            start_idx = 4
         else:  # level 3+
             backgrounds = self.level3_backgrounds
-            start_idx = 7
 
         if backgrounds:
-            bg = random.choice(backgrounds)
-            idx = backgrounds.index(bg) + start_idx
-            return bg, idx
+            bg = (rng or random).choice(backgrounds)
+            idx = self._room_numbers[id(bg)]
+            return self.get_scaled(bg, idx), idx
         else:
             return None, None
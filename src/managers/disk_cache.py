@@ -0,0 +1,218 @@
+"""
+Persistent on-disk cache of decoded images.
+
+Decoding a large PNG and scaling it takes tens of milliseconds, and the
+game does that for the start screen, maps, room backgrounds and the game
+over screen on every launch. This cache stores the final surfaces (decoded,
+scaled and converted) as raw pixels, one file per image. On the next
+launch the file is memory-mapped and wrapped with pygame.image.frombuffer,
+so loading is little more than one copy into the display pixel format.
+
+Entries are keyed by the source file's path, modification time and size,
+the target size and the alpha mode, so an edited asset simply misses the
+cache and is decoded again.
+"""
+import hashlib
+import logging
+import mmap
+import os
+import struct
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+
+class DecodedImageCache:
+    """
+    Directory of raw-pixel image files keyed by source and load parameters.
+
+    File layout: a 16-byte header (magic, version, width, height) followed
+    by width * height BGRA pixels.
+
+    Attributes:
+        directory (str): Directory holding the cache files
+        min_pixels (int): Images with fewer pixels are not cached (they
+                          decode faster than a file can be opened)
+        hits (int): Images served from the cache
+        misses (int): Lookups without a (valid) cache file
+        writes (int): Cache files written
+
+    Example:
+        >>> cache = DecodedImageCache("cache/decoded")
+        >>> img = cache.load(path, None, False)
+        >>> if img is None:
+        ...     img = pygame.image.load(path).convert()
+        ...     cache.store(path, None, False, img)
+    """
+
+    MAGIC = b"PGIC"
+    VERSION = 1
+    PIXEL_FORMAT = "BGRA"
+    FILE_SUFFIX = ".pix"
+    DEFAULT_MIN_PIXELS = 128 * 128
+    _HEADER = struct.Struct("<4sIII")  # magic, version, width, height
+
+    def __init__(self, directory: str, min_pixels: int = DEFAULT_MIN_PIXELS) -> None:
+        """
+        Initialize the cache (the directory is created on first write).
+
+        Args:
+            directory: Directory holding the cache files
+            min_pixels: Images with fewer pixels are not cached
+        """
+        self.directory = directory
+        self.min_pixels = min_pixels
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def _entry_path(self, source_path: str, scale: Optional[Tuple[int, int]],
+                    convert_alpha: bool) -> Optional[str]:
+        """Return the cache file path for a load request (None if the source is missing)."""
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return None
+        key = (f"{os.path.abspath(source_path)}|{stat.st_mtime_ns}|{stat.st_size}|"
+               f"{scale}|{'alpha' if convert_alpha else 'opaque'}")
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest + self.FILE_SUFFIX)
+
+    def load(self, source_path: str, scale: Optional[Tuple[int, int]],
+             convert_alpha: bool, convert: bool = True) -> Optional[pygame.Surface]:
+        """
+        Load a cached image.
+
+        Args:
+            source_path: Path of the source image file
+            scale: Target size the image was scaled to (None = source size)
+            convert_alpha: Whether the image uses per-pixel alpha
+            convert: Convert to the display pixel format; pass False when
+                     loading on a worker thread and convert on the main thread
+
+        Returns:
+            Surface in the display pixel format (a private BGRA copy when
+            not converting or no display mode is set), or None on a cache miss
+        """
+        entry = self._entry_path(source_path, scale, convert_alpha)
+        if entry is None or not os.path.isfile(entry):
+            self.misses += 1
+            return None
+
+        try:
+            with open(entry, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                magic, version, width, height = self._HEADER.unpack_from(data, 0)
+                if (magic != self.MAGIC or version != self.VERSION or
+                        len(data) != self._HEADER.size + width * height * 4):
+                    raise ValueError("corrupt cache file")
+                pixels = memoryview(data)[self._HEADER.size:]
+                try:
+                    # Wraps the mapped pixels without copying; converting
+                    # makes the one copy that outlives the mapping
+                    view = pygame.image.frombuffer(pixels, (width, height), self.PIXEL_FORMAT)
+                    if not convert or pygame.display.get_surface() is None:
+                        img = view.copy()
+                    elif convert_alpha:
+                        img = view.convert_alpha()
+                    else:
+                        img = view.convert()
+                    del view
+                finally:
+                    pixels.release()
+        except (OSError, ValueError, struct.error, pygame.error) as e:
+            logger.warning(f"Discarding unreadable cache file {entry}: {e}")
+            self._remove(entry)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return img
+
+    def store(self, source_path: str, scale: Optional[Tuple[int, int]],
+              convert_alpha: bool, surface: pygame.Surface) -> bool:
+        """
+        Write a decoded image to the cache.
+
+        Args:
+            source_path: Path of the source image file
+            scale: Target size the image was scaled to (None = source size)
+            convert_alpha: Whether the image uses per-pixel alpha
+            surface: Final (decoded, scaled, converted) surface
+
+        Returns:
+            True if a cache file was written
+        """
+        width, height = surface.get_size()
+        if width * height < self.min_pixels:
+            return False
+        entry = self._entry_path(source_path, scale, convert_alpha)
+        if entry is None:
+            return False
+
+        tmp_path = f"{entry}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(self._HEADER.pack(self.MAGIC, self.VERSION, width, height))
+                f.write(pygame.image.tobytes(surface, self.PIXEL_FORMAT))
+            # Atomic rename - readers never see a half-written file
+            os.replace(tmp_path, entry)
+        except (OSError, pygame.error) as e:
+            logger.warning(f"Could not write cache file {entry}: {e}")
+            self._remove(tmp_path)
+            return False
+
+        self.writes += 1
+        return True
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        """Delete a file, ignoring errors."""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def clear(self) -> int:
+        """
+        Delete all cache files.
+
+        Returns:
+            Number of files deleted
+        """
+        removed = 0
+        if not os.path.isdir(self.directory):
+            return 0
+        for name in os.listdir(self.directory):
+            if name.endswith(self.FILE_SUFFIX):
+                self._remove(os.path.join(self.directory, name))
+                removed += 1
+        return removed
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, writes, files and bytes on disk
+        """
+        files = total = 0
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith(self.FILE_SUFFIX):
+                    files += 1
+                    total += os.path.getsize(os.path.join(self.directory, name))
+        return {'hits': self.hits, 'misses': self.misses, 'writes': self.writes,
+                'files': files, 'bytes': total}
+
+    def __repr__(self) -> str:
+        """
+        String representation for debugging.
+
+        Returns:
+            String showing directory and hit/miss counters
+        """
+        return (f"DecodedImageCache(directory={self.directory!r}, hits={self.hits}, "
+                f"misses={self.misses}, writes={self.writes})")
@@ -1,7 +1,8 @@
 """
 Enemy bullet manager for handling enemy projectiles and their collisions.
 """
-import pygame
+from src.entities.bullet_pool import BulletPool, BulletList
+from src.utils.spatial_hash import SpatialHashGrid
 
 
 class EnemyBulletManager:
@@ -20,7 +21,11 @@ class EnemyBulletManager:
         self.screen_height = screen_height
         self.fps = fps
         
-        self.enemy_bullets = []
+        # Bullets live in a NumPy-backed pool; the list facade lets enemies
+        # keep appending EnemyBullet objects as before
+        self.pool = BulletPool()
+        self.enemy_bullets = BulletList(self.pool)
+        self.grid = SpatialHashGrid()
         self.damage_cooldown = 0
     
     def clear(self):
@@ -42,11 +47,36 @@ class EnemyBulletManager:
         Get the list of enemy bullets.
         
         Returns:
-            List of enemy bullets
+            List-like BulletList; appending an EnemyBullet spawns it
         """
         return self.enemy_bullets
     
-    def update_and_draw(self, screen, player, powerup_manager):
+    def update(self, player, powerup_manager):
+        """
+        Move enemy bullets and handle collisions with the player (no drawing).
+        
+        Args:
+            player: Player instance
+            powerup_manager: PowerUpManager instance for shield checking
+        """
+        self.pool.integrate()
+        self._resolve_collisions(player, powerup_manager)
+    
+    def draw(self, screen, doreturn=False, alpha=1.0):
+        """
+        Draw all enemy bullets.
+        
+        Args:
+            screen: Pygame screen surface
+            doreturn: Return the screen areas drawn to (for dirty-rect rendering)
+            alpha: Interpolation between the previous and current tick (see BulletPool.draw)
+
+        Returns:
+            List of drawn Rects if doreturn is set, None otherwise
+        """
+        return self.pool.draw(screen, doreturn, alpha)
+    
+    def update_and_draw(self, screen, player, powerup_manager, doreturn=False):
         """
         Update and draw all enemy bullets, handle collisions with player.
         
@@ -54,24 +84,35 @@ class EnemyBulletManager:
             screen: Pygame screen surface
             player: Player instance
             powerup_manager: PowerUpManager instance for shield checking
+            doreturn: Return the screen areas drawn to (for dirty-rect rendering)
+
+        Returns:
+            List of drawn Rects if doreturn is set, None otherwise
         """
-        for eb in self.enemy_bullets[:]:
-            eb.update()
-            eb.draw(screen)
-            
-            # Remove if off-screen
-            if eb.x < 0 or eb.x > self.screen_width or eb.y < 0 or eb.y > self.screen_height:
-                self.enemy_bullets.remove(eb)
-            # Check collision with player
-            elif player.hit_box.collide(eb.hit_box):
-                if powerup_manager.is_shield_active():
-                    # Shield blocks the bullet
-                    self.enemy_bullets.remove(eb)
-                elif self.damage_cooldown <= 0:
-                    # Deal damage to player
-                    player.hp = max(0, player.hp - eb.ad)
-                    self.damage_cooldown = int(self.fps * 0.75)
-                    self.enemy_bullets.remove(eb)
+        self.pool.integrate()
+        drawn = self.draw(screen, doreturn)
+        self._resolve_collisions(player, powerup_manager)
+        return drawn
+    
+    def _resolve_collisions(self, player, powerup_manager):
+        """Cull off-screen bullets, apply hits on the player and tick the damage cooldown."""
+        pool = self.pool
+        
+        # Remove if off-screen
+        pool.cull_outside(self.screen_width, self.screen_height)
+        
+        # Check collision with player (indices are in firing order)
+        hits = pool.build_grid(self.grid).query_hitbox(player.hit_box)
+        if len(hits):
+            if powerup_manager.is_shield_active():
+                # Shield blocks every bullet that reached the player
+                pool.remove(hits)
+            elif self.damage_cooldown <= 0:
+                # Deal damage to player with the oldest bullet that hit
+                first = hits[0]
+                player.hp = max(0, player.hp - int(pool.damage[first]))
+                self.damage_cooldown = int(self.fps * 0.75)
+                pool.remove(hits[:1])
         
         # Update damage cooldown
         self.damage_cooldown = max(0, self.damage_cooldown - 1)
@@ -1,6 +1,6 @@
-import random
 import pygame
 from src.core.constants import *
+from src.core.rng import rng, SPAWNS
 from src.entities.enemy import *
 from src.entities.enemy_type import EnemyType, EnemyTypeConfig
 
@@ -57,18 +57,19 @@ class EnemySpawner:
                 self.enemies_spawned_in_room += 1
             else:
                 # Fallback to screen edges if no room manager is set
-                r = random.randint(0, 3)
+                rand = rng.stream(SPAWNS)
+                r = rand.randint(0, 3)
                 if r == 0:
-                    x = random.randint(0, SCREEN_WIDTH)
+                    x = rand.randint(0, SCREEN_WIDTH)
                     y = 0
                 elif r == 1:
-                    x = random.randint(0, SCREEN_WIDTH)
+                    x = rand.randint(0, SCREEN_WIDTH)
                     y = SCREEN_HEIGHT
                 elif r == 2:
-                    y = random.randint(0, SCREEN_HEIGHT)
+                    y = rand.randint(0, SCREEN_HEIGHT)
                     x = 0
                 else:
-                    y = random.randint(0, SCREEN_HEIGHT)
+                    y = rand.randint(0, SCREEN_HEIGHT)
                     x = SCREEN_WIDTH - ENEMY_SIZE
 
                 enemy = Enemy(x, y, EnemyType.WEAK, None, level=self.level)
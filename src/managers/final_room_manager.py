@@ -4,6 +4,9 @@ Final Room Manager - Single room with final boss for level 4 (after killing 3 bo
 import pygame
 from src.entities.enemy_type import EnemyType
 from src.core.constants import *
+from src.core.rng import rng, SPAWNS
+from src.ui.text_cache import text_cache, get_font
+from src.managers.resource_manager import resource_manager
 
 
 class FinalRoomNode:
@@ -46,26 +49,13 @@ class FinalRoomManager:
         # Door animation (for exit)
         self.door_opening_progress = 0.0
         self.door_fully_open = False
+        self._exit_door_surface = None  # open exit door scaled to the corridor
 
         # Load gate image for exit corridor
-        try:
-            self.gate_image = pygame.image.load("game/gate.png").convert_alpha()
-        except:
-            try:
-                self.gate_image = pygame.image.load("gate.png").convert_alpha()
-            except:
-                self.gate_image = None
-                print("Warning: Could not load gate.png")
+        self.gate_image = resource_manager.load_image("gate.png")
 
         # Load doors sprite sheet
-        try:
-            self.doors_spritesheet = pygame.image.load("game/doors.png").convert_alpha()
-        except:
-            try:
-                self.doors_spritesheet = pygame.image.load("doors.png").convert_alpha()
-            except:
-                self.doors_spritesheet = None
-                print("Warning: Could not load doors.png")
+        self.doors_spritesheet = resource_manager.load_image("doors.png")
 
         # Door animation configuration
         self.door_frame_count = 5
@@ -75,14 +65,7 @@ class FinalRoomManager:
             self.door_sprite_width = total_width // self.door_frame_count
 
         # Load final-map.png as background for the room
-        try:
-            self.background_image = pygame.image.load("game/final-map.png").convert()
-        except:
-            try:
-                self.background_image = pygame.image.load("final-map.png").convert()
-            except:
-                self.background_image = None
-                print("Warning: Could not load final-map.png")
+        self.background_image = resource_manager.load_image("final-map.png", convert_alpha=False)
 
         # Scale background to fit the room
         if self.background_image:
@@ -93,6 +76,7 @@ class FinalRoomManager:
         """Create the exit corridor after final boss is defeated"""
         self.exit_corridor_open = True
         self.door_opening_progress = 0.0
+        self._exit_door_surface = None
         # Exit is at the top of the room
         corridor_width = 300
         self.exit_corridor = {
@@ -112,6 +96,24 @@ class FinalRoomManager:
                 self.door_opening_progress = 1.0
                 self.door_fully_open = True
 
+    def _get_exit_door(self):
+        """Get the open exit door scaled to the exit corridor (built once)"""
+        if self._exit_door_surface is None:
+            # Get the last frame (index 4) which is fully open
+            frame_rect = pygame.Rect((self.door_frame_count - 1) * self.door_sprite_width, 0,
+                                    self.door_sprite_width, self.door_sprite_height)
+            frame = self.doors_spritesheet.subsurface(frame_rect)
+
+            # Scale to corridor size
+            self._exit_door_surface = pygame.transform.scale(frame,
+                                                             (self.exit_corridor['width'], self.exit_corridor['height']))
+        return self._exit_door_surface
+
+    def get_static_key(self, final_boss_killed, room_cleared):
+        """Describe everything draw() depends on, as a hashable key"""
+        exit_open = bool(final_boss_killed and self.exit_corridor and self.door_fully_open)
+        return ('final', exit_open)
+
     def draw(self, screen, final_boss_killed, room_cleared):
         """Draw the final room and exit corridor if boss is killed"""
         # Draw background image if loaded
@@ -128,15 +130,7 @@ class FinalRoomManager:
             if self.gate_image and self.door_fully_open:
                 # Use the last frame (fully open) from doors.png
                 if self.doors_spritesheet:
-                    # Get the last frame (index 4) which is fully open
-                    frame_rect = pygame.Rect((self.door_frame_count - 1) * self.door_sprite_width, 0,
-                                            self.door_sprite_width, self.door_sprite_height)
-                    frame = self.doors_spritesheet.subsurface(frame_rect)
-
-                    # Scale to corridor size
-                    door_scaled = pygame.transform.scale(frame,
-                                                         (self.exit_corridor['width'], self.exit_corridor['height']))
-                    screen.blit(door_scaled, (self.exit_corridor['x'], self.exit_corridor['y']))
+                    screen.blit(self._get_exit_door(), (self.exit_corridor['x'], self.exit_corridor['y']))
                 else:
                     # Fallback: draw golden rectangle if spritesheet not loaded
                     pygame.draw.rect(screen, (255, 215, 0),  # Gold color
@@ -148,8 +142,8 @@ class FinalRoomManager:
 
                 # Add "VICTORY" text above the golden doors
                 try:
-                    victory_font = pygame.font.SysFont(None, 48)
-                    victory_text = victory_font.render("VICTORY!", True, (255, 215, 0))
+                    victory_font = get_font(None, 48)
+                    victory_text = text_cache.render(victory_font, "VICTORY!", True, (255, 215, 0))
                     text_rect = victory_text.get_rect(center=(self.exit_corridor['x'] + self.exit_corridor['width'] // 2,
                                                              self.room_y - 40))
                     screen.blit(victory_text, text_rect)
@@ -162,11 +156,15 @@ class FinalRoomManager:
         y = max(self.room_y, min(y, self.room_y + self.room_height - size))
         return x, y
 
+    def get_bounds(self):
+        """Return room boundaries"""
+        return self.room_x, self.room_y, self.room_width, self.room_height
+
     def get_random_spawn_position(self):
         """Get random spawn position within room"""
-        import random
-        x = random.randint(self.room_x + 50, self.room_x + self.room_width - 150)
-        y = random.randint(self.room_y + 50, self.room_y + self.room_height - 150)
+        rand = rng.stream(SPAWNS)
+        x = rand.randint(self.room_x + 50, self.room_x + self.room_width - 150)
+        y = rand.randint(self.room_y + 50, self.room_y + self.room_height - 150)
         return x, y
 
     def check_exit_transition(self, player_x, player_y, player_size):
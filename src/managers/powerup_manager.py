@@ -4,6 +4,7 @@ Manages speed boost, shield, and strength power-ups.
 """
 import pygame
 from src.ui.notification import Notification
+from src.ui.text_cache import text_cache
 from src.core.constants import FPS
 
 
@@ -223,6 +224,9 @@ class PowerUpManager:
     def draw_hud(self, screen, font, screen_height, shoe_icon=None, shield_icon=None, sword_icon=None):
         """
         Draw power-up charges HUD.
+
+        Charge labels go through the shared text cache, so they are only
+        re-rendered when a charge count changes.
         
         Args:
             screen: Pygame screen surface
@@ -231,36 +235,43 @@ class PowerUpManager:
             shoe_icon: Optional shoe icon surface
             shield_icon: Optional shield icon surface
             sword_icon: Optional sword icon surface
+
+        Returns:
+            List of Rects drawn to
         """
+        drawn = []  # screen areas drawn to (used by dirty-rect rendering)
+
         # Speed boost
         if self.speed_boost_charges > 0:
             hud_y_offset = screen_height - 100
             if shoe_icon:
-                screen.blit(shoe_icon, (20, hud_y_offset))
-                speed_text = font.render(f"x{self.speed_boost_charges} (E)", True, (255, 255, 0))
-                screen.blit(speed_text, (70, hud_y_offset + 5))
+                drawn.append(screen.blit(shoe_icon, (20, hud_y_offset)))
+                speed_text = text_cache.render(font, f"x{self.speed_boost_charges} (E)", True, (255, 255, 0))
+                drawn.append(screen.blit(speed_text, (70, hud_y_offset + 5)))
             else:
-                speed_text = font.render(f"Buty (E): {self.speed_boost_charges}", True, (255, 255, 0))
-                screen.blit(speed_text, (20, hud_y_offset))
+                speed_text = text_cache.render(font, f"Buty (E): {self.speed_boost_charges}", True, (255, 255, 0))
+                drawn.append(screen.blit(speed_text, (20, hud_y_offset)))
         
         # Shield
         if self.shield_charges > 0:
             shield_y_offset = screen_height - 60
             if shield_icon:
-                screen.blit(shield_icon, (20, shield_y_offset))
-                shield_text = font.render(f"x{self.shield_charges} (R)", True, (100, 200, 255))
-                screen.blit(shield_text, (70, shield_y_offset + 5))
+                drawn.append(screen.blit(shield_icon, (20, shield_y_offset)))
+                shield_text = text_cache.render(font, f"x{self.shield_charges} (R)", True, (100, 200, 255))
+                drawn.append(screen.blit(shield_text, (70, shield_y_offset + 5)))
             else:
-                shield_text = font.render(f"Tarcza (R): {self.shield_charges}", True, (100, 200, 255))
-                screen.blit(shield_text, (20, shield_y_offset))
+                shield_text = text_cache.render(font, f"Tarcza (R): {self.shield_charges}", True, (100, 200, 255))
+                drawn.append(screen.blit(shield_text, (20, shield_y_offset)))
         
         # Strength
         if self.strength_charges > 0:
             strength_y_offset = screen_height - 120
             if sword_icon:
-                screen.blit(sword_icon, (20, strength_y_offset))
-                strength_text = font.render(f"x{self.strength_charges} (T)", True, (255, 100, 100))
-                screen.blit(strength_text, (70, strength_y_offset + 5))
+                drawn.append(screen.blit(sword_icon, (20, strength_y_offset)))
+                strength_text = text_cache.render(font, f"x{self.strength_charges} (T)", True, (255, 100, 100))
+                drawn.append(screen.blit(strength_text, (70, strength_y_offset + 5)))
             else:
-                strength_text = font.render(f"Siła (T): {self.strength_charges}", True, (255, 100, 100))
-                screen.blit(strength_text, (20, strength_y_offset))
+                strength_text = text_cache.render(font, f"Siła (T): {self.strength_charges}", True, (255, 100, 100))
+                drawn.append(screen.blit(strength_text, (20, strength_y_offset)))
+
+        return drawn
@@ -1,7 +1,7 @@
 """
 Power-up pickup manager for handling power-up drops and collection.
 """
-import random
+from src.core.rng import rng, POWERUPS
 from src.entities.powerups.shoe import Shoe
 from src.entities.powerups.shield import Shield
 from src.entities.powerups.strength import Strength
@@ -68,7 +68,7 @@ class PowerUpPickupManager:
             except ValueError:
                 pass
         
-        choice = random.choice(options) if options else 'shoe'
+        choice = rng.stream(POWERUPS).choice(options) if options else 'shoe'
         
         if choice == 'shoe':
             self.current_item = Shoe(max(0, x), max(0, y))
@@ -83,9 +83,13 @@ class PowerUpPickupManager:
         
         Args:
             screen: Pygame screen surface
+
+        Returns:
+            Rect drawn to, or None if there is no item
         """
         if self.current_item:
-            self.current_item.draw(screen)
+            return self.current_item.draw(screen)
+        return None
     
     def check_collection(self, player, powerup_manager, notifications, font):
         """
@@ -0,0 +1,224 @@
+"""
+Background image preloading.
+
+A PreloadJob decodes a manifest of images on a thread pool (file read and
+PNG decode release the GIL, so the game loop keeps running) and hands the
+decoded surfaces back to the main thread, where pump() converts them to
+the display format and stores them in the ResourceManager caches a few
+milliseconds per frame. Screens shown while loading call pump() once per
+frame and can draw `progress`.
+
+The manifests below list what the start screen and each level need;
+ResourceManager.prefetch_level() loads a level manifest and pins it so the
+memory budget never evicts the current level's assets.
+"""
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, List, NamedTuple, Optional, Tuple
+
+from src.managers.texture_atlas import GAMEPLAY_SPRITES, SpriteSpec
+
+logger = logging.getLogger(__name__)
+
+
+class PreloadRequest(NamedTuple):
+    """
+    One image (or sprite sheet) to preload, as later requested by the game.
+
+    Attributes:
+        filename: Image file (resolved like ResourceManager.load_image)
+        scale: Target size (of each frame for sprite sheets), None for the source size
+        convert_alpha: Per-pixel alpha (ignored for sheets, which always use it)
+        frame_size: Frame size for sprite sheets, None for a single image
+    """
+    filename: str
+    scale: Optional[Tuple[int, int]] = None
+    convert_alpha: bool = True
+    frame_size: Optional[Tuple[int, int]] = None
+
+    @classmethod
+    def from_spec(cls, spec: SpriteSpec) -> 'PreloadRequest':
+        """Build the request matching an atlas sprite spec."""
+        return cls(spec.filename, spec.scale, True, spec.frame_size)
+
+
+def startup_manifest(screen_width: int, screen_height: int,
+                     sprites: Iterable[SpriteSpec] = ()) -> List[PreloadRequest]:
+    """
+    Images loaded between the start screen and the first frame of gameplay.
+
+    Args:
+        screen_width: Screen width in pixels (game over screen size)
+        screen_height: Screen height in pixels
+        sprites: Gameplay sprites to preload as well (when no atlas is used)
+
+    Returns:
+        List of preload requests
+    """
+    manifest = [PreloadRequest(name, convert_alpha=False)
+                for name in ("map.png", "map2.png", "map3.png", "map4.png")]
+    manifest += [PreloadRequest(f"room-{n}.png", convert_alpha=False) for n in range(1, 10)]
+    manifest.append(PreloadRequest("gameover.png", (screen_width, screen_height)))
+    manifest.append(PreloadRequest("playagainbutton.png"))
+    manifest += [PreloadRequest.from_spec(spec) for spec in sprites]
+    return manifest
+
+
+# Room backgrounds per level (level 4 reuses the level 3 rooms)
+LEVEL_ROOMS = {1: (1, 2, 3), 2: (4, 5, 6), 3: (7, 8, 9), 4: (7, 8, 9)}
+
+# Atlas sprite names used on every level / only on one level
+COMMON_SPRITES = ("uranek", "fireball", "shoe", "shield", "sword", "gate", "doors")
+LEVEL_SPRITES = {
+    1: ("enemy1", "enemy2", "enemy3", "coal-boss", "coal-boss-fire"),
+    2: ("enemy4", "enemy5", "enemy6", "trash-boss",
+        "trash-boss-fire1", "trash-boss-fire2", "trash-boss-fire3"),
+    3: ("enemy7", "enemy8", "enemy9", "olejman-boss", "olejman-boss-fire"),
+    4: ("enemy1", "enemy2", "enemy3", "final-boss", "final-boss-fire"),
+}
+
+
+def level_manifest(level: int) -> List[PreloadRequest]:
+    """
+    Images a level needs: common sprites, its enemy, boss and boss fire
+    sprites, and its room backgrounds.
+
+    Args:
+        level: Level number (clamped to 1-4)
+
+    Returns:
+        List of preload requests
+    """
+    level = min(max(level, 1), 4)
+    specs = {spec.name: spec for spec in GAMEPLAY_SPRITES}
+    manifest = [PreloadRequest.from_spec(specs[name])
+                for name in COMMON_SPRITES + LEVEL_SPRITES[level]]
+    manifest += [PreloadRequest(f"room-{n}.png", convert_alpha=False) for n in LEVEL_ROOMS[level]]
+    if level == 4:
+        manifest.append(PreloadRequest("final-map.png", convert_alpha=False))
+    return manifest
+
+
+class PreloadJob:
+    """
+    Images decoding on worker threads, finalized on the main thread by pump().
+
+    Attributes:
+        total (int): Number of requests in the manifest
+        completed (int): Requests finalized (or failed) so far
+        failed (List[str]): Filenames that could not be loaded
+
+    Example:
+        >>> job = resource_manager.preload_async(manifest)
+        >>> while not job.done:
+        ...     job.pump(budget_ms=4.0)
+        ...     draw_loading_bar(job.progress)
+    """
+
+    DEFAULT_WORKERS = 4
+    DEFAULT_BUDGET_MS = 4.0
+
+    def __init__(self, requests: List[PreloadRequest],
+                 decode: Callable[[PreloadRequest], object],
+                 finalize: Callable[[PreloadRequest, object], bool],
+                 max_workers: int = DEFAULT_WORKERS) -> None:
+        """
+        Start decoding all requests.
+
+        Args:
+            requests: Requests still missing from the caches
+            decode: Thread-safe function decoding one request (runs on a worker)
+            finalize: Function converting and caching a decoded request
+                      (runs on the main thread, returns False on failure)
+            max_workers: Number of decoder threads
+        """
+        self.total = len(requests)
+        self.completed = 0
+        self.failed: List[str] = []
+        self._finalize = finalize
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Tuple[PreloadRequest, Future]] = []
+        if requests:
+            self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                                thread_name_prefix="preload")
+            self._pending = [(request, self._executor.submit(decode, request))
+                             for request in requests]
+
+    @property
+    def done(self) -> bool:
+        """True once every request has been finalized."""
+        return not self._pending
+
+    @property
+    def progress(self) -> float:
+        """Fraction of requests finalized, from 0.0 to 1.0."""
+        return self.completed / self.total if self.total else 1.0
+
+    def pump(self, budget_ms: float = DEFAULT_BUDGET_MS) -> float:
+        """
+        Finalize decoded images until the time budget is spent.
+
+        At least one decoded image is finalized per call, so loading always
+        advances even if one conversion takes longer than the budget.
+
+        Args:
+            budget_ms: Main-thread time to spend, in milliseconds
+
+        Returns:
+            Current progress (0.0 - 1.0)
+        """
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        still_pending = []
+        for i, (request, future) in enumerate(self._pending):
+            if not future.done():
+                still_pending.append((request, future))
+                continue
+            self._finish(request, future)
+            if time.perf_counter() >= deadline:
+                still_pending.extend(self._pending[i + 1:])
+                break
+        self._pending = still_pending
+        if self.done:
+            self._shutdown()
+        return self.progress
+
+    def wait(self) -> None:
+        """Block until every request is decoded and finalized."""
+        for request, future in self._pending:
+            self._finish(request, future)
+        self._pending = []
+        self._shutdown()
+
+    def cancel(self) -> None:
+        """Stop loading; requests not finalized yet are dropped."""
+        for _, future in self._pending:
+            future.cancel()
+        self._pending = []
+        self._shutdown()
+
+    def _finish(self, request: PreloadRequest, future: Future) -> None:
+        """Finalize one request (waits for its decode if still running)."""
+        try:
+            ok = self._finalize(request, future.result())
+        except Exception as e:
+            logger.error(f"Preloading {request.filename} failed: {e}")
+            ok = False
+        if not ok:
+            self.failed.append(request.filename)
+        self.completed += 1
+
+    def _shutdown(self) -> None:
+        """Release the worker threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def __repr__(self) -> str:
+        """
+        String representation for debugging.
+
+        Returns:
+            String showing progress and failures
+        """
+        return f"PreloadJob(completed={self.completed}/{self.total}, failed={len(self.failed)})"
@@ -7,6 +7,12 @@ efficient resource management system for game assets. It handles:
 - Spritesheet parsing and frame extraction
 - Multiple path resolution strategies for flexibility
 - Memory-efficient asset caching
+- Rotated sprite caching keyed by quantized angle
+- Texture atlas of gameplay sprites (subsurfaces of a few packed pages)
+- Optional on-disk cache of decoded, scaled and converted images
+- Background preloading of image manifests on worker threads
+- Byte accounting with LRU eviction against a memory budget; assets of
+  the current level are pinned and never evicted
 
 The ResourceManager follows SOLID principles:
 - Single Responsibility: Manages only resource loading and caching
@@ -14,14 +20,24 @@ The ResourceManager follows SOLID principles:
 - Dependency Inversion: Uses abstractions (file paths) rather than concrete implementations
 """
 import pygame
-from typing import Optional, List, Tuple, Dict
+from collections import OrderedDict
+from typing import Optional, List, Tuple, Dict, Iterable, Set, Union
 from pathlib import Path
+import io
 import os
 import logging
 
+from src.managers.disk_cache import DecodedImageCache
+from src.managers.preloader import PreloadJob, PreloadRequest, level_manifest
+from src.managers.texture_atlas import GAMEPLAY_SPRITES, SpriteSpec, TextureAtlas, sprite_key
+
 # Configure logging for resource management
 logger = logging.getLogger(__name__)
 
+# Image cache key: ("image", filename, scale, convert_alpha)
+# Spritesheet cache key: ("sheet", filename, (frame_width, frame_height), scale)
+CacheKey = Tuple
+
 
 class ResourceManager:
     """
@@ -40,6 +56,9 @@ class ResourceManager:
         _images: Cache dictionary for loaded images
         _spritesheets: Cache dictionary for parsed spritesheets
         assets_dir: Base directory for game assets
+        cache_bytes: Pixel memory held by cached images and spritesheets
+        memory_budget: Byte limit for cached images and spritesheets (None = unlimited)
+        hits / misses / evictions: Image and spritesheet cache counters
     
     Example:
         >>> rm = ResourceManager()
@@ -52,6 +71,9 @@ class ResourceManager:
     
     # Default configuration
     DEFAULT_ASSETS_DIR = "game"
+    DEFAULT_ROTATION_BUCKETS = 64  # Angle resolution of the rotation cache (5.625°)
+    DEFAULT_ATLAS_DIR = os.path.join("cache", "atlas")  # Packed atlas pages + JSON index
+    DEFAULT_DISK_CACHE_DIR = os.path.join("cache", "decoded")  # Raw decoded images
     
     def __new__(cls) -> 'ResourceManager':
         """
@@ -79,9 +101,26 @@ class ResourceManager:
         if self._initialized:
             return
         
-        self._images: Dict[str, pygame.Surface] = {}  # Cache for loaded images
-        self._spritesheets: Dict[str, List[pygame.Surface]] = {}  # Cache for spritesheets
+        self._images: Dict[CacheKey, pygame.Surface] = {}  # Cache for loaded images
+        self._spritesheets: Dict[CacheKey, List[pygame.Surface]] = {}  # Cache for spritesheets
+        # Use order of both caches (least recently used first) -> bytes held
+        self._lru: 'OrderedDict[CacheKey, int]' = OrderedDict()
+        self._pinned: Set[CacheKey] = set()  # Keys the budget never evicts
+        self.cache_bytes = 0
+        self.memory_budget: Optional[int] = None  # see set_memory_budget()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Cache for rotated sprites: (sprite key, angle bucket) -> surface
+        self._rotations: Dict[Tuple[str, int], pygame.Surface] = {}
+        self.rotation_buckets = self.DEFAULT_ROTATION_BUCKETS
+        self._rotation_hits = 0
+        self._rotation_misses = 0
+        self._rotation_bytes = 0
         self.assets_dir = self.DEFAULT_ASSETS_DIR  # Main assets folder
+        self.atlas_dir = self.DEFAULT_ATLAS_DIR
+        self._atlas: Optional[TextureAtlas] = None
+        self.disk_cache: Optional[DecodedImageCache] = None  # see enable_disk_cache()
         self._initialized = True
         
         logger.info(f"ResourceManager initialized with assets directory: {self.assets_dir}")
@@ -159,31 +198,65 @@ class ResourceManager:
             >>> sprite = rm.load_image("player.png", scale=(64, 64))
             >>> background = rm.load_image("bg.jpg", convert_alpha=False)
         """
+        # Sprites packed into the texture atlas are served from it
+        if convert_alpha and self._atlas is not None:
+            frames = self._atlas.find(sprite_key(filename, None, scale))
+            if frames:
+                return frames[0]
+        
         # Create unique cache key including all transformation parameters
-        cache_key = f"{filename}_{scale}_{convert_alpha}"
+        cache_key = self._image_key(filename, scale, convert_alpha)
         
         # Return cached image if available (performance optimization)
-        if cache_key in self._images:
+        img = self._cache_get(cache_key)
+        if img is not None:
             logger.debug(f"Cache hit for image: {filename}")
-            return self._images[cache_key]
+            return img
+        
+        img = self._load_uncached(filename, scale, convert_alpha)
+        if img is None:
+            return None
+        
+        # Cache the processed image for future use
+        self._cache_put(cache_key, img)
+        logger.info(f"Cached image: {filename} (cache size: {len(self._images)})")
+        
+        return img
+    
+    def _load_uncached(self, filename: str, scale: Optional[Tuple[int, int]] = None,
+                       convert_alpha: bool = True) -> Optional[pygame.Surface]:
+        """
+        Load, convert and scale an image from disk, bypassing all caches.
+        
+        Args:
+            filename: Name or path of the image file
+            scale: Optional tuple (width, height) to resize the image
+            convert_alpha: Whether to convert with alpha channel for transparency
+            
+        Returns:
+            Loaded pygame.Surface or None if file not found
+        """
+        # Decoded images from earlier runs (keyed by source file and parameters)
+        source_path = self._resolve_path(filename) if self.disk_cache is not None else None
+        if source_path is not None:
+            img = self.disk_cache.load(source_path, scale, convert_alpha)
+            if img is not None:
+                logger.debug(f"Disk cache hit for image: {filename}")
+                return img
         
-        # Try multiple path strategies to find the file
-        paths = self._get_possible_paths(filename)
         # Try multiple path strategies to find the file
         paths = self._get_possible_paths(filename)
         
         img = None
-        successful_path = None
         
         for path in paths:
             try:
-                # Load image with appropriate conversion
-                if convert_alpha:
-                    img = pygame.image.load(path).convert_alpha()
-                else:
-                    img = pygame.image.load(path).convert()
+                # Load image with appropriate conversion (needs a display mode;
+                # headless simulations use the file's own pixel format)
+                img = pygame.image.load(path)
+                if pygame.display.get_surface() is not None:
+                    img = img.convert_alpha() if convert_alpha else img.convert()
                 
-                successful_path = path
                 logger.debug(f"Successfully loaded image from: {path}")
                 break
                 
@@ -206,13 +279,20 @@ class ResourceManager:
             except Exception as e:
                 logger.error(f"Failed to scale image {filename}: {e}")
                 # Return unscaled image rather than None
+                scale = None
         
-        # Cache the processed image for future use
-        self._images[cache_key] = img
-        logger.info(f"Cached image: {filename} (cache size: {len(self._images)})")
+        if source_path is not None:
+            self.disk_cache.store(source_path, scale, convert_alpha, img)
         
         return img
     
+    def _resolve_path(self, filename: str) -> Optional[str]:
+        """Return the first existing path of a file (same search order as loading)."""
+        for path in self._get_possible_paths(filename):
+            if os.path.isfile(path):
+                return path
+        return None
+    
     def load_spritesheet(self, filename: str, frame_width: int, frame_height: int,
                         scale: Optional[Tuple[int, int]] = None) -> List[pygame.Surface]:
         """
@@ -241,13 +321,20 @@ class ResourceManager:
             >>> frames = rm.load_spritesheet("walk.png", 32, 32, scale=(64, 64))
             >>> # frames now contains scaled animation frames
         """
+        # Sheets packed into the texture atlas are served from it
+        if self._atlas is not None:
+            frames = self._atlas.find(sprite_key(filename, (frame_width, frame_height), scale))
+            if frames is not None:
+                return frames
+        
         # Create cache key including all parameters
-        cache_key = f"{filename}_{frame_width}_{frame_height}_{scale}"
+        cache_key = self._sheet_key(filename, frame_width, frame_height, scale)
         
         # Return cached spritesheet if available
-        if cache_key in self._spritesheets:
+        frames = self._cache_get(cache_key)
+        if frames is not None:
             logger.debug(f"Cache hit for spritesheet: {filename}")
-            return self._spritesheets[cache_key]
+            return frames
         
         # Load the full spritesheet image
         sheet = self.load_image(filename, convert_alpha=True)
@@ -255,13 +342,34 @@ class ResourceManager:
             logger.error(f"Failed to load spritesheet: {filename}")
             return []
         
+        frames = self._slice_spritesheet(sheet, frame_width, frame_height, scale)
+        
+        # Cache the parsed frames
+        self._cache_put(cache_key, frames)
+        logger.info(f"Cached spritesheet: {filename} ({len(frames)} frames)")
+        
+        return frames
+    
+    @staticmethod
+    def _slice_spritesheet(sheet: pygame.Surface, frame_width: int, frame_height: int,
+                           scale: Optional[Tuple[int, int]] = None) -> List[pygame.Surface]:
+        """
+        Cut a single-row spritesheet into (optionally scaled) frames.
+        
+        Args:
+            sheet: Spritesheet surface
+            frame_width: Width of each individual frame in pixels
+            frame_height: Height of each frame in pixels
+            scale: Optional tuple (width, height) to resize each frame
+            
+        Returns:
+            List of new frame surfaces
+        """
         # Calculate number of frames based on sheet dimensions
         sheet_width, sheet_height = sheet.get_size()
         num_frames = sheet_width // frame_width
         frames: List[pygame.Surface] = []
         
-        logger.debug(f"Parsing spritesheet {filename}: {num_frames} frames")
-        
         # Extract each frame from the sheet
         for col in range(num_frames):
             # Define the rectangle for this frame
@@ -287,12 +395,483 @@ class ResourceManager:
             
             frames.append(frame)
         
-        # Cache the parsed frames
-        self._spritesheets[cache_key] = frames
-        logger.info(f"Cached spritesheet: {filename} ({len(frames)} frames)")
-        
         return frames
     
+    def set_rotation_buckets(self, buckets: int) -> None:
+        """
+        Configure how many angle buckets the rotation cache uses.
+        
+        More buckets give smoother rotation at the cost of memory. Changing
+        the value drops all cached rotations.
+        
+        Args:
+            buckets: Number of buckets covering 360 degrees (e.g. 64 or 128)
+            
+        Raises:
+            ValueError: If buckets is not positive
+        """
+        if buckets <= 0:
+            raise ValueError(f"Rotation buckets must be positive, got {buckets}")
+        self.rotation_buckets = int(buckets)
+        self.clear_rotation_cache()
+    
+    def rotation_bucket(self, angle_degrees: float) -> int:
+        """
+        Quantize an angle to the nearest rotation bucket.
+        
+        Args:
+            angle_degrees: Rotation in degrees (as passed to pygame.transform.rotate)
+            
+        Returns:
+            Bucket index in range [0, rotation_buckets)
+        """
+        return int(round(angle_degrees * self.rotation_buckets / 360.0)) % self.rotation_buckets
+    
+    def get_rotated_bucket(self, key: str, surface: pygame.Surface, bucket: int) -> pygame.Surface:
+        """
+        Get a sprite rotated to the angle of a bucket, rotating it only once.
+        
+        Args:
+            key: Unique name of the source surface (e.g. "fireball.png#2")
+            surface: Unrotated source surface
+            bucket: Bucket index from rotation_bucket()
+            
+        Returns:
+            Cached rotated surface (the source itself for bucket 0)
+        """
+        if bucket == 0:
+            return surface
+        
+        cache_key = (key, bucket)
+        rotated = self._rotations.get(cache_key)
+        if rotated is not None:
+            self._rotation_hits += 1
+            return rotated
+        
+        self._rotation_misses += 1
+        rotated = pygame.transform.rotate(surface, bucket * 360.0 / self.rotation_buckets)
+        self._rotations[cache_key] = rotated
+        self._rotation_bytes += self.surface_bytes(rotated)
+        return rotated
+    
+    def get_rotated(self, key: str, surface: pygame.Surface, angle_degrees: float) -> pygame.Surface:
+        """
+        Get a sprite rotated by (approximately) the given angle.
+        
+        The angle is quantized to rotation_buckets steps, so firing and
+        drawing projectiles reuses a small set of pre-rotated surfaces
+        instead of calling pygame.transform.rotate every time.
+        
+        Args:
+            key: Unique name of the source surface (e.g. "coal-boss-fire.png")
+            surface: Unrotated source surface
+            angle_degrees: Rotation in degrees (as passed to pygame.transform.rotate)
+            
+        Returns:
+            Cached rotated surface
+            
+        Example:
+            >>> rm = ResourceManager()
+            >>> sprite = rm.get_rotated("fireball.png#0", frame, -45.0)
+        """
+        return self.get_rotated_bucket(key, surface, self.rotation_bucket(angle_degrees))
+    
+    def get_rotated_frames(self, key: str, frames: List[pygame.Surface],
+                           angle_degrees: float) -> List[pygame.Surface]:
+        """
+        Get all frames of an animation rotated by the given angle.
+        
+        Args:
+            key: Unique name of the animation (frame index is appended)
+            frames: Unrotated animation frames
+            angle_degrees: Rotation in degrees
+            
+        Returns:
+            List of cached rotated frames
+        """
+        bucket = self.rotation_bucket(angle_degrees)
+        return [self.get_rotated_bucket(f"{key}#{i}", frame, bucket)
+                for i, frame in enumerate(frames)]
+    
+    def prebake_rotations(self, key: str, frames: List[pygame.Surface]) -> None:
+        """
+        Fill the rotation cache for every bucket of an animation.
+        
+        Call this at level start so no rotation happens during gameplay.
+        
+        Args:
+            key: Unique name of the animation (same key as used for lookups)
+            frames: Unrotated animation frames
+        """
+        for bucket in range(1, self.rotation_buckets):
+            for i, frame in enumerate(frames):
+                cache_key = (f"{key}#{i}", bucket)
+                if cache_key not in self._rotations:
+                    self.get_rotated_bucket(cache_key[0], frame, bucket)
+        logger.info(f"Prebaked {self.rotation_buckets} rotations for: {key}")
+    
+    def clear_rotation_cache(self) -> None:
+        """Drop all cached rotated sprites and reset rotation statistics."""
+        self._rotations.clear()
+        self._rotation_hits = 0
+        self._rotation_misses = 0
+        self._rotation_bytes = 0
+    
+    def enable_disk_cache(self, directory: str = DEFAULT_DISK_CACHE_DIR,
+                          min_pixels: int = DecodedImageCache.DEFAULT_MIN_PIXELS) -> DecodedImageCache:
+        """
+        Keep decoded images on disk so later runs skip PNG decoding and scaling.
+        
+        Args:
+            directory: Directory for the cache files
+            min_pixels: Images with fewer pixels are not cached
+            
+        Returns:
+            The active DecodedImageCache
+        """
+        self.disk_cache = DecodedImageCache(directory, min_pixels)
+        logger.info(f"Disk cache enabled: {directory}")
+        return self.disk_cache
+    
+    @staticmethod
+    def _image_key(filename: str, scale: Optional[Tuple[int, int]], convert_alpha: bool) -> CacheKey:
+        """Cache key of a load_image() request."""
+        return ("image", filename, tuple(scale) if scale else None, convert_alpha)
+    
+    @staticmethod
+    def _sheet_key(filename: str, frame_width: int, frame_height: int,
+                   scale: Optional[Tuple[int, int]]) -> CacheKey:
+        """Cache key of a load_spritesheet() request."""
+        return ("sheet", filename, (frame_width, frame_height), tuple(scale) if scale else None)
+    
+    def _request_key(self, request: PreloadRequest) -> CacheKey:
+        """Cache key a preload request ends up under."""
+        if request.frame_size is None:
+            return self._image_key(request.filename, request.scale, request.convert_alpha)
+        return self._sheet_key(request.filename, request.frame_size[0], request.frame_size[1], request.scale)
+    
+    @staticmethod
+    def surface_bytes(surface: pygame.Surface) -> int:
+        """
+        Pixel memory of a surface, including row padding.
+        
+        A subsurface counts the pixels it covers. They belong to its parent,
+        so they are counted twice if the parent is measured as well.
+        """
+        if surface.get_parent() is not None:
+            return surface.get_width() * surface.get_height() * surface.get_bytesize()
+        return surface.get_pitch() * surface.get_height()
+    
+    def _cache_get(self, key: CacheKey) -> Union[pygame.Surface, List[pygame.Surface], None]:
+        """Look up an image or spritesheet and mark it as recently used."""
+        store = self._images if key[0] == "image" else self._spritesheets
+        value = store.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._lru.move_to_end(key)
+        return value
+    
+    def _cache_put(self, key: CacheKey, value: Union[pygame.Surface, List[pygame.Surface]]):
+        """
+        Cache an image or spritesheet, evicting old entries over the budget.
+        
+        Returns:
+            The cached value (an existing entry wins over the new one)
+        """
+        store = self._images if key[0] == "image" else self._spritesheets
+        if key in store:
+            return store[key]
+        store[key] = value
+        frames = value if isinstance(value, list) else (value,)
+        nbytes = sum(self.surface_bytes(frame) for frame in frames)
+        self._lru[key] = nbytes
+        self.cache_bytes += nbytes
+        self._enforce_budget(keep=key)
+        return value
+    
+    def _evict(self, key: CacheKey) -> None:
+        """Remove one entry from the caches."""
+        self._discard(key)
+        self.evictions += 1
+        logger.debug(f"Evicted {key[0]}: {key[1]}")
+    
+    def _discard(self, key: CacheKey) -> None:
+        """Remove one entry from the caches (not counted as an eviction)."""
+        store = self._images if key[0] == "image" else self._spritesheets
+        store.pop(key, None)
+        self.cache_bytes -= self._lru.pop(key, 0)
+    
+    def _enforce_budget(self, keep: Optional[CacheKey] = None) -> None:
+        """Evict least recently used, unpinned entries until the caches fit the budget."""
+        if self.memory_budget is None or self.cache_bytes <= self.memory_budget:
+            return
+        for key in list(self._lru):
+            if self.cache_bytes <= self.memory_budget:
+                break
+            if key != keep and key not in self._pinned:
+                self._evict(key)
+        if self.cache_bytes > self.memory_budget:
+            logger.warning(f"Pinned assets exceed the memory budget "
+                           f"({self.cache_bytes} > {self.memory_budget} bytes)")
+    
+    def _drop_all(self) -> None:
+        """Empty the image and spritesheet caches (not counted as evictions)."""
+        self._images.clear()
+        self._spritesheets.clear()
+        self._lru.clear()
+        self.cache_bytes = 0
+    
+    def set_memory_budget(self, budget_bytes: Optional[int]) -> None:
+        """
+        Limit the pixel memory of cached images and spritesheets.
+        
+        When the limit is exceeded the least recently used entries are
+        evicted (pinned entries never are) and reloaded on next use.
+        
+        Args:
+            budget_bytes: Byte limit, or None for no limit
+            
+        Raises:
+            ValueError: If budget_bytes is negative
+        """
+        if budget_bytes is not None and budget_bytes < 0:
+            raise ValueError(f"Memory budget must not be negative, got {budget_bytes}")
+        self.memory_budget = budget_bytes
+        self._enforce_budget()
+    
+    def pin(self, manifest: Iterable[PreloadRequest]) -> None:
+        """
+        Protect the assets of a manifest from eviction (replaces earlier pins).
+        
+        Args:
+            manifest: Requests whose cached images/spritesheets must stay loaded
+        """
+        self._pinned = {self._request_key(request) for request in manifest}
+        # Previously pinned assets may now be over the budget
+        self._enforce_budget()
+    
+    def prefetch_level(self, level: int, wait: bool = True,
+                       max_workers: int = PreloadJob.DEFAULT_WORKERS) -> PreloadJob:
+        """
+        Load and pin everything a level needs, unpinning the previous level.
+        
+        Enemy and boss sheets are otherwise loaded on first spawn, which
+        stalls that frame; prefetching decodes them in parallel up front.
+        
+        Args:
+            level: Level number
+            wait: Finish loading before returning (otherwise pump() the job)
+            max_workers: Number of decoder threads
+            
+        Returns:
+            The PreloadJob (already done when wait is True)
+        """
+        manifest = level_manifest(level)
+        self.pin(manifest)
+        job = self.preload_async(manifest, max_workers)
+        if wait:
+            job.wait()
+        return job
+    
+    def preload_async(self, manifest: Iterable[PreloadRequest],
+                      max_workers: int = PreloadJob.DEFAULT_WORKERS) -> PreloadJob:
+        """
+        Start decoding images on background threads.
+        
+        Files are read and decoded (and scaled, where the pixel format
+        allows) on worker threads. Call pump() on the returned job once per
+        frame to convert the decoded images on the main thread and put them
+        in the caches; afterwards load_image() and load_spritesheet() return
+        them without touching the disk. Requests already cached are skipped.
+        
+        Args:
+            manifest: Images and sprite sheets to load
+            max_workers: Number of decoder threads
+            
+        Returns:
+            PreloadJob tracking the progress
+        """
+        requests = [request for request in manifest if not self._is_cached(request)]
+        logger.info(f"Preloading {len(requests)} images on {max_workers} threads")
+        return PreloadJob(requests, self._decode_request, self._finalize_request, max_workers)
+    
+    def _is_cached(self, request: PreloadRequest) -> bool:
+        """Whether a preload request is already served from the atlas or memory."""
+        key = self._request_key(request)
+        return self._served_by_atlas(key) or key in self._lru
+    
+    def _served_by_atlas(self, key: CacheKey) -> bool:
+        """Whether load_image()/load_spritesheet() answer a cache key from the atlas."""
+        if self._atlas is None:
+            return False
+        if key[0] == "image":
+            _, filename, scale, convert_alpha = key
+            return convert_alpha and self._atlas.find(sprite_key(filename, None, scale)) is not None
+        _, filename, frame_size, scale = key
+        return self._atlas.find(sprite_key(filename, frame_size, scale)) is not None
+    
+    def _decode_request(self, request: PreloadRequest) -> Optional[Tuple[pygame.Surface, str, Optional[Tuple[int, int]]]]:
+        """
+        Decode a preload request (runs on a worker thread, touches no shared cache).
+        
+        Args:
+            request: Image to decode
+            
+        Returns:
+            (unconverted surface, source path, scale still to apply), or None
+            if the file cannot be found or decoded
+        """
+        source_path = self._resolve_path(request.filename)
+        if source_path is None:
+            return None
+        # Sheets are cached unscaled with alpha; frames are scaled when sliced
+        target_scale = request.scale if request.frame_size is None else None
+        convert_alpha = request.convert_alpha or request.frame_size is not None
+        
+        if self.disk_cache is not None:
+            img = self.disk_cache.load(source_path, target_scale, convert_alpha, convert=False)
+            if img is not None:
+                return img, source_path, None
+        
+        with open(source_path, "rb") as f:
+            data = f.read()
+        img = pygame.image.load(io.BytesIO(data), source_path)
+        
+        # smoothscale needs 24/32-bit pixels; other formats are scaled
+        # after the main-thread conversion
+        if target_scale and img.get_bitsize() not in (24, 32):
+            return img, source_path, target_scale
+        if target_scale:
+            img = pygame.transform.smoothscale(img, target_scale)
+        if self.disk_cache is not None:
+            self.disk_cache.store(source_path, target_scale, convert_alpha, img)
+        return img, source_path, None
+    
+    def _finalize_request(self, request: PreloadRequest,
+                          decoded: Optional[Tuple[pygame.Surface, str, Optional[Tuple[int, int]]]]) -> bool:
+        """
+        Convert a decoded image to the display format and cache it (main thread).
+        
+        Args:
+            request: The preload request
+            decoded: Result of _decode_request()
+            
+        Returns:
+            True if the image was cached
+        """
+        if decoded is None:
+            logger.warning(f"Could not preload image: {request.filename}")
+            print(f"⚠️  Could not load image: {request.filename}")
+            return False
+        img, source_path, pending_scale = decoded
+        convert_alpha = request.convert_alpha or request.frame_size is not None
+        
+        if pygame.display.get_surface() is not None:
+            img = img.convert_alpha() if convert_alpha else img.convert()
+        if pending_scale:
+            img = pygame.transform.smoothscale(img, pending_scale)
+            if self.disk_cache is not None:
+                self.disk_cache.store(source_path, pending_scale, convert_alpha, img)
+        
+        if request.frame_size is None:
+            self._cache_put(self._image_key(request.filename, request.scale, request.convert_alpha), img)
+            return True
+        
+        frame_width, frame_height = request.frame_size
+        sheet_key = self._sheet_key(request.filename, frame_width, frame_height, request.scale)
+        if sheet_key not in self._spritesheets:
+            sheet = self._cache_put(self._image_key(request.filename, None, True), img)
+            self._cache_put(sheet_key, self._slice_spritesheet(sheet, frame_width, frame_height, request.scale))
+        return True
+    
+    def _load_spec_frames(self, spec: SpriteSpec) -> List[pygame.Surface]:
+        """Load the final frames of an atlas sprite, bypassing all caches."""
+        if spec.frame_size is None:
+            img = self._load_uncached(spec.filename, spec.scale)
+            return [img] if img is not None else []
+        sheet = self._load_uncached(spec.filename)
+        if sheet is None:
+            return []
+        return self._slice_spritesheet(sheet, spec.frame_size[0], spec.frame_size[1], spec.scale)
+    
+    def build_atlas(self, specs: Tuple[SpriteSpec, ...] = GAMEPLAY_SPRITES,
+                    force: bool = False) -> TextureAtlas:
+        """
+        Load the texture atlas from atlas_dir, packing it first if needed.
+        
+        The saved atlas is reused unless a sprite spec or a source image
+        changed. Afterwards load_image() and load_spritesheet() return
+        atlas subsurfaces for every packed request, and cached copies of
+        those requests are dropped.
+        
+        Call this after the display mode is set, so the pages are converted
+        to the display pixel format.
+        
+        Args:
+            specs: Sprites to pack (default: all gameplay sprites)
+            force: Repack even if the saved atlas is up to date
+            
+        Returns:
+            The active TextureAtlas
+        """
+        atlas = None if force else TextureAtlas.load(self.atlas_dir)
+        if atlas is None or not atlas.is_fresh(specs, self._resolve_path):
+            atlas = TextureAtlas.build(specs, self._load_spec_frames, self._resolve_path)
+            try:
+                atlas.save(self.atlas_dir)
+                logger.info(f"Saved texture atlas to {self.atlas_dir}")
+            except (OSError, pygame.error) as e:
+                logger.warning(f"Could not save texture atlas: {e}")
+        
+        self._atlas = atlas
+        # Standalone copies of packed sprites are no longer needed; everything
+        # else (e.g. preloaded backgrounds and screens) stays cached
+        for key in [key for key in self._lru if self._served_by_atlas(key)]:
+            self._discard(key)
+        logger.info(f"Using {atlas}")
+        return atlas
+    
+    @property
+    def atlas(self) -> Optional[TextureAtlas]:
+        """The active texture atlas (None until build_atlas() is called)."""
+        return self._atlas
+    
+    def get_sprite(self, name: str, frame: int = 0) -> Optional[pygame.Surface]:
+        """
+        Get one frame of a packed sprite.
+        
+        Args:
+            name: Sprite name from the atlas specs (e.g. "enemy3", "fireball")
+            frame: Frame index (wraps around)
+            
+        Returns:
+            Subsurface of an atlas page, or None if there is no atlas or sprite
+            
+        Example:
+            >>> rm = ResourceManager()
+            >>> rm.build_atlas()
+            >>> sprite = rm.get_sprite("coal-boss", 1)
+        """
+        if self._atlas is None:
+            return None
+        return self._atlas.get(name, frame)
+    
+    def get_sprite_frames(self, name: str) -> List[pygame.Surface]:
+        """
+        Get all frames of a packed sprite.
+        
+        Args:
+            name: Sprite name from the atlas specs
+            
+        Returns:
+            List of atlas subsurfaces (empty if there is no atlas or sprite)
+        """
+        if self._atlas is None:
+            return []
+        return self._atlas.frames(name)
+    
     def clear_cache(self) -> None:
         """
         Clear all cached resources to free memory.
@@ -307,8 +886,8 @@ class ResourceManager:
         image_count = len(self._images)
         sheet_count = len(self._spritesheets)
         
-        self._images.clear()
-        self._spritesheets.clear()
+        self._drop_all()
+        self.clear_rotation_cache()
         
         logger.info(f"Cache cleared: {image_count} images, {sheet_count} spritesheets")
     
@@ -340,7 +919,7 @@ class ResourceManager:
         
         logger.info(f"Preloaded {loaded}/{len(resource_list)} resources successfully")
     
-    def get_cache_stats(self) -> Dict[str, int]:
+    def get_cache_stats(self) -> Dict[str, float]:
         """
         Get statistics about cached resources.
         
@@ -348,12 +927,46 @@ class ResourceManager:
             Dictionary with cache statistics:
             - 'images': Number of cached images
             - 'spritesheets': Number of cached spritesheets
+            - 'rotations': Number of cached rotated sprites
+            - 'rotation_hits': Rotation lookups served from cache
+            - 'rotation_misses': Rotation lookups that had to rotate
+            - 'rotation_hit_rate': Hits / lookups (0.0 when unused)
+            - 'rotation_bytes': Pixel memory held by rotated sprites
+            - 'hits' / 'misses' / 'evictions': Image and spritesheet cache counters
+            - 'hit_rate': Hits / lookups (0.0 when unused)
+            - 'bytes': Pixel memory of cached images and spritesheets (what
+              the memory budget limits)
+            - 'budget': Memory budget in bytes (None = unlimited)
+            - 'pinned': Number of pinned cache keys
+            - 'atlas_pages': Number of texture atlas pages (0 without an atlas)
+            - 'atlas_sprites': Number of sprites packed in the atlas
+            - 'atlas_bytes': Pixel memory of the atlas pages
+            - 'total_bytes': bytes + rotation_bytes + atlas_bytes
             - 'total': Total cached items
         """
+        lookups = self._rotation_hits + self._rotation_misses
+        cache_lookups = self.hits + self.misses
+        atlas_bytes = sum(self.surface_bytes(page) for page in self._atlas.pages) if self._atlas is not None else 0
         return {
             'images': len(self._images),
             'spritesheets': len(self._spritesheets),
-            'total': len(self._images) + len(self._spritesheets)
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': (self.hits / cache_lookups) if cache_lookups else 0.0,
+            'bytes': self.cache_bytes,
+            'budget': self.memory_budget,
+            'pinned': len(self._pinned),
+            'rotations': len(self._rotations),
+            'rotation_hits': self._rotation_hits,
+            'rotation_misses': self._rotation_misses,
+            'rotation_hit_rate': (self._rotation_hits / lookups) if lookups else 0.0,
+            'rotation_bytes': self._rotation_bytes,
+            'atlas_pages': len(self._atlas.pages) if self._atlas is not None else 0,
+            'atlas_sprites': len(self._atlas) if self._atlas is not None else 0,
+            'atlas_bytes': atlas_bytes,
+            'total_bytes': self.cache_bytes + self._rotation_bytes + atlas_bytes,
+            'total': len(self._images) + len(self._spritesheets) + len(self._rotations)
         }
     
     def __repr__(self) -> str:
@@ -365,7 +978,9 @@ class ResourceManager:
         """
         stats = self.get_cache_stats()
         return (f"ResourceManager(images={stats['images']}, "
-                f"spritesheets={stats['spritesheets']})")
+                f"spritesheets={stats['spritesheets']}, "
+                f"rotations={stats['rotations']}, "
+                f"bytes={stats['total_bytes']})")
 
 
 # Global instance for convenient access
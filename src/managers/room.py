@@ -1,5 +1,6 @@
 import pygame
 from src.core.constants import *
+from src.core.rng import rng, SPAWNS
 
 
 class Room:
@@ -40,23 +41,23 @@ class Room:
 
     def get_random_spawn_position(self):
         """Get a random position on one of the room edges for enemy spawning."""
-        import random
+        rand = rng.stream(SPAWNS)
 
         # Choose random edge: 0=top, 1=bottom, 2=left, 3=right
-        edge = random.randint(0, 3)
+        edge = rand.randint(0, 3)
 
         if edge == 0:  # Top edge
-            x = random.randint(self.x, self.x + self.width - ENEMY_SIZE)
+            x = rand.randint(self.x, self.x + self.width - ENEMY_SIZE)
             y = self.y
         elif edge == 1:  # Bottom edge
-            x = random.randint(self.x, self.x + self.width - ENEMY_SIZE)
+            x = rand.randint(self.x, self.x + self.width - ENEMY_SIZE)
             y = self.y + self.height - ENEMY_SIZE
         elif edge == 2:  # Left edge
             x = self.x
-            y = random.randint(self.y, self.y + self.height - ENEMY_SIZE)
+            y = rand.randint(self.y, self.y + self.height - ENEMY_SIZE)
         else:  # Right edge
             x = self.x + self.width - ENEMY_SIZE
-            y = random.randint(self.y, self.y + self.height - ENEMY_SIZE)
+            y = rand.randint(self.y, self.y + self.height - ENEMY_SIZE)
 
         return x, y
 
@@ -1,8 +1,10 @@
 import pygame
-import random
 from src.core.constants import *
+from src.core.rng import rng, ROOMS, SPAWNS
 from src.utils.hitbox import*
 from src.entities.enemy_type import EnemyType
+from src.ui.text_cache import text_cache, get_font
+from src.managers.resource_manager import resource_manager
 
 
 class RoomNode:
@@ -16,7 +18,7 @@ class RoomNode:
             'right': None
         }
         # Each room has a random enemy type
-        self.enemy_type = random.choice([EnemyType.WEAK, EnemyType.MEDIUM, EnemyType.STRONG])
+        self.enemy_type = rng.stream(ROOMS).choice([EnemyType.WEAK, EnemyType.MEDIUM, EnemyType.STRONG])
 
 
 class Corridor:
@@ -77,6 +79,11 @@ class Corridor:
 
 class RoomManager:
     """Manages 6 rooms with random connections"""
+
+    # Rotation (degrees) applied to the gate image / door frames for each corridor
+    GATE_ROTATIONS = {'top': -90, 'bottom': -270, 'left': 0, 'right': 180}
+    DOOR_ROTATIONS = {'top': 0, 'right': -90, 'bottom': -180, 'left': -270}
+
     def __init__(self, screen_width, screen_height, margin_pixels=100):
         self.screen_width = screen_width
         self.screen_height = screen_height
@@ -99,24 +106,10 @@ class RoomManager:
         }
 
         # Load gate image for corridors
-        try:
-            self.gate_image = pygame.image.load("game/gate.png").convert_alpha()
-        except:
-            try:
-                self.gate_image = pygame.image.load("gate.png").convert_alpha()
-            except:
-                self.gate_image = None
-                print("Warning: Could not load gate.png")
+        self.gate_image = resource_manager.load_image("gate.png")
 
         # Load doors sprite sheet
-        try:
-            self.doors_spritesheet = pygame.image.load("game/doors.png").convert_alpha()
-        except:
-            try:
-                self.doors_spritesheet = pygame.image.load("doors.png").convert_alpha()
-            except:
-                self.doors_spritesheet = None
-                print("Warning: Could not load doors.png")
+        self.doors_spritesheet = resource_manager.load_image("doors.png")
 
         # Door animation configuration
         # Sprite sheet is 2500x150 (5 frames of 500x150 each)
@@ -131,6 +124,15 @@ class RoomManager:
         self.door_opening_progress = {}  # direction -> progress (0.0 to 1.0)
         self.door_fully_open = {}  # direction -> boolean
 
+        # Pre-transformed corridor graphics (filled by _build_corridors).
+        # Corridor geometry only depends on the direction, so surfaces are
+        # kept per direction and reused by every room.
+        self._sheet_door_frames = None  # unrotated frames cut from doors.png
+        self._gate_surfaces = {}  # direction -> rotated + scaled gate
+        self._golden_gate_surfaces = {}  # direction -> gate with golden tint
+        self._door_surfaces = {}  # direction -> [rotated + scaled door frame per animation step]
+        self._gate_blits = []  # (surface, position) for every active corridor of current room
+
         # Generate 6 rooms with random connections
         self.rooms = self._generate_6_rooms()
 
@@ -163,11 +165,12 @@ class RoomManager:
         unconnected = {1, 2, 3, 4, 5}
 
         directions = ['top', 'bottom', 'left', 'right']
+        rand = rng.stream(ROOMS)
 
         # Connect all rooms to make a connected graph
         while unconnected:
             # Pick a random room that's already connected
-            from_room = random.choice(list(connected))
+            from_room = rand.choice(list(connected))
 
             # Find available directions
             available = [d for d in directions if rooms[from_room].connections[d] is None]
@@ -176,8 +179,8 @@ class RoomManager:
                 continue
 
             # Pick random direction and room to connect
-            direction = random.choice(available)
-            to_room = random.choice(list(unconnected))
+            direction = rand.choice(available)
+            to_room = rand.choice(list(unconnected))
 
             # Create bidirectional connection
             rooms[from_room].connections[direction] = to_room
@@ -286,6 +289,56 @@ class RoomManager:
         # Create walls after corridors are built
         self.walls = self._create_walls()
 
+        # Prepare corridor graphics so draw() does no transforms
+        self._build_static_layer()
+
+    def _build_static_layer(self):
+        """Pre-rotate and pre-scale gates and door frames for the current room's corridors."""
+        self._gate_blits = []
+        for direction, corridor in self.corridors.items():
+            size = (corridor.corridor_width, corridor.corridor_height)
+            if self.gate_image is not None:
+                gate = self._gate_surfaces.get(direction)
+                if gate is None:
+                    gate = pygame.transform.scale(
+                        pygame.transform.rotate(self.gate_image, self.GATE_ROTATIONS[direction]), size)
+                    self._gate_surfaces[direction] = gate
+                self._gate_blits.append((gate, (corridor.x, corridor.y)))
+
+            if self.doors_spritesheet is not None and direction not in self._door_surfaces:
+                self._door_surfaces[direction] = [
+                    pygame.transform.scale(pygame.transform.rotate(frame, self.DOOR_ROTATIONS[direction]), size)
+                    for frame in self._get_sheet_door_frames()
+                ]
+
+    def _get_sheet_door_frames(self):
+        """Cut the door sprite sheet into frames (once)."""
+        if self._sheet_door_frames is None:
+            self._sheet_door_frames = []
+            for frame_index in range(self.door_frame_count):
+                frame_rect = pygame.Rect(frame_index * self.door_sprite_width, 0,
+                                         self.door_sprite_width, self.door_sprite_height)
+                self._sheet_door_frames.append(self.doors_spritesheet.subsurface(frame_rect).copy())
+        return self._sheet_door_frames
+
+    def _get_golden_gate(self, direction, corridor):
+        """Get the golden-tinted NEXT LEVEL gate for a corridor (built on first use)."""
+        golden_gate = self._golden_gate_surfaces.get(direction)
+        if golden_gate is None:
+            golden_gate = self._gate_surfaces[direction].copy()
+            # Add golden tint
+            golden_surface = pygame.Surface((corridor.corridor_width, corridor.corridor_height),
+                                           pygame.SRCALPHA)
+            golden_surface.fill((255, 215, 0, 80))
+            golden_gate.blit(golden_surface, (0, 0), special_flags=pygame.BLEND_ADD)
+            self._golden_gate_surfaces[direction] = golden_gate
+        return golden_gate
+
+    def _door_frame_index(self, progress):
+        """Map door opening progress (0.0 - 1.0) to a sprite sheet frame index."""
+        frame_index = int(progress * (self.door_frame_count - 1))
+        return max(0, min(self.door_frame_count - 1, frame_index))
+
     def _get_door_frame(self, progress):
         """Extract a specific frame from the door sprite sheet based on animation progress.
 
@@ -299,18 +352,7 @@ class RoomManager:
             return None
 
         # Calculate which frame to show (0 = closed, last frame = open)
-        frame_index = int(progress * (self.door_frame_count - 1))
-        frame_index = max(0, min(self.door_frame_count - 1, frame_index))
-
-        # Extract the frame from sprite sheet
-        frame_x = frame_index * self.door_sprite_width
-        frame_rect = pygame.Rect(frame_x, 0, self.door_sprite_width, self.door_sprite_height)
-
-        # Create a new surface for this frame
-        frame_surface = pygame.Surface((self.door_sprite_width, self.door_sprite_height), pygame.SRCALPHA)
-        frame_surface.blit(self.doors_spritesheet, (0, 0), frame_rect)
-
-        return frame_surface
+        return self._get_sheet_door_frames()[self._door_frame_index(progress)]
 
     def _create_walls(self):
         """Create wall rectangles for collision detection"""
@@ -395,6 +437,29 @@ class RoomManager:
                 self.door_opening_progress[direction] = 0.0
                 self.door_fully_open[direction] = False
 
+    def get_static_key(self, boss_killed=False, room_cleared=False):
+        """Describe everything draw() depends on, as a hashable key.
+
+        Two calls returning equal keys draw identical pixels, so the key can
+        be used to cache the drawn room (see DirtyRectRenderer).
+
+        Args:
+            boss_killed: True if boss was defeated
+            room_cleared: True if all enemies in current room are dead
+
+        Returns:
+            Hashable tuple
+        """
+        door_frames = []
+        for direction in sorted(self.corridors):
+            if self.door_fully_open.get(direction, False):
+                door_frames.append((direction, -1))
+            else:
+                progress = self.door_opening_progress.get(direction, 0.0)
+                door_frames.append((direction, self._door_frame_index(progress)))
+        next_level = bool(boss_killed and self.current_room_id == 5 and hasattr(self, 'boss_room_entrance'))
+        return ('room', self.current_room_id, tuple(door_frames), next_level)
+
     def draw(self, screen, boss_killed=False, room_cleared=False):
         """Draw room and active corridors with doors
 
@@ -408,38 +473,8 @@ class RoomManager:
         if self.gate_image is None:
             return  # No gates to draw
 
-        # Draw gate for each corridor
-        for direction, corridor in self.corridors.items():
-            if direction == 'top':
-                # Top corridor - rotate 90 degrees
-                gate_width = corridor.corridor_width
-                gate_height = corridor.corridor_height
-                rotated_gate = pygame.transform.rotate(self.gate_image, -90)
-                scaled_gate = pygame.transform.scale(rotated_gate, (gate_width, gate_height))
-                screen.blit(scaled_gate, (corridor.x, corridor.y))
-
-            elif direction == 'bottom':
-                # Bottom corridor - rotate 270 degrees (-90)
-                gate_width = corridor.corridor_width
-                gate_height = corridor.corridor_height
-                rotated_gate = pygame.transform.rotate(self.gate_image, -270)
-                scaled_gate = pygame.transform.scale(rotated_gate, (gate_width, gate_height))
-                screen.blit(scaled_gate, (corridor.x, corridor.y))
-
-            elif direction == 'left':
-                # Left corridor - no rotation (0 degrees)
-                gate_width = corridor.corridor_width
-                gate_height = corridor.corridor_height
-                scaled_gate = pygame.transform.scale(self.gate_image, (gate_width, gate_height))
-                screen.blit(scaled_gate, (corridor.x, corridor.y))
-
-            elif direction == 'right':
-                # Right corridor - rotate 180 degrees
-                gate_width = corridor.corridor_width
-                gate_height = corridor.corridor_height
-                rotated_gate = pygame.transform.rotate(self.gate_image, 180)
-                scaled_gate = pygame.transform.scale(rotated_gate, (gate_width, gate_height))
-                screen.blit(scaled_gate, (corridor.x, corridor.y))
+        # Gates for every corridor (pre-rotated and pre-scaled in _build_corridors)
+        screen.blits(self._gate_blits, doreturn=False)
 
         # Draw doors on all corridors when room has enemies OR during opening animation
         if self.doors_spritesheet is not None:
@@ -450,42 +485,10 @@ class RoomManager:
                 # Don't show if doors are fully open (door_fully_open = True)
 
                 if not self.door_fully_open.get(direction, False):
-                    # Calculate door opening progress
+                    # Pick the pre-transformed frame for the current opening progress
                     progress = self.door_opening_progress.get(direction, 0.0)
-
-                    # Get the appropriate frame from sprite sheet
-                    door_frame = self._get_door_frame(progress)
-
-                    if door_frame is None:
-                        continue
-
-                    # Rotate and scale based on direction
-                    if direction == 'top':
-                        # Top corridor - no rotation
-                        scaled_door = pygame.transform.scale(door_frame,
-                                                             (corridor.corridor_width, corridor.corridor_height))
-                        screen.blit(scaled_door, (corridor.x, corridor.y))
-
-                    elif direction == 'right':
-                        # Right corridor - rotate 90 degrees clockwise
-                        rotated_door = pygame.transform.rotate(door_frame, -90)
-                        scaled_door = pygame.transform.scale(rotated_door,
-                                                             (corridor.corridor_width, corridor.corridor_height))
-                        screen.blit(scaled_door, (corridor.x, corridor.y))
-
-                    elif direction == 'bottom':
-                        # Bottom corridor - rotate 180 degrees
-                        rotated_door = pygame.transform.rotate(door_frame, -180)
-                        scaled_door = pygame.transform.scale(rotated_door,
-                                                             (corridor.corridor_width, corridor.corridor_height))
-                        screen.blit(scaled_door, (corridor.x, corridor.y))
-
-                    elif direction == 'left':
-                        # Left corridor - rotate 270 degrees clockwise
-                        rotated_door = pygame.transform.rotate(door_frame, -270)
-                        scaled_door = pygame.transform.scale(rotated_door,
-                                                             (corridor.corridor_width, corridor.corridor_height))
-                        screen.blit(scaled_door, (corridor.x, corridor.y))
+                    door_frame = self._door_surfaces[direction][self._door_frame_index(progress)]
+                    screen.blit(door_frame, (corridor.x, corridor.y))
 
         # Draw golden NEXT LEVEL corridor at entrance after boss is killed
         if boss_killed and self.current_room_id == 5 and hasattr(self, 'boss_room_entrance'):
@@ -495,39 +498,19 @@ class RoomManager:
                 corridor = self.corridors[entrance_direction]
 
                 # Draw golden/special gate
-                if self.gate_image:
-                    # Rotate based on direction (same as normal gates)
-                    if entrance_direction == 'top':
-                        rotated_gate = pygame.transform.rotate(self.gate_image, -90)
-                    elif entrance_direction == 'bottom':
-                        rotated_gate = pygame.transform.rotate(self.gate_image, -270)
-                    elif entrance_direction == 'left':
-                        rotated_gate = self.gate_image
-                    elif entrance_direction == 'right':
-                        rotated_gate = pygame.transform.rotate(self.gate_image, 180)
-
-                    scaled_gate = pygame.transform.scale(rotated_gate,
-                                                         (corridor.corridor_width, corridor.corridor_height))
-
-                    # Add golden tint
-                    golden_surface = pygame.Surface((corridor.corridor_width, corridor.corridor_height),
-                                                   pygame.SRCALPHA)
-                    golden_surface.fill((255, 215, 0, 80))
-                    scaled_gate.blit(golden_surface, (0, 0), special_flags=pygame.BLEND_ADD)
-
-                    screen.blit(scaled_gate, (corridor.x, corridor.y))
+                screen.blit(self._get_golden_gate(entrance_direction, corridor), (corridor.x, corridor.y))
 
                 # Draw "NEXT LEVEL" text on the golden corridor
                 try:
-                    special_font = pygame.font.SysFont("Arial", 32, bold=True)
-                    next_text = special_font.render("NEXT LEVEL", True, (255, 215, 0))
+                    special_font = get_font("Arial", 32, bold=True)
+                    next_text = text_cache.render(special_font, "NEXT LEVEL", True, (255, 215, 0))
 
                     # Position text in the middle of the corridor
                     text_x = corridor.x + corridor.corridor_width // 2 - next_text.get_width() // 2
                     text_y = corridor.y + corridor.corridor_height // 2 - next_text.get_height() // 2
 
                     # Draw shadow
-                    shadow_text = special_font.render("NEXT LEVEL", True, (0, 0, 0))
+                    shadow_text = text_cache.render(special_font, "NEXT LEVEL", True, (0, 0, 0))
                     screen.blit(shadow_text, (text_x + 2, text_y + 2))
                     screen.blit(next_text, (text_x, text_y))
                 except:
@@ -628,19 +611,20 @@ class RoomManager:
 
     def get_random_spawn_position(self):
         """Get random position on room edge for enemy spawning"""
-        edge = random.randint(0, 3)
+        rand = rng.stream(SPAWNS)
+        edge = rand.randint(0, 3)
         if edge == 0:
-            x = random.randint(self.room_x, self.room_x + self.room_width - ENEMY_SIZE)
+            x = rand.randint(self.room_x, self.room_x + self.room_width - ENEMY_SIZE)
             y = self.room_y
         elif edge == 1:
-            x = random.randint(self.room_x, self.room_x + self.room_width - ENEMY_SIZE)
+            x = rand.randint(self.room_x, self.room_x + self.room_width - ENEMY_SIZE)
             y = self.room_y + self.room_height - ENEMY_SIZE
         elif edge == 2:
             x = self.room_x
-            y = random.randint(self.room_y, self.room_y + self.room_height - ENEMY_SIZE)
+            y = rand.randint(self.room_y, self.room_y + self.room_height - ENEMY_SIZE)
         else:
             x = self.room_x + self.room_width - ENEMY_SIZE
-            y = random.randint(self.room_y, self.room_y + self.room_height - ENEMY_SIZE)
+            y = rand.randint(self.room_y, self.room_y + self.room_height - ENEMY_SIZE)
         return x, y
 
     def get_bounds(self):
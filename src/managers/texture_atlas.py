@@ -0,0 +1,384 @@
+"""
+Texture atlas - gameplay sprites packed into a few large surfaces.
+
+Every gameplay sprite (already cut into frames and scaled to the size the
+game draws it at) is packed into a small number of atlas pages. Sprites are
+handed out as subsurfaces of those pages, so the whole sprite set is one
+load, one allocation per page and neighbouring frames share memory.
+
+The packed pages are saved as PNG files next to a JSON index, so later
+starts only load the pages instead of decoding and scaling every source
+image. The index remembers the size and modification time of each source
+file and the atlas is rebuilt when any of them changes.
+
+Run this module to (re)build the atlas offline:
+    python -m src.managers.texture_atlas
+"""
+import json
+import os
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import pygame
+
+from src.core.constants import URANEK_FRAME_WIDTH, URANEK_FRAME_HEIGHT, URANEK_SIZE, POWERUP_SIZE
+
+
+class SpriteSpec(NamedTuple):
+    """
+    Description of one sprite (or animation) stored in the atlas.
+
+    Attributes:
+        name: Name used with get_sprite()
+        filename: Source image file (resolved like ResourceManager.load_image)
+        frame_size: Frame size for sprite sheets, None for a single image
+        scale: Size each frame is scaled to, None to keep the source size
+    """
+    name: str
+    filename: str
+    frame_size: Optional[Tuple[int, int]] = None
+    scale: Optional[Tuple[int, int]] = None
+
+    @property
+    def key(self) -> str:
+        """Lookup key matching the arguments of load_image/load_spritesheet."""
+        return sprite_key(self.filename, self.frame_size, self.scale)
+
+
+def sprite_key(filename: str, frame_size: Optional[Tuple[int, int]] = None,
+               scale: Optional[Tuple[int, int]] = None) -> str:
+    """
+    Build the atlas lookup key for an image or sprite sheet request.
+
+    Args:
+        filename: Source image file
+        frame_size: Frame size for sprite sheets, None for a single image
+        scale: Target size, None for the source size
+
+    Returns:
+        Key string
+    """
+    frame = f"{frame_size[0]}x{frame_size[1]}" if frame_size else "-"
+    size = f"{scale[0]}x{scale[1]}" if scale else "-"
+    return f"{filename}|{frame}|{size}"
+
+
+_FIRE_SIZE = (48, 48)  # EnemyBullet._sprite_size
+_ICON_SIZE = (40, 40)  # HUD power-up icons
+_POWERUP_SIZE = (POWERUP_SIZE, POWERUP_SIZE)
+
+# Sprites drawn during gameplay, at the sizes the game uses them
+GAMEPLAY_SPRITES: Tuple[SpriteSpec, ...] = (
+    SpriteSpec("uranek", "uranek.png", (URANEK_FRAME_WIDTH, URANEK_FRAME_HEIGHT), URANEK_SIZE),
+    *(SpriteSpec(f"enemy{i}", f"enemy{i}.png", (100, 100)) for i in range(1, 10)),
+    SpriteSpec("trash-boss", "trash-boss.png", (100, 200)),
+    SpriteSpec("olejman-boss", "olejman-boss.png", (100, 200)),
+    SpriteSpec("coal-boss", "coal-boss.png", (200, 200)),
+    SpriteSpec("final-boss", "final-boss.png", (200, 200)),
+    SpriteSpec("fireball", "fireball.png", (150, 100), (75, 50)),
+    SpriteSpec("final-boss-fire", "final-boss-fire.png", (150, 100), _FIRE_SIZE),
+    SpriteSpec("coal-boss-fire", "coal-boss-fire.png", None, _FIRE_SIZE),
+    SpriteSpec("trash-boss-fire1", "trash-boss-fire1.png", None, _FIRE_SIZE),
+    SpriteSpec("trash-boss-fire2", "trash-boss-fire2.png", None, _FIRE_SIZE),
+    SpriteSpec("trash-boss-fire3", "trash-boss-fire3.png", None, _FIRE_SIZE),
+    SpriteSpec("olejman-boss-fire", "olejman-boss-fire.png", None, (200, 200)),
+    SpriteSpec("shoe", "boost_shoe2.png", None, _POWERUP_SIZE),
+    SpriteSpec("shield", "shield.png", None, _POWERUP_SIZE),
+    SpriteSpec("sword", "swordbg.png", None, _POWERUP_SIZE),
+    SpriteSpec("shoe-icon", "boost_shoe2.png", None, _ICON_SIZE),
+    SpriteSpec("shield-icon", "shield.png", None, _ICON_SIZE),
+    SpriteSpec("sword-icon", "swordbg.png", None, _ICON_SIZE),
+    SpriteSpec("gate", "gate.png"),
+    SpriteSpec("doors", "doors.png"),
+)
+
+
+class TextureAtlas:
+    """
+    Sprite frames packed into atlas pages, looked up by name or request key.
+
+    Attributes:
+        pages (List[pygame.Surface]): Atlas page surfaces
+        page_size (int): Maximum edge of a regular page
+
+    Example:
+        >>> atlas = TextureAtlas.build(GAMEPLAY_SPRITES, load_frames)
+        >>> walk = atlas.frames("enemy3")
+        >>> sprite = atlas.get("fireball", 2)
+    """
+
+    INDEX_FILE = "atlas.json"
+    FORMAT_VERSION = 1
+    DEFAULT_PAGE_SIZE = 2048
+    PADDING = 1  # Transparent pixels between packed frames
+
+    def __init__(self, pages: List[pygame.Surface],
+                 entries: Dict[str, Tuple[str, List[Tuple[int, int, int, int, int]]]],
+                 sources: Optional[Dict[str, Optional[List[int]]]] = None,
+                 page_size: int = DEFAULT_PAGE_SIZE) -> None:
+        """
+        Initialize an atlas from packed pages.
+
+        Args:
+            pages: Atlas page surfaces
+            entries: Sprite name -> (request key, [(page, x, y, width, height) per frame])
+            sources: Source file -> [mtime_ns, size] (None if missing) at build time
+            page_size: Maximum edge of a regular page
+        """
+        self.pages = pages
+        self.page_size = page_size
+        self._entries = entries
+        self._sources = sources or {}
+        self._frames: Dict[str, List[pygame.Surface]] = {}
+        self._by_key: Dict[str, str] = {}
+        for name, (key, frames) in entries.items():
+            self._frames[name] = [pages[page].subsurface((x, y, w, h)) for page, x, y, w, h in frames]
+            self._by_key[key] = name
+
+    @classmethod
+    def build(cls, specs: Iterable[SpriteSpec],
+              load_frames: Callable[[SpriteSpec], List[pygame.Surface]],
+              resolve: Optional[Callable[[str], Optional[str]]] = None,
+              page_size: int = DEFAULT_PAGE_SIZE) -> 'TextureAtlas':
+        """
+        Load every sprite and pack all frames into pages.
+
+        Frames are packed into shelves (rows) sorted by height. A frame
+        larger than a page gets a page of its own.
+
+        Args:
+            specs: Sprites to pack
+            load_frames: Returns the final (cut and scaled) frames of a spec,
+                         or an empty list if the source is missing
+            resolve: Returns the path a source file is loaded from (used to
+                     record modification times for staleness checks)
+            page_size: Maximum edge of a regular page
+
+        Returns:
+            New TextureAtlas
+        """
+        pad = cls.PADDING
+        loaded = []  # (spec, frames)
+        sources: Dict[str, Optional[List[int]]] = {}
+        for spec in specs:
+            if resolve is not None and spec.filename not in sources:
+                sources[spec.filename] = _file_signature(resolve(spec.filename))
+            frames = load_frames(spec)
+            if frames:
+                loaded.append((spec, frames))
+
+        # (height, width, spec index, frame index), tallest first
+        items = sorted(((frame.get_height(), frame.get_width(), s, f)
+                        for s, (_, frames) in enumerate(loaded)
+                        for f, frame in enumerate(frames)), reverse=True)
+
+        placements: Dict[Tuple[int, int], Tuple[int, int, int]] = {}  # (spec, frame) -> (page, x, y)
+        page_sizes: List[List[int]] = []  # used [width, height] per page
+        shelf_x = shelf_y = shelf_h = 0
+        page = -1
+        for h, w, s, f in items:
+            if w + pad > page_size or h + pad > page_size:
+                # Oversized frame - page of its own
+                page_sizes.append([w, h])
+                placements[(s, f)] = (len(page_sizes) - 1, 0, 0)
+                continue
+            if page < 0 or shelf_x + w > page_size:
+                # Next shelf
+                shelf_y += shelf_h
+                shelf_x = shelf_h = 0
+            if page < 0 or shelf_y + h > page_size:
+                page_sizes.append([0, 0])
+                page = len(page_sizes) - 1
+                shelf_x = shelf_y = shelf_h = 0
+            placements[(s, f)] = (page, shelf_x, shelf_y)
+            used = page_sizes[page]
+            used[0] = max(used[0], shelf_x + w)
+            used[1] = max(used[1], shelf_y + h)
+            shelf_x += w + pad
+            shelf_h = max(shelf_h, h + pad)
+
+        pages = [pygame.Surface((max(1, w), max(1, h)), pygame.SRCALPHA) for w, h in page_sizes]
+        for surface in pages:
+            surface.fill((0, 0, 0, 0))
+
+        entries = {}
+        for s, (spec, frames) in enumerate(loaded):
+            rects = []
+            for f, frame in enumerate(frames):
+                page_index, x, y = placements[(s, f)]
+                # RGBA_MAX onto transparent pixels copies the frame exactly
+                pages[page_index].blit(frame, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+                rects.append((page_index, x, y, frame.get_width(), frame.get_height()))
+            entries[spec.name] = (spec.key, rects)
+
+        return cls(_finalize_pages(pages), entries, sources, page_size)
+
+    def get(self, name: str, frame: int = 0) -> Optional[pygame.Surface]:
+        """
+        Get one frame of a sprite.
+
+        Args:
+            name: Sprite name (SpriteSpec.name)
+            frame: Frame index (wraps around)
+
+        Returns:
+            Subsurface of an atlas page, or None if the sprite is not packed
+        """
+        frames = self._frames.get(name)
+        if not frames:
+            return None
+        return frames[frame % len(frames)]
+
+    def frames(self, name: str) -> List[pygame.Surface]:
+        """
+        Get all frames of a sprite.
+
+        Args:
+            name: Sprite name (SpriteSpec.name)
+
+        Returns:
+            List of subsurfaces (empty if the sprite is not packed)
+        """
+        return self._frames.get(name, [])
+
+    def find(self, key: str) -> Optional[List[pygame.Surface]]:
+        """
+        Get the frames stored for a load request key (see sprite_key()).
+
+        Args:
+            key: Request key
+
+        Returns:
+            List of subsurfaces, or None if the request is not in the atlas
+        """
+        name = self._by_key.get(key)
+        return self._frames[name] if name is not None else None
+
+    def is_fresh(self, specs: Iterable[SpriteSpec], resolve: Callable[[str], Optional[str]]) -> bool:
+        """
+        Check whether the atlas still matches the specs and source files.
+
+        Args:
+            specs: Sprites the atlas should contain
+            resolve: Returns the path a source file is loaded from
+
+        Returns:
+            True if no spec was added or changed and no source file changed
+        """
+        for spec in specs:
+            if spec.filename not in self._sources:
+                return False
+            entry = self._entries.get(spec.name)
+            if entry is not None and entry[0] != spec.key:
+                return False
+            if self._sources[spec.filename] != _file_signature(resolve(spec.filename)):
+                return False
+        return True
+
+    def save(self, directory: str) -> None:
+        """
+        Write the pages (PNG) and the JSON index to a directory.
+
+        Args:
+            directory: Output directory (created if needed)
+        """
+        os.makedirs(directory, exist_ok=True)
+        page_files = []
+        for i, page in enumerate(self.pages):
+            filename = f"atlas_{i}.png"
+            pygame.image.save(page, os.path.join(directory, filename))
+            page_files.append(filename)
+
+        index = {
+            'version': self.FORMAT_VERSION,
+            'page_size': self.page_size,
+            'pages': page_files,
+            'sources': self._sources,
+            'sprites': {name: {'key': key, 'frames': [list(rect) for rect in rects]}
+                        for name, (key, rects) in self._entries.items()},
+        }
+        with open(os.path.join(directory, self.INDEX_FILE), "w") as f:
+            json.dump(index, f, indent=1)
+
+    @classmethod
+    def load(cls, directory: str) -> Optional['TextureAtlas']:
+        """
+        Load an atlas written by save().
+
+        Args:
+            directory: Directory containing the index and pages
+
+        Returns:
+            TextureAtlas, or None if there is no (readable, current-version) atlas
+        """
+        try:
+            with open(os.path.join(directory, cls.INDEX_FILE)) as f:
+                index = json.load(f)
+            if index.get('version') != cls.FORMAT_VERSION:
+                return None
+            pages = [pygame.image.load(os.path.join(directory, filename)) for filename in index['pages']]
+        except (OSError, ValueError, KeyError, pygame.error):
+            return None
+
+        entries = {name: (sprite['key'], [tuple(rect) for rect in sprite['frames']])
+                   for name, sprite in index['sprites'].items()}
+        return cls(_finalize_pages(pages), entries, index.get('sources', {}),
+                   index.get('page_size', cls.DEFAULT_PAGE_SIZE))
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get statistics about the atlas.
+
+        Returns:
+            Dictionary with pages, sprites, frames and bytes (page pixel memory)
+        """
+        return {
+            'pages': len(self.pages),
+            'sprites': len(self._frames),
+            'frames': sum(len(frames) for frames in self._frames.values()),
+            'bytes': sum(p.get_width() * p.get_height() * p.get_bytesize() for p in self.pages),
+        }
+
+    def __contains__(self, name: str) -> bool:
+        """Check whether a sprite is packed in the atlas."""
+        return name in self._frames
+
+    def __len__(self) -> int:
+        """Get the number of packed sprites."""
+        return len(self._frames)
+
+    def __repr__(self) -> str:
+        """
+        String representation for debugging.
+
+        Returns:
+            String showing page, sprite and frame counts
+        """
+        stats = self.get_stats()
+        return f"TextureAtlas(pages={stats['pages']}, sprites={stats['sprites']}, frames={stats['frames']})"
+
+
+def _file_signature(path: Optional[str]) -> Optional[List[int]]:
+    """Return [mtime_ns, size] of a file, or None if it does not exist."""
+    if path is None:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _finalize_pages(pages: List[pygame.Surface]) -> List[pygame.Surface]:
+    """Convert pages to the display pixel format (when a display mode is set)."""
+    if pygame.display.get_surface() is None:
+        return pages
+    return [page.convert_alpha() for page in pages]
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    from src.managers.resource_manager import resource_manager
+
+    atlas = resource_manager.build_atlas(force=True)
+    print(f"✓ {atlas} written to {resource_manager.atlas_dir} ({atlas.get_stats()['bytes'] / 1e6:.1f} MB)")
@@ -3,6 +3,7 @@ Boss HP bar manager for displaying animated boss health bars.
 """
 import pygame
 from src.core.constants import FPS
+from src.ui.text_cache import text_cache, get_font
 
 
 class BossBarManager:
@@ -74,23 +75,32 @@ class BossBarManager:
             self.deactivate()
             return False
         
+        # Advance the intro animation (one step per tick)
+        if self.intro_timer > 0:
+            self.intro_timer -= 1
+            self.intro_progress = 1.0 - (self.intro_timer / self.intro_duration)
+        
         return True
     
     def draw(self, screen, enemies):
         """
         Draw the boss HP bar with animation.
         
+        Only reads the state; the intro animation is advanced by update().
+        
         Args:
             screen: Pygame screen surface
             enemies: List of current enemies (to check if boss is alive)
+
+        Returns:
+            Rect covered by the bar, or None if nothing was drawn
         """
         if not self.active or self.target_enemy is None:
-            return
+            return None
         
-        # Check if boss died or was removed
+        # Boss died or was removed (update() deactivates the bar)
         if self.target_enemy not in enemies:
-            self.deactivate()
-            return
+            return None
         
         # Bar dimensions and position
         bar_width = int(self.screen_width * 0.78)
@@ -101,12 +111,10 @@ class BossBarManager:
         
         # Intro animation: slide up from offscreen and fade in
         if self.intro_timer > 0:
-            self.intro_progress = 1.0 - (self.intro_timer / self.intro_duration)
             # Smoothstep easing
             eased = self.intro_progress * self.intro_progress * (3 - 2 * self.intro_progress)
             y = self.screen_height + int(bar_height * 2 * (1.0 - eased)) - bar_height - margin_bottom
             alpha = int(255 * eased)
-            self.intro_timer -= 1
         else:
             y = y_target
             alpha = 255
@@ -147,13 +155,15 @@ class BossBarManager:
         
         # Draw HP text centered
         try:
-            text_font = pygame.font.SysFont(None, max(20, int(bar_height * 0.6)))
+            text_font = get_font(None, max(20, int(bar_height * 0.6)))
             text = f"BOSS HP: {shown_hp} / {self.target_enemy.max_hp}"
-            text_surf = text_font.render(text, True, (255, 255, 255))
+            text_surf = text_cache.render(text_font, text, True, (255, 255, 255))
             text_rect = text_surf.get_rect(center=(self.screen_width // 2, y + bar_height // 2))
             screen.blit(text_surf, text_rect)
         except Exception:
             pass  # Fail silently if font rendering fails
+
+        return bg_rect
     
     def is_active(self) -> bool:
         """Check if boss bar is currently active."""
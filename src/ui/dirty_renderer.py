@@ -0,0 +1,168 @@
+"""
+Dirty-rectangle renderer for the gameplay loop.
+
+Instead of clearing and redrawing the whole screen and pushing every pixel
+to the display each frame, the renderer keeps the static part of a room
+(background, walls, gates, doors) composited in a cached surface. At the
+start of a frame it only restores the areas that were drawn over in the
+previous frame, and at the end it updates only the rectangles that changed.
+When too much of the screen changed, a plain full-frame update is cheaper
+and is used instead.
+"""
+import pygame
+from collections import OrderedDict
+from typing import Callable, Hashable, Iterable, List, Optional, Union
+
+
+RectLike = Union[pygame.Rect, Iterable[pygame.Rect], None]
+
+
+class DirtyRectRenderer:
+    """
+    Tracks dirty rectangles and restores them from a cached static layer.
+
+    Entities report the screen area they drew to (their draw methods return
+    a Rect or a list of Rects) through mark(). Each frame the display is
+    updated with the union of the previous and the current frame's rects,
+    so areas an entity moved away from are refreshed too.
+
+    Attributes:
+        screen (pygame.Surface): Display surface drawn to
+        full_update_ratio (float): Fraction of the screen above which a
+                                   full-frame update is used
+        full_updates (int): Frames presented with a full update
+        partial_updates (int): Frames presented with dirty rects only
+
+    Example:
+        >>> renderer.begin_frame(room_key, draw_static)
+        >>> renderer.mark(player.draw(screen))
+        >>> renderer.present()
+    """
+
+    DEFAULT_FULL_UPDATE_RATIO = 0.4
+    MAX_STATIC_LAYERS = 8
+
+    def __init__(self, screen: pygame.Surface,
+                 full_update_ratio: float = DEFAULT_FULL_UPDATE_RATIO) -> None:
+        """
+        Initialize the renderer.
+
+        Args:
+            screen: Display surface drawn to
+            full_update_ratio: Fraction of the screen area above which the
+                               whole display is updated instead of rects
+        """
+        self.screen = screen
+        self.full_update_ratio = full_update_ratio
+        self._screen_rect = screen.get_rect()
+        self._full_area_limit = self._screen_rect.width * self._screen_rect.height * full_update_ratio
+        # static key -> composited static layer (small LRU, e.g. revisited rooms)
+        self._static_layers: 'OrderedDict[Hashable, pygame.Surface]' = OrderedDict()
+        self._static_key: Optional[Hashable] = None
+        self._static: Optional[pygame.Surface] = None
+        self._prev_rects: List[pygame.Rect] = []
+        self._rects: List[pygame.Rect] = []
+        self._full_frame = True
+        self.full_updates = 0
+        self.partial_updates = 0
+
+    def _get_static(self, key: Hashable, draw_static: Callable[[pygame.Surface], None]) -> pygame.Surface:
+        """Return the static layer for a key, compositing it on first use."""
+        layer = self._static_layers.get(key)
+        if layer is not None:
+            self._static_layers.move_to_end(key)
+            return layer
+
+        layer = pygame.Surface(self._screen_rect.size).convert()
+        layer.fill((0, 0, 0))
+        draw_static(layer)
+        self._static_layers[key] = layer
+        if len(self._static_layers) > self.MAX_STATIC_LAYERS:
+            self._static_layers.popitem(last=False)
+        return layer
+
+    def begin_frame(self, static_key: Hashable, draw_static: Callable[[pygame.Surface], None]) -> None:
+        """
+        Prepare the screen for drawing a new frame.
+
+        If the static layer changed (new room, door animation frame, ...)
+        the whole screen is redrawn from it; otherwise only the areas drawn
+        over last frame are restored.
+
+        Args:
+            static_key: Hashable description of everything the static layer
+                        depends on
+            draw_static: Callback drawing the static layer onto a surface
+                         (called only when the key has no cached layer)
+        """
+        self._rects = []
+        if static_key != self._static_key or self._static is None:
+            self._static = self._get_static(static_key, draw_static)
+            self._static_key = static_key
+            self._full_frame = True
+
+        if self._full_frame:
+            self.screen.blit(self._static, (0, 0))
+        else:
+            static = self._static
+            for rect in self._prev_rects:
+                self.screen.blit(static, rect, rect)
+
+    def mark(self, rects: RectLike) -> None:
+        """
+        Record screen areas drawn to during this frame.
+
+        Args:
+            rects: A Rect, an iterable of Rects, or None (nothing drawn)
+        """
+        if rects is None:
+            return
+        if isinstance(rects, pygame.Rect):
+            rects = (rects,)
+        screen_rect = self._screen_rect
+        for rect in rects:
+            if rect is None:
+                continue
+            clipped = screen_rect.clip(rect)
+            if clipped.width and clipped.height:
+                self._rects.append(clipped)
+
+    def invalidate(self) -> None:
+        """Force a full redraw and full update next frame (e.g. after a menu screen)."""
+        self._full_frame = True
+
+    def clear_static_cache(self) -> None:
+        """Drop all cached static layers."""
+        self._static_layers.clear()
+        self._static_key = None
+        self._static = None
+        self._full_frame = True
+
+    def present(self) -> None:
+        """Push this frame to the display (dirty rects or full frame)."""
+        rects = self._rects
+        if not self._full_frame:
+            update_rects = self._prev_rects + rects
+            area = sum(rect.width * rect.height for rect in update_rects)
+            if area > self._full_area_limit:
+                self._full_frame = True
+
+        if self._full_frame:
+            pygame.display.update()
+            self.full_updates += 1
+        else:
+            pygame.display.update(update_rects)
+            self.partial_updates += 1
+
+        self._prev_rects = rects
+        self._full_frame = False
+
+    def __repr__(self) -> str:
+        """
+        String representation for debugging.
+
+        Returns:
+            String showing update counters and cached static layers
+        """
+        return (f"DirtyRectRenderer(full_updates={self.full_updates}, "
+                f"partial_updates={self.partial_updates}, static_layers={len(self._static_layers)})")
@@ -0,0 +1,196 @@
+"""
+Pre-rendered heart strips for the HP display above enemies.
+
+An enemy's HP is shown as a row of hearts (one per 10 HP, the last one
+partially filled). Instead of blitting every heart every frame, the whole
+row is composed once into one surface per (heart size, max HP, fill
+state) and shared by all enemies that show the same thing, so drawing an
+enemy's HP is a single blit. Heart images and strips are kept separately
+per heart size, so enemy types of different sizes never rescale each
+other's images.
+"""
+import pygame
+from typing import Dict, Optional, Tuple
+
+from src.ui.hud import load_heart_images
+
+# (max_hp, full hearts, width of the partial heart in pixels)
+StripKey = Tuple[int, int, int]
+
+
+class HpStripCache:
+    """
+    Cache of composed enemy HP heart strips.
+
+    Cached surfaces are shared between enemies, so they must be treated as
+    read-only (blit them, don't draw on them).
+
+    Attributes:
+        hp_per_heart (int): HP shown by one heart
+        spacing (int): Gap between hearts in pixels
+        hits (int): Lookups served from the cache
+        misses (int): Strips that had to be composed
+
+    Example:
+        >>> strip = hp_strip_cache.get(hp_strip_cache.heart_size_for(enemy.size), enemy.max_hp, enemy.hp)
+        >>> screen.blit(strip, (x, y))
+    """
+
+    HP_PER_HEART = 10
+    SPACING = 2
+
+    def __init__(self, hp_per_heart: int = HP_PER_HEART, spacing: int = SPACING,
+                 image_path: str = 'heart2.png') -> None:
+        """
+        Initialize an empty cache (images are loaded on first use).
+
+        Args:
+            hp_per_heart: HP shown by one heart
+            spacing: Gap between hearts in pixels
+            image_path: Filename of the heart image (loaded from game/ directory)
+        """
+        self.hp_per_heart = hp_per_heart
+        self.spacing = spacing
+        self.image_path = image_path
+        # heart size -> (full heart, dim heart); (None, None) = image missing
+        self._hearts: Dict[int, Tuple[Optional[pygame.Surface], Optional[pygame.Surface]]] = {}
+        # heart size -> {StripKey: strip}
+        self._strips: Dict[int, Dict[StripKey, pygame.Surface]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def heart_size_for(entity_size: int) -> int:
+        """
+        Get the heart size used above an entity.
+
+        Args:
+            entity_size: Entity size in pixels
+
+        Returns:
+            Heart size in pixels (40% of the entity, 10-20 px)
+        """
+        return max(10, min(20, int(entity_size * 0.4)))
+
+    def fill_state(self, heart_size: int, max_hp: int, hp: float) -> StripKey:
+        """
+        Quantize an HP value to what the strip shows.
+
+        HP values that differ by less than one pixel of the partial heart
+        map to the same strip.
+
+        Args:
+            heart_size: Heart size in pixels
+            max_hp: Maximum HP (sets the number of hearts)
+            hp: Current HP
+
+        Returns:
+            (max_hp, full hearts, partial heart width in pixels; 0 = none)
+        """
+        hearts_value = max(0, min(hp, max_hp)) / float(self.hp_per_heart)
+        full = int(hearts_value)
+        fraction = hearts_value - full
+        partial = max(1, int(fraction * heart_size)) if fraction > 0 else 0
+        return max_hp, full, partial
+
+    def get(self, heart_size: int, max_hp: int, hp: float) -> pygame.Surface:
+        """
+        Get the HP strip for an HP value, composing it on a cache miss.
+
+        Args:
+            heart_size: Heart size in pixels (see heart_size_for())
+            max_hp: Maximum HP
+            hp: Current HP
+
+        Returns:
+            Strip surface (shared, read-only), heart_size pixels high
+        """
+        key = self.fill_state(heart_size, max_hp, hp)
+        strips = self._strips.get(heart_size)
+        if strips is None:
+            strips = self._strips[heart_size] = {}
+        strip = strips.get(key)
+        if strip is not None:
+            self.hits += 1
+            return strip
+
+        strip = self._compose(heart_size, *key)
+        strips[key] = strip
+        self.misses += 1
+        return strip
+
+    def _heart_images(self, heart_size: int) -> Tuple[Optional[pygame.Surface], Optional[pygame.Surface]]:
+        """Get (full, dim) square heart images of one size, loading them once."""
+        images = self._hearts.get(heart_size)
+        if images is None:
+            heart, dim = load_heart_images(heart_size, self.image_path)
+            if heart is not None and heart.get_width() != heart_size:
+                square = (heart_size, heart_size)
+                heart = pygame.transform.smoothscale(heart, square)
+                dim = pygame.transform.smoothscale(dim, square)
+                dim.set_alpha(140)
+            images = self._hearts[heart_size] = (heart, dim)
+        return images
+
+    def _compose(self, heart_size: int, max_hp: int, full: int, partial: int) -> pygame.Surface:
+        """Draw a strip: full hearts, one partial heart, then dim hearts."""
+        total_hearts = max(1, (max_hp + self.hp_per_heart - 1) // self.hp_per_heart)
+        step = heart_size + self.spacing
+        strip = pygame.Surface((total_hearts * step - self.spacing, heart_size), pygame.SRCALPHA)
+        heart, dim = self._heart_images(heart_size)
+        radius = heart_size // 4
+
+        for i in range(total_hearts):
+            x = i * step
+            if heart is None:
+                # No heart image: grey rounded squares with a red fill
+                pygame.draw.rect(strip, (80, 80, 80, 140), (x, 0, heart_size, heart_size), border_radius=radius)
+                width = heart_size if i < full else partial if i == full else 0
+                if width:
+                    pygame.draw.rect(strip, (220, 30, 30, 255), (x, 0, width, heart_size), border_radius=radius)
+            elif i < full:
+                strip.blit(heart, (x, 0))
+            else:
+                strip.blit(dim, (x, 0))
+                if i == full and partial:
+                    strip.blit(heart, (x, 0), area=pygame.Rect(0, 0, partial, heart_size))
+        return strip
+
+    def clear(self) -> None:
+        """Drop all cached strips and heart images (counters are kept)."""
+        self._hearts.clear()
+        self._strips.clear()
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with entries, sizes, hits, misses and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self),
+            'sizes': len(self._strips),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def __len__(self) -> int:
+        """Get the number of cached strips."""
+        return sum(len(strips) for strips in self._strips.values())
+
+    def __repr__(self) -> str:
+        """
+        String representation for debugging.
+
+        Returns:
+            String showing cache size and hit/miss counters
+        """
+        return (f"HpStripCache(entries={len(self)}, sizes={sorted(self._strips)}, "
+                f"hits={self.hits}, misses={self.misses})")
+
+
+# Global HP strip cache shared by all enemies
+hp_strip_cache = HpStripCache()
@@ -1,6 +1,8 @@
-import os
 import pygame
+from typing import Dict, Optional, Tuple
+
 from src.managers.resource_manager import resource_manager
+from src.ui.text_cache import text_cache, get_font
 
 
 def load_heart_images(heart_height: int, image_path: str = 'heart2.png'):
@@ -45,12 +47,35 @@ def _ease_out_back(t: float) -> float:
     return 1 + c3 * (t - 1) ** 3 + c1 * (t - 1) ** 2
 
 
+# Heart pop animation: scale = 1 + _ease_out_back(t) * POP_AMOUNT * power,
+# pre-computed for POP_FRAMES evenly spaced steps of t
+POP_FRAMES = 16
+POP_AMOUNT = 0.25
+_pop_scale_tables: Dict[float, Tuple[float, ...]] = {}
+
+
+def _pop_scales(power: float) -> Tuple[float, ...]:
+    """Get the baked pop scale table for an animation power."""
+    table = _pop_scale_tables.get(power)
+    if table is None:
+        table = tuple(1.0 + _ease_out_back(i / POP_FRAMES) * POP_AMOUNT * power for i in range(POP_FRAMES))
+        _pop_scale_tables[power] = table
+    return table
+
+
 class HeartsHUD:
+    # Scaled heart images kept for loss animations (cleared when exceeded)
+    MAX_SCALED_SLOTS = 64
+
     def __init__(self, hp_per_heart: int = 20, heart_size: int = 72, spacing: int = 1,
                  pos=(10, 10), image_path: str = 'heart2.png'):
         """
         Initialize the Hearts HUD display.
         
+        The HUD is drawn into a cached composite surface that is rebuilt only
+        when the shown HP, power-up charges/countdowns or an animation frame
+        change, so an idle HUD costs one blit.
+        
         Args:
             hp_per_heart: HP value per heart slot
             heart_size: Size of each heart icon in pixels
@@ -78,6 +103,17 @@ class HeartsHUD:
         self._shield_icon = None
         self._shield_size = int(self.heart_size * 0.85)
 
+        # (fill width, scale) -> heart slot image
+        self._slot_images: Dict[Tuple[int, float], pygame.Surface] = {}
+        # Composite of everything the HUD shows, where it goes and the state it shows
+        self._composite: Optional[pygame.Surface] = None
+        self._composite_pos = (0, 0)
+        self._composite_key = None
+        # Drawn over the composite each frame (translucent box behind text
+        # cannot be pre-blended into a transparent surface exactly)
+        self._overlay = []
+        self.rebuilds = 0
+
     def _trigger_loss_anim(self, slot_idx: int, half_steps_lost: int):
         # stronger animation for full-heart loss (2 half-steps)
         power = 1.0 if half_steps_lost >= 2 else 0.55
@@ -95,221 +131,159 @@ class HeartsHUD:
             # end animation
             self.anim.pop(slot_idx, None)
             return 1.0
-        # simple popping scale
-        pop = _ease_out_back(t) * 0.25 * a['power']
-        scale = 1.0 + pop
-        return scale
+        # simple popping scale, quantized to the baked frames
+        return _pop_scales(a['power'])[max(0, int(t * POP_FRAMES))]
+
+    def _ensure_font(self, icon_size: int):
+        if self._font_small is None:
+            # Use default font scaled to icon size
+            self._font_small = get_font(None, max(12, int(icon_size * 0.9)))
 
     def _ensure_shoe_assets(self):
         if self._shoe_icon is None:
-            img = None
-            try:
-                img = pygame.image.load("game/boost_shoe2.png").convert_alpha()
-            except Exception:
-                try:
-                    img = pygame.image.load("boost_shoe2.png").convert_alpha()
-                except Exception:
-                    img = None
-            if img is None:
-                surf = pygame.Surface((self._shoe_size, self._shoe_size), pygame.SRCALPHA)
-                surf.fill((220, 60, 60))
-                self._shoe_icon = surf
-            else:
-                self._shoe_icon = pygame.transform.smoothscale(img, (self._shoe_size, self._shoe_size))
-        if self._font_small is None:
-            # Use default font scaled to shoe size
-            size = max(12, int(self._shoe_size * 0.9))
-            self._font_small = pygame.font.Font(None, size)
+            size = self._shoe_size
+            self._shoe_icon = resource_manager.load_image("boost_shoe2.png", scale=(size, size))
+            if self._shoe_icon is None:
+                self._shoe_icon = pygame.Surface((size, size), pygame.SRCALPHA)
+                self._shoe_icon.fill((220, 60, 60))
+        self._ensure_font(self._shoe_size)
 
     def _ensure_shield_assets(self):
         if self._shield_icon is None:
-            img = None
-            paths = (
-                "game/shield.png",
-                "shield.png",
-                "game/shield.jpg.avif",
-                "shield.jpg.avif",
-                "game/boost_shield.png",
-                "boost_shield.png",
-            )
-            # Try pygame loader first
-            for path in paths:
-                try:
-                    img = pygame.image.load(path).convert_alpha()
+            size = self._shield_size
+            for filename in ("shield.png", "boost_shield.png"):
+                self._shield_icon = resource_manager.load_image(filename, scale=(size, size))
+                if self._shield_icon is not None:
                     break
-                except Exception:
-                    img = None
-            # If AVIF not supported by pygame, try optional PIL fallback
-            if img is None:
-                try:
-                    from PIL import Image
-                    import os
-                    for path in paths:
-                        if os.path.exists(path) and path.lower().endswith(".avif"):
-                            pil_img = Image.open(path).convert("RGBA")
-                            mode = pil_img.mode
-                            size = pil_img.size
-                            data = pil_img.tobytes()
-                            img = pygame.image.fromstring(data, size, mode).convert_alpha()
-                            break
-                except Exception:
-                    img = None
-            if img is None:
+            else:
                 # Blue circle fallback
-                size = self._shield_size
                 surf = pygame.Surface((size, size), pygame.SRCALPHA)
                 pygame.draw.circle(surf, (80, 160, 255), (size//2, size//2), size//2)
                 pygame.draw.circle(surf, (200, 230, 255), (size//2, size//2), size//2, 3)
                 self._shield_icon = surf
-            else:
-                self._shield_icon = pygame.transform.smoothscale(img, (self._shield_size, self._shield_size))
         # Ensure small font exists even if only shield is present (fix crash)
-        if self._font_small is None:
-            size = max(12, int(self._shield_size * 0.9))
-            self._font_small = pygame.font.Font(None, size)
+        self._ensure_font(self._shield_size)
 
-    def draw(self, surface: pygame.Surface, player_obj, speed_boost_seconds=None, speed_boost_charges=None, shield_seconds=None, shield_charges=None):
-        slots = min(3, max(1, player_obj.max_hp // self.hp_per_heart))
-        max_shown = slots * self.hp_per_heart
-        shown_hp = max(0, min(player_obj.hp, max_shown))
+    def _heart_dims(self):
+        if self.heart is not None and self.dim_heart is not None:
+            return self.heart.get_width(), self.heart.get_height()
+        return self.heart_size, self.heart_size
 
-        # Detect losses (heart or half-heart) per slot
-        if self.prev_hp is None:
-            self.prev_hp = shown_hp
-        prev_shown = max(0, min(self.prev_hp, max_shown))
+    def _slot_image(self, fill_w: int, scale: float) -> pygame.Surface:
+        """
+        Get the image of one heart slot.
 
-        # compare quantized to halves in each slot
-        for i in range(slots):
-            prev_filled = (prev_shown - i * self.hp_per_heart) / self.hp_per_heart
-            curr_filled = (shown_hp - i * self.hp_per_heart) / self.hp_per_heart
-            q_prev = max(0, min(2, int(prev_filled * 2 + 1e-6)))
-            q_curr = max(0, min(2, int(curr_filled * 2 + 1e-6)))
-            if q_curr < q_prev:
-                self._trigger_loss_anim(i, q_prev - q_curr)
+        Args:
+            fill_w: Filled width in pixels (0 = empty, heart width = full)
+            scale: Animation scale (1.0 = not animating)
 
-        self.prev_hp = shown_hp
+        Returns:
+            Heart slot surface (shared, read-only)
+        """
+        key = (fill_w, scale)
+        img = self._slot_images.get(key)
+        if img is not None:
+            return img
 
-        have_img = (self.heart is not None and self.dim_heart is not None)
-        heart_w = self.heart.get_width() if have_img else self.heart_size
-        heart_h = self.heart.get_height() if have_img else self.heart_size
+        heart_w, heart_h = self._heart_dims()
+        if scale != 1.0:
+            base = self._slot_image(fill_w, 1.0)
+            img = pygame.transform.smoothscale(base, (max(1, int(heart_w * scale)), max(1, int(heart_h * scale))))
+            if len(self._slot_images) >= self.MAX_SCALED_SLOTS:
+                self._slot_images = {k: v for k, v in self._slot_images.items() if k[1] == 1.0}
+        elif self.heart is not None and self.dim_heart is not None:
+            if fill_w == 0:
+                img = self.dim_heart
+            elif fill_w >= heart_w:
+                img = self.heart
+            else:
+                # dim background then the filled portion of the heart
+                img = pygame.Surface((heart_w, heart_h), pygame.SRCALPHA)
+                img.blit(self.dim_heart, (0, 0))
+                img.blit(self.heart, (0, 0), area=pygame.Rect(0, 0, fill_w, heart_h))
+        else:
+            img = pygame.Surface((heart_w, heart_h), pygame.SRCALPHA)
+            pygame.draw.rect(img, (80, 80, 80, 140), img.get_rect(), border_radius=heart_h // 4)
+            if fill_w:
+                fg = pygame.Surface((fill_w, heart_h), pygame.SRCALPHA)
+                pygame.draw.rect(fg, (220, 30, 30, 255), fg.get_rect(), border_radius=heart_h // 4)
+                img.blit(fg, (0, 0))
+        self._slot_images[key] = img
+        return img
+
+    def _layout(self, slots, shown_hp, scales, shoe, shield):
+        """
+        Lay out everything the HUD shows.
+
+        Args:
+            slots: Number of heart slots
+            shown_hp: HP shown by the hearts
+            scales: Animation scale per slot
+            shoe: (charges, countdown seconds or None) or None when hidden
+            shield: (charges, countdown seconds or None) or None when hidden
+
+        Returns:
+            (blits, overlay): lists of (surface, (x, y)) in screen coordinates,
+            in drawing order; overlay goes on top of the composite
+        """
+        blits = []
+        overlay = []
+        heart_w, heart_h = self._heart_dims()
         step_w = heart_w + self.spacing
 
         for i in range(slots):
             base_x = self.x0 + i * step_w
             y = self.y0
             filled = (shown_hp - i * self.hp_per_heart) / self.hp_per_heart
-
-            # compute animation scale only (no shake for simplicity)
-            scale = self._get_anim_scale(i)
-
             if filled <= 0:
-                # empty slot
-                if have_img:
-                    img = self.dim_heart
-                    if scale != 1.0:
-                        # scale around center
-                        w2 = max(1, int(heart_w * scale))
-                        h2 = max(1, int(heart_h * scale))
-                        scaled = pygame.transform.smoothscale(img, (w2, h2))
-                        x = base_x + (heart_w - w2) // 2
-                        surface.blit(scaled, (x, y + (heart_h - h2) // 2))
-                    else:
-                        surface.blit(img, (base_x, y))
-                else:
-                    bg = pygame.Surface((heart_w, heart_h), pygame.SRCALPHA)
-                    pygame.draw.rect(bg, (80, 80, 80, 140), bg.get_rect(), border_radius=heart_h // 4)
-                    if scale != 1.0:
-                        w2 = max(1, int(heart_w * scale))
-                        h2 = max(1, int(heart_h * scale))
-                        bg = pygame.transform.smoothscale(bg, (w2, h2))
-                        x = base_x + (heart_w - w2) // 2
-                        surface.blit(bg, (x, y + (heart_h - h2) // 2))
-                    else:
-                        surface.blit(bg, (base_x, y))
-                continue
-
-            # draw background dim then filled portion, with animation scaling
-            draw_x = base_x
-            if have_img:
-                # compose into a temporary surface to scale together
-                temp = pygame.Surface((heart_w, heart_h), pygame.SRCALPHA)
-                if filled >= 1:
-                    temp.blit(self.heart, (0, 0))
-                else:
-                    temp.blit(self.dim_heart, (0, 0))
-                    w = max(1, int(filled * heart_w))
-                    area = pygame.Rect(0, 0, w, heart_h)
-                    temp.blit(self.heart, (0, 0), area=area)
-                if scale != 1.0:
-                    w2 = max(1, int(heart_w * scale))
-                    h2 = max(1, int(heart_h * scale))
-                    temp = pygame.transform.smoothscale(temp, (w2, h2))
-                    draw_x = base_x + (heart_w - w2) // 2
-                    surface.blit(temp, (draw_x, y + (heart_h - h2) // 2))
-                else:
-                    surface.blit(temp, (draw_x, y))
+                fill_w = 0
+            elif filled >= 1:
+                fill_w = heart_w
             else:
-                bg = pygame.Surface((heart_w, heart_h), pygame.SRCALPHA)
-                pygame.draw.rect(bg, (80, 80, 80, 140), bg.get_rect(), border_radius=heart_h // 4)
-                w = max(1, int(min(1.0, filled) * heart_w))
-                fg = pygame.Surface((w, heart_h), pygame.SRCALPHA)
-                pygame.draw.rect(fg, (220, 30, 30, 255), fg.get_rect(), border_radius=heart_h // 4)
-                temp = pygame.Surface((heart_w, heart_h), pygame.SRCALPHA)
-                temp.blit(bg, (0, 0))
-                temp.blit(fg, (0, 0))
-                if scale != 1.0:
-                    w2 = max(1, int(heart_w * scale))
-                    h2 = max(1, int(heart_h * scale))
-                    temp = pygame.transform.smoothscale(temp, (w2, h2))
-                    draw_x = base_x + (heart_w - w2) // 2
-                    surface.blit(temp, (draw_x, y + (heart_h - h2) // 2))
-                else:
-                    surface.blit(temp, (draw_x, y))
+                fill_w = max(1, int(filled * heart_w))
+            img = self._slot_image(fill_w, scales[i])
+            # scaled hearts stay centred on their slot
+            w2, h2 = img.get_size()
+            blits.append((img, (base_x + (heart_w - w2) // 2, y + (heart_h - h2) // 2)))
 
         # Draw shoe speed boost icon, charges and countdown to the right of hearts
-        shoe_active = (speed_boost_seconds is not None and speed_boost_seconds > 0)
-        shoe_have = (speed_boost_charges is not None and speed_boost_charges > 0)
         draw_x = self.x0 + slots * step_w + self.spacing * 4
-        if shoe_active or shoe_have:
+        if shoe is not None:
+            charges, secs = shoe
             self._ensure_shoe_assets()
             y = self.y0 + max(0, (heart_h - self._shoe_size) // 2)
             # Icon
-            surface.blit(self._shoe_icon, (draw_x, y))
+            blits.append((self._shoe_icon, (draw_x, y)))
             # Charges text (e.g., x3) with activation key hint
-            charges_txt = f"x{max(0, int(speed_boost_charges or 0))} (E)"
-            charges_surf = self._font_small.render(charges_txt, True, (255, 255, 255))
+            charges_surf = text_cache.render(self._font_small, f"x{charges} (E)", True, (255, 255, 255))
             cx = draw_x + self._shoe_size + 10
             cy = y + (self._shoe_size - charges_surf.get_height()) // 2
-            surface.blit(charges_surf, (cx, cy))
+            blits.append((charges_surf, (cx, cy)))
             end_x = cx + charges_surf.get_width()
             # If active, show countdown after charges (transparent background)
-            if shoe_active:
-                secs = int(max(0, speed_boost_seconds))
-                text_surf = self._font_small.render(str(secs), True, (255, 255, 255))
+            if secs is not None:
+                text_surf = text_cache.render(self._font_small, str(secs), True, (255, 255, 255))
                 box_x = end_x + 10
                 box_y = y + (self._shoe_size - text_surf.get_height()) // 2
-                surface.blit(text_surf, (box_x, box_y))
+                blits.append((text_surf, (box_x, box_y)))
                 end_x = box_x + text_surf.get_width()
-            draw_x = (end_x + 20) if 'end_x' in locals() else (draw_x + self._shoe_size + 60)
+            draw_x = end_x + 20
 
         # Draw shield icon, charges and countdown after the shoe block
-        shield_active = (shield_seconds is not None and shield_seconds > 0)
-        shield_have = (shield_charges is not None and shield_charges > 0)
-        if shield_active or shield_have:
+        if shield is not None:
+            charges, secs = shield
             self._ensure_shield_assets()
             y = self.y0 + max(0, (heart_h - self._shield_size) // 2)
             # Icon
-            surface.blit(self._shield_icon, (draw_x, y))
+            blits.append((self._shield_icon, (draw_x, y)))
             # Charges text
-            charges_txt = f"x{max(0, int(shield_charges or 0))}"
-            charges_surf = self._font_small.render(charges_txt, True, (255, 255, 255))
+            charges_surf = text_cache.render(self._font_small, f"x{charges}", True, (255, 255, 255))
             cx = draw_x + self._shield_size + 10
             cy = y + (self._shield_size - charges_surf.get_height()) // 2
-            surface.blit(charges_surf, (cx, cy))
+            blits.append((charges_surf, (cx, cy)))
             end2_x = cx + charges_surf.get_width()
-            if shield_active:
-                secs = int(max(0, shield_seconds))
-                text_surf = self._font_small.render(str(secs), True, (255, 255, 255))
+            if secs is not None:
+                text_surf = text_cache.render(self._font_small, str(secs), True, (255, 255, 255))
                 pad_x = 8
                 pad_y = 4
                 box_w = text_surf.get_width() + pad_x * 2
@@ -318,5 +292,63 @@ class HeartsHUD:
                 box_x = end2_x + 10
                 bg = pygame.Surface((box_w, box_h), pygame.SRCALPHA)
                 bg.fill((0, 0, 0, 140))
-                surface.blit(bg, (box_x, box_y))
-                surface.blit(text_surf, (box_x + pad_x, box_y + pad_y))
+                overlay.append((bg, (box_x, box_y)))
+                overlay.append((text_surf, (box_x + pad_x, box_y + pad_y)))
+
+        return blits, overlay
+
+    def _rebuild(self, *state):
+        """Compose the laid out HUD into one surface covering all of it."""
+        blits, self._overlay = self._layout(*state)
+        bounds = pygame.Rect(blits[0][1], blits[0][0].get_size())
+        bounds.unionall_ip([pygame.Rect(pos, img.get_size()) for img, pos in blits[1:]])
+        composite = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        composite.blits([(img, (x - bounds.x, y - bounds.y)) for img, (x, y) in blits], doreturn=False)
+        self._composite = composite
+        self._composite_pos = bounds.topleft
+        self.rebuilds += 1
+
+    @staticmethod
+    def _icon_state(seconds, charges):
+        """(charges, countdown or None) for a power-up, or None when nothing is shown."""
+        active = seconds is not None and seconds > 0
+        if not active and not (charges is not None and charges > 0):
+            return None
+        return max(0, int(charges or 0)), (int(max(0, seconds)) if active else None)
+
+    def draw(self, surface: pygame.Surface, player_obj, speed_boost_seconds=None, speed_boost_charges=None, shield_seconds=None, shield_charges=None):
+        slots = min(3, max(1, player_obj.max_hp // self.hp_per_heart))
+        max_shown = slots * self.hp_per_heart
+        shown_hp = max(0, min(player_obj.hp, max_shown))
+
+        # Detect losses (heart or half-heart) per slot
+        if self.prev_hp is None:
+            self.prev_hp = shown_hp
+        prev_shown = max(0, min(self.prev_hp, max_shown))
+
+        # compare quantized to halves in each slot
+        if shown_hp < prev_shown:
+            for i in range(slots):
+                prev_filled = (prev_shown - i * self.hp_per_heart) / self.hp_per_heart
+                curr_filled = (shown_hp - i * self.hp_per_heart) / self.hp_per_heart
+                q_prev = max(0, min(2, int(prev_filled * 2 + 1e-6)))
+                q_curr = max(0, min(2, int(curr_filled * 2 + 1e-6)))
+                if q_curr < q_prev:
+                    self._trigger_loss_anim(i, q_prev - q_curr)
+
+        self.prev_hp = shown_hp
+
+        # Rebuild the composite only when what it shows changes
+        scales = tuple(self._get_anim_scale(i) for i in range(slots)) if self.anim else (1.0,) * slots
+        key = (slots, shown_hp, scales,
+               self._icon_state(speed_boost_seconds, speed_boost_charges),
+               self._icon_state(shield_seconds, shield_charges))
+        if key != self._composite_key:
+            self._rebuild(*key)
+            self._composite_key = key
+
+        # Screen areas drawn to (used by dirty-rect rendering)
+        drawn = [surface.blit(self._composite, self._composite_pos)]
+        if self._overlay:
+            drawn.extend(surface.blits(self._overlay))
+        return drawn
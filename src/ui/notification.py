@@ -1,7 +1,277 @@
+"""
+Floating text notifications ("Room Cleared!", power-up messages, ...).
+
+A notification grows, pulses, shrinks and fades over its timer. Rendering
+the text, scaling it and building the glow every frame is costly, so the
+animation is quantized to NOTIFICATION_STEPS steps across the timer and
+each step is rendered once. Frames are cached per message (font, text,
+color) in notification_frames and shared by every notification showing
+the same message.
+"""
 import pygame
 import math
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
 from src.core.constants import*
 
+# Animation steps across a notification's timer
+NOTIFICATION_STEPS = 32
+
+_COLOR_MAP = {
+    "cyan": (0, 255, 255),
+    "green": (0, 255, 0),
+    "red": (255, 0, 0),
+    "white": (255, 255, 255),
+    "yellow": (255, 255, 0),
+    "gold": (255, 215, 0),
+}
+
+# (text surface with alpha applied, glow surface or None); None = too small to draw
+Frame = Optional[Tuple[pygame.Surface, Optional[pygame.Surface]]]
+
+
+def _animated_scale(progress: float) -> float:
+    """Pulsating scale effect - starts small, grows, then shrinks."""
+    if progress < 0.3:
+        # Grow phase
+        return 0.5 + (progress / 0.3) * 1.5  # From 0.5 to 2.0
+    elif progress < 0.7:
+        # Stay large
+        return 2.0 + math.sin((progress - 0.3) * 10) * 0.2  # Slight pulse
+    # Shrink phase
+    return 2.0 - ((progress - 0.7) / 0.3) * 1.5  # From 2.0 to 0.5
+
+
+def _animated_alpha(progress: float) -> int:
+    """Fade out at the end."""
+    if progress > 0.8:
+        return int(255 * (1 - (progress - 0.8) / 0.2))
+    return 255
+
+
+def _animated_color(color, progress: float) -> Tuple[int, int, int]:
+    """Resolve a color name/tuple; "gold" cycles through a rainbow effect."""
+    if color == "gold":
+        r = 255
+        g = min(255, 215 + int(math.sin(progress * 10) * 40))
+        b = max(0, int(math.sin(progress * 15) * 100))
+        current_color = (r, g, b)
+    elif isinstance(color, str):
+        current_color = _COLOR_MAP.get(color.lower(), (255, 255, 255))
+    elif isinstance(color, tuple) and len(color) == 3:
+        current_color = color
+    else:
+        # Default to white if color is invalid
+        current_color = (255, 255, 255)
+
+    # Ensure all color values are integers in valid range
+    return tuple(max(0, min(255, int(c))) for c in current_color)
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, int) or (isinstance(value, str) and value.isdigit())
+
+
+class NotificationFrames:
+    """
+    The quantized animation of one message.
+
+    Frames are rendered on first use and shared by every notification
+    showing the message, so they must be treated as read-only.
+
+    Attributes:
+        text (str): Displayed text
+        steps (int): Number of animation steps
+        glow (bool): Whether frames have the glow used for numbers
+    """
+
+    def __init__(self, font: pygame.font.Font, text: str, color, glow: bool,
+                 steps: int = NOTIFICATION_STEPS) -> None:
+        """
+        Render the message text (once; animated colors render per step).
+
+        Args:
+            font: Font to render with
+            text: Displayed text
+            color: Color name, RGB tuple or "gold" (animated)
+            glow: Draw the glow used for numbers
+            steps: Number of animation steps
+        """
+        self.font = font
+        self.text = text
+        self.color = color
+        self.glow = glow
+        self.steps = steps
+        self._animated_color = color == "gold"
+        self._text = None if self._animated_color else font.render(text, True, _animated_color(color, 0.0))
+        self._frames: List[Frame] = [None] * steps
+        self._rendered = [False] * steps
+
+    def step_for(self, count: int, timer: int) -> int:
+        """
+        Get the animation step shown at a point of the timer.
+
+        Args:
+            count: Ticks since the notification appeared
+            timer: Notification lifetime in ticks
+
+        Returns:
+            Step index (0 to steps - 1)
+        """
+        return max(0, min(self.steps - 1, int(count * self.steps / timer)))
+
+    def frame(self, step: int) -> Frame:
+        """
+        Get the frame of an animation step, rendering it on first use.
+
+        Args:
+            step: Step index (see step_for())
+
+        Returns:
+            (text surface, glow surface or None), or None if nothing is visible
+        """
+        if not self._rendered[step]:
+            self._frames[step] = self._render(step / self.steps)
+            self._rendered[step] = True
+        return self._frames[step]
+
+    def _render(self, progress: float) -> Frame:
+        """Render the text scaled, faded and (for numbers) glowing at one point of the animation."""
+        text = self._text
+        if text is None:
+            text = self.font.render(self.text, True, _animated_color(self.color, progress))
+        scale = _animated_scale(progress)
+        alpha = _animated_alpha(progress)
+
+        # Apply scaling
+        scaled_width = int(text.get_width() * scale)
+        scaled_height = int(text.get_height() * scale)
+        if scaled_width <= 0 or scaled_height <= 0:
+            return None
+
+        scaled_text = pygame.transform.scale(text, (scaled_width, scaled_height))
+        # Apply alpha transparency
+        scaled_text.set_alpha(alpha)
+
+        glow_surface = None
+        if self.glow:
+            # Draw glow layers
+            glow_surface = pygame.Surface((scaled_width + 20, scaled_height + 20), pygame.SRCALPHA)
+            for i in range(3):
+                glow_size = (scaled_width + i * 8, scaled_height + i * 8)
+                glow_alpha = int(alpha * 0.3 / (i + 1))
+                glow_text = pygame.transform.scale(text, glow_size)
+                glow_text.set_alpha(glow_alpha)
+                glow_text_rect = glow_text.get_rect(center=(scaled_width // 2 + 10, scaled_height // 2 + 10))
+                glow_surface.blit(glow_text, glow_text_rect)
+        return scaled_text, glow_surface
+
+    def __repr__(self) -> str:
+        """
+        String representation for debugging.
+
+        Returns:
+            String showing the text and rendered step count
+        """
+        return f"NotificationFrames(text={self.text!r}, rendered={sum(self._rendered)}/{self.steps})"
+
+
+class NotificationFrameCache:
+    """
+    LRU cache of NotificationFrames keyed by (font, text, color).
+
+    Attributes:
+        max_entries (int): Maximum number of cached messages
+        hits (int): Notifications that reused a cached message
+        misses (int): Messages that had to be created
+    """
+
+    DEFAULT_MAX_ENTRIES = 32
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached messages
+
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+
+        self.max_entries = max_entries
+        self._messages: 'OrderedDict[tuple, NotificationFrames]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, font: pygame.font.Font, text: str, color, glow: bool) -> NotificationFrames:
+        """
+        Get the frames of a message, creating them on a cache miss.
+
+        Args:
+            font: Font to render with
+            text: Displayed text
+            color: Color name, RGB tuple or "gold"
+            glow: Draw the glow used for numbers
+
+        Returns:
+            Shared NotificationFrames
+        """
+        key = (font, text, color, glow)
+        frames = self._messages.get(key)
+        if frames is not None:
+            self._messages.move_to_end(key)
+            self.hits += 1
+            return frames
+
+        frames = NotificationFrames(font, text, color, glow)
+        self.misses += 1
+        self._messages[key] = frames
+        if len(self._messages) > self.max_entries:
+            self._messages.popitem(last=False)
+        return frames
+
+    def clear(self) -> None:
+        """Drop all cached messages (counters are kept)."""
+        self._messages.clear()
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with entries, hits, misses and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._messages),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def __len__(self) -> int:
+        """Get the number of cached messages."""
+        return len(self._messages)
+
+    def __repr__(self) -> str:
+        """
+        String representation for debugging.
+
+        Returns:
+            String showing cache size and hit/miss counters
+        """
+        return (f"NotificationFrameCache(entries={len(self._messages)}/{self.max_entries}, "
+                f"hits={self.hits}, misses={self.misses})")
+
+
+# Global cache shared by all notifications
+notification_frames = NotificationFrameCache()
+
+
 class Notification:
 
     def __init__(self, x, y, value, color, font):
@@ -18,96 +288,45 @@ class Notification:
         self.rotation = 0
         self.alpha = 255
 
-    def draw(self, screen):
-        # Calculate animation progress (0 to 1)
-        progress = self.count / self.timer
+        # Create text with special formatting for numbers
+        glow = _is_number(value)
+        display_text = f"+{value} ✨" if glow else str(value)  # Add sparkle emoji
+        self.frames = notification_frames.get(font, display_text, color, glow)
 
-        # Pulsating scale effect - starts small, grows, then shrinks
-        if progress < 0.3:
-            # Grow phase
-            self.scale = 0.5 + (progress / 0.3) * 1.5  # From 0.5 to 2.0
-        elif progress < 0.7:
-            # Stay large
-            self.scale = 2.0 + math.sin((progress - 0.3) * 10) * 0.2  # Slight pulse
-        else:
-            # Shrink phase
-            self.scale = 2.0 - ((progress - 0.7) / 0.3) * 1.5  # From 2.0 to 0.5
-
-        # Color animation - cycle through rainbow effect for gold
-        if self.color == "gold":
-            hue_shift = int(progress * 60)  # Cycle through colors
-            r = 255
-            g = min(255, 215 + int(math.sin(progress * 10) * 40))
-            b = max(0, int(math.sin(progress * 15) * 100))
-            current_color = (r, g, b)
-        else:
-            # Convert color string to RGB if needed
-            if isinstance(self.color, str):
-                color_map = {
-                    "cyan": (0, 255, 255),
-                    "green": (0, 255, 0),
-                    "red": (255, 0, 0),
-                    "white": (255, 255, 255),
-                    "yellow": (255, 255, 0),
-                    "gold": (255, 215, 0),
-                }
-                current_color = color_map.get(self.color.lower(), (255, 255, 255))
-            elif isinstance(self.color, tuple) and len(self.color) == 3:
-                current_color = self.color
-            else:
-                # Default to white if color is invalid
-                current_color = (255, 255, 255)
-
-        # Ensure all color values are integers in valid range
-        current_color = (
-            max(0, min(255, int(current_color[0]))),
-            max(0, min(255, int(current_color[1]))),
-            max(0, min(255, int(current_color[2])))
-        )
-
-        # Fade out at the end
+    def draw(self, screen):
+        # Current animation step (scale, color and alpha are baked into the frame)
+        step = self.frames.step_for(self.count, self.timer)
+        progress = step / self.frames.steps
+        self.scale = _animated_scale(progress)
         if progress > 0.8:
-            self.alpha = int(255 * (1 - (progress - 0.8) / 0.2))
+            self.alpha = _animated_alpha(progress)
 
-        # Create text with special formatting for numbers
-        if isinstance(self.value, int) or (isinstance(self.value, str) and self.value.isdigit()):
-            display_text = f"+{self.value} ✨"  # Add sparkle emoji
-        else:
-            display_text = str(self.value)
+        frame = self.frames.frame(step)
+        if frame is None:
+            return None
+        scaled_text, glow_surface = frame
+        scaled_width, scaled_height = scaled_text.get_size()
 
-        # Render text
-        text = self.font.render(display_text, True, current_color)
+        drawn = None
+        if glow_surface is not None:
+            # Draw glow
+            drawn = screen.blit(glow_surface, (self.x - 10, self.y - 10))
 
-        # Apply scaling
-        scaled_width = int(text.get_width() * self.scale)
-        scaled_height = int(text.get_height() * self.scale)
-
-        if scaled_width > 0 and scaled_height > 0:
-            scaled_text = pygame.transform.scale(text, (scaled_width, scaled_height))
-
-            # Apply alpha transparency
-            scaled_text.set_alpha(self.alpha)
-
-            # Draw with glow effect for numbers
-            if isinstance(self.value, int) or (isinstance(self.value, str) and self.value.isdigit()):
-                # Draw glow layers
-                glow_surface = pygame.Surface((scaled_width + 20, scaled_height + 20), pygame.SRCALPHA)
-                for i in range(3):
-                    glow_size = (scaled_width + i * 8, scaled_height + i * 8)
-                    glow_alpha = int(self.alpha * 0.3 / (i + 1))
-                    glow_text = pygame.transform.scale(text, glow_size)
-                    glow_text.set_alpha(glow_alpha)
-                    glow_text_rect = glow_text.get_rect(center=(scaled_width // 2 + 10, scaled_height // 2 + 10))
-                    glow_surface.blit(glow_text, glow_text_rect)
-
-                # Draw glow
-                screen.blit(glow_surface, (self.x - 10, self.y - 10))
-
-            # Draw main text centered
-            text_rect = scaled_text.get_rect(center=(self.x + scaled_width // 2, self.y + scaled_height // 2))
-            screen.blit(scaled_text, text_rect)
-
-    def update(self, notifications: list["Notification"]):
+        # Draw main text centered
+        text_rect = scaled_text.get_rect(center=(self.x + scaled_width // 2, self.y + scaled_height // 2))
+        text_rect = screen.blit(scaled_text, text_rect)
+
+        # Area drawn to (used by dirty-rect rendering)
+        return drawn.union(text_rect) if drawn else text_rect
+
+    def update(self) -> bool:
+        """
+        Advance the animation by one tick.
+
+        Returns:
+            True while the notification is showing, False once its timer
+            expired (the owner drops it, see Simulation.step)
+        """
         self.count += 1
 
         # Smooth floating movement
@@ -122,6 +341,4 @@ class Notification:
         # Add slight horizontal wave motion
         self.x = self.x + math.sin(self.count * 0.3) * 0.5
 
-        # Remove when timer expires
-        if self.count >= self.timer:
-            notifications.remove(self)
+        return self.count < self.timer
@@ -1,13 +1,29 @@
-"""UI Screen modules for different game screens."""
-
-from .start_screen import show_start_screen
-from .about_screen import show_about_screen
-from .map_screen import show_map
-from .game_over_screen import show_game_over
-
-__all__ = [
-    'show_start_screen',
-    'show_about_screen',
-    'show_map',
-    'show_game_over'
-]
+"""UI Screen modules for different game screens.
+
+Screens are imported on first access, so showing the start screen does
+not load the others.
+"""
+import importlib
+
+_EXPORTS = {
+    'show_start_screen': 'src.ui.screens.start_screen',
+    'show_about_screen': 'src.ui.screens.about_screen',
+    'show_map': 'src.ui.screens.map_screen',
+    'show_game_over': 'src.ui.screens.game_over_screen',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import a screen function from its module on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -4,6 +4,8 @@ Game over screen with play again button.
 import pygame
 from pygame.locals import QUIT, KEYDOWN, K_ESCAPE, MOUSEBUTTONDOWN
 
+from src.managers.resource_manager import resource_manager
+
 
 def show_game_over(screen, font, clock, screen_width, screen_height):
     """
@@ -19,30 +21,14 @@ def show_game_over(screen, font, clock, screen_width, screen_height):
     Returns:
         'restart' to play again, 'quit' to exit
     """
-    gameover_img = None
-    try:
-        gameover_img = pygame.image.load("game/gameover.png").convert_alpha()
-    except Exception:
-        try:
-            gameover_img = pygame.image.load("gameover.png").convert_alpha()
-        except Exception:
-            gameover_img = None
-
-    if gameover_img is not None:
-        img = pygame.transform.smoothscale(gameover_img, (screen_width, screen_height))
+    # Scaled images are cached by the resource manager (and on disk)
+    img = resource_manager.load_image("gameover.png", scale=(screen_width, screen_height))
+    if img is not None:
         img_rect = img.get_rect(topleft=(0, 0))
     else:
-        img = None
         img_rect = pygame.Rect(0, 0, screen_width, screen_height)
 
-    button_img_raw = None
-    try:
-        button_img_raw = pygame.image.load("game/playagainbutton.png").convert_alpha()
-    except Exception:
-        try:
-            button_img_raw = pygame.image.load("playagainbutton.png").convert_alpha()
-        except Exception:
-            button_img_raw = None
+    button_img_raw = resource_manager.load_image("playagainbutton.png")
 
     if button_img_raw is not None:
         raw_w, raw_h = button_img_raw.get_size()
@@ -51,7 +37,7 @@ def show_game_over(screen, font, clock, screen_width, screen_height):
         scale = min(target_h / raw_h, max_w / raw_w)
         new_w = max(1, int(raw_w * scale))
         new_h = max(1, int(raw_h * scale))
-        button_img = pygame.transform.smoothscale(button_img_raw, (new_w, new_h))
+        button_img = resource_manager.load_image("playagainbutton.png", scale=(new_w, new_h))
         button_rect = button_img.get_rect()
     else:
         button_img = None
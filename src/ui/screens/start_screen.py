@@ -5,7 +5,31 @@ import pygame
 from pygame.locals import QUIT, KEYDOWN, K_ESCAPE, MOUSEBUTTONDOWN
 
 
-def show_start_screen(screen, start_screen_image, clock, screen_width, screen_height):
+LOADING_BAR_SIZE = (420, 8)
+LOADING_BAR_COLOR = (255, 255, 255)
+LOADING_BAR_BACKGROUND = (40, 40, 40)
+
+
+def draw_loading_bar(screen, progress, screen_width, screen_height):
+    """
+    Draw a thin loading progress bar near the bottom of the screen.
+    
+    Args:
+        screen: pygame screen surface
+        progress: loaded fraction (0.0 - 1.0)
+        screen_width: screen width in pixels
+        screen_height: screen height in pixels
+    """
+    bar_w, bar_h = LOADING_BAR_SIZE
+    bar_rect = pygame.Rect(0, 0, bar_w, bar_h)
+    bar_rect.center = (screen_width // 2, screen_height - 40)
+    pygame.draw.rect(screen, LOADING_BAR_BACKGROUND, bar_rect)
+    fill_rect = bar_rect.copy()
+    fill_rect.width = int(bar_w * max(0.0, min(1.0, progress)))
+    pygame.draw.rect(screen, LOADING_BAR_COLOR, fill_rect)
+
+
+def show_start_screen(screen, start_screen_image, clock, screen_width, screen_height, loader=None):
     """
     Display the start screen with interactive buttons and a simple click animation.
     
@@ -15,6 +39,8 @@ def show_start_screen(screen, start_screen_image, clock, screen_width, screen_he
         clock: pygame clock for FPS control
         screen_width: screen width in pixels
         screen_height: screen height in pixels
+        loader: optional PreloadJob; finalized a few ms per frame, with its
+                progress shown until it is done
         
     Returns:
         'start' to begin the game, 'about' for about screen, or 'quit' to exit
@@ -43,6 +69,9 @@ def show_start_screen(screen, start_screen_image, clock, screen_width, screen_he
         t = max(0.0, min(1.0, t))
         return 1 - (1 - t) ** 3
 
+    # Scale start screen to fit screen (once, not every frame)
+    scaled_start = pygame.transform.scale(start_screen_image, (screen_width, screen_height))
+
     waiting = True
     while waiting:
         for event in pygame.event.get():
@@ -66,9 +95,6 @@ def show_start_screen(screen, start_screen_image, clock, screen_width, screen_he
                     click_start_ms = pygame.time.get_ticks()
 
         screen.fill((0, 0, 0))
-
-        # Scale start screen to fit screen
-        scaled_start = pygame.transform.scale(start_screen_image, (screen_width, screen_height))
         screen.blit(scaled_start, (0, 0))
 
         # If clicked, play a zoom-and-tilt animation (no circle) and then finish
@@ -96,5 +122,9 @@ def show_start_screen(screen, start_screen_image, clock, screen_width, screen_he
             if elapsed >= click_duration_ms:
                 return click_action
 
+        # Assets keep loading in the background while the menu is shown
+        if loader is not None and not loader.done:
+            draw_loading_bar(screen, loader.pump(), screen_width, screen_height)
+
         pygame.display.update()
         clock.tick(60)
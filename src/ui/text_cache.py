@@ -0,0 +1,161 @@
+"""
+Text surface cache and font registry.
+
+Rendering text with pygame.font is one of the more expensive things the
+HUD does, and most labels show the same string frame after frame. This
+module keeps rendered text surfaces in a small LRU cache keyed by
+(font, text, color, antialias), so a label is only re-rendered when the
+value it shows changes, and keeps one Font object per (name, size, style)
+so fonts are never constructed inside the game loop.
+"""
+import pygame
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+TextKey = Tuple[pygame.font.Font, str, Tuple[int, ...], bool]
+
+
+class TextCache:
+    """
+    LRU cache of rendered text surfaces.
+
+    Cached surfaces are shared between callers, so they must be treated as
+    read-only (blit them, don't draw on them).
+
+    Attributes:
+        max_entries (int): Maximum number of cached surfaces
+        hits (int): Lookups served from the cache
+        misses (int): Lookups that had to call Font.render
+        evictions (int): Surfaces dropped to stay within max_entries
+        renders_last_frame (int): Font.render calls during the previous frame
+
+    Example:
+        >>> text = text_cache.render(font, f"Level: {level}", True, (255, 215, 0))
+        >>> screen.blit(text, (20, 100))
+    """
+
+    DEFAULT_MAX_ENTRIES = 256
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached surfaces
+
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+
+        self.max_entries = max_entries
+        self._surfaces: 'OrderedDict[TextKey, pygame.Surface]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.renders_last_frame = 0
+        self._renders_this_frame = 0
+
+    def render(self, font: pygame.font.Font, text: str, antialias: bool,
+               color: Tuple[int, ...]) -> pygame.Surface:
+        """
+        Get a rendered text surface, rendering it only on a cache miss.
+
+        Takes the same arguments as Font.render (without background).
+
+        Args:
+            font: Font to render with
+            text: Text to render
+            antialias: Whether to use antialiasing
+            color: Text color
+
+        Returns:
+            Rendered (shared, read-only) text surface
+        """
+        key = (font, text, tuple(color), bool(antialias))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        surface = font.render(text, antialias, color)
+        self.misses += 1
+        self._renders_this_frame += 1
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def begin_frame(self) -> None:
+        """Mark the start of a new frame (rolls the per-frame render counter)."""
+        self.renders_last_frame = self._renders_this_frame
+        self._renders_this_frame = 0
+
+    def clear(self) -> None:
+        """Drop all cached surfaces (counters are kept)."""
+        self._surfaces.clear()
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with entries, hits, misses, hit_rate, evictions and
+            renders_last_frame
+        """
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._surfaces),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'renders_last_frame': self.renders_last_frame,
+        }
+
+    def __len__(self) -> int:
+        """Get the number of cached surfaces."""
+        return len(self._surfaces)
+
+    def __repr__(self) -> str:
+        """
+        String representation for debugging.
+
+        Returns:
+            String showing cache size and hit/miss counters
+        """
+        return (f"TextCache(entries={len(self._surfaces)}/{self.max_entries}, "
+                f"hits={self.hits}, misses={self.misses}, evictions={self.evictions})")
+
+
+# Font registry: (name, size, bold, italic) -> Font
+_fonts: Dict[Tuple[Optional[str], int, bool, bool], pygame.font.Font] = {}
+
+
+def get_font(name: Optional[str], size: int, bold: bool = False, italic: bool = False) -> pygame.font.Font:
+    """
+    Get a system font, creating it only the first time it is requested.
+
+    Args:
+        name: Font name as accepted by pygame.font.SysFont (None = default font)
+        size: Font size
+        bold: Bold style
+        italic: Italic style
+
+    Returns:
+        Shared Font object
+    """
+    key = (name, size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+        _fonts[key] = font
+    return font
+
+
+# Global text cache instance
+text_cache = TextCache()
@@ -6,22 +6,47 @@ This package contains utility classes and functions following SOLID principles:
 - Particles: Visual effects system (particles, blood effects, gravestones)
 - Vector2D: 2D vector mathematics
 - CollisionDetector: Various collision detection algorithms
+- SpatialHashGrid: Uniform-grid broad phase for collision queries
+- FrameProfiler: Per-section frame timings with rolling percentiles
+- FlowField: Grid distance map steering enemies towards the player
+- CrowdSeparation: Vectorized push-apart of overlapping enemies
 
 Each module has a single, well-defined responsibility and is designed to be
 reusable and testable.
 """
 
-# Import commonly used classes for convenient access
-from src.utils.hitbox import HitBox
-from src.utils.particles import Particle, BloodParticleSystem, Gravestone
-from src.utils.vector2d import Vector2D
-from src.utils.collision_detector import CollisionDetector
-
-__all__ = [
-    'HitBox',
-    'Particle',
-    'BloodParticleSystem',
-    'Gravestone',
-    'Vector2D',
-    'CollisionDetector',
-]
+# Classes are imported on first access, so importing one submodule (e.g.
+# src.utils.hitbox) does not pull in NumPy-based ones such as particles
+import importlib
+
+_EXPORTS = {
+    'HitBox': 'src.utils.hitbox',
+    'Particle': 'src.utils.particles',
+    'ParticleEngine': 'src.utils.particles',
+    'particle_engine': 'src.utils.particles',
+    'BloodParticleSystem': 'src.utils.particles',
+    'Gravestone': 'src.utils.particles',
+    'Vector2D': 'src.utils.vector2d',
+    'CollisionDetector': 'src.utils.collision_detector',
+    'SpatialHashGrid': 'src.utils.spatial_hash',
+    'FrameProfiler': 'src.utils.profiler',
+    'profiler': 'src.utils.profiler',
+    'FlowField': 'src.utils.flow_field',
+    'CrowdSeparation': 'src.utils.crowd',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import an exported name from its module on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
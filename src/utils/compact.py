@@ -0,0 +1,35 @@
+"""
+One-pass removal of finished objects from a list.
+
+Notifications, blood effects and killed enemies leave their lists every
+frame. compact() drops them in a single stable pass instead of calling
+list.remove() on a copy (O(n) per removal), and keeps the order of the
+remaining items, so the simulation stays deterministic.
+"""
+from typing import Callable, List, TypeVar
+
+T = TypeVar('T')
+
+
+def compact(items: List[T], keep: Callable[[T], bool]) -> int:
+    """
+    Remove items from a list in place, in one pass, keeping their order.
+
+    keep is called exactly once per item, so it may also advance the item
+    (e.g. Notification.update returns whether it is still showing).
+
+    Args:
+        items: List to compact (modified in place)
+        keep: Returns True for items that stay
+
+    Returns:
+        Number of removed items
+    """
+    write = 0
+    for item in items:
+        if keep(item):
+            items[write] = item
+            write += 1
+    removed = len(items) - write
+    del items[write:]
+    return removed
@@ -0,0 +1,299 @@
+"""
+Flow-field pathfinding over a coarse grid of the room.
+
+Instead of every enemy searching for a path to the player, one breadth-first
+distance map is computed from the player's grid cell and stored together
+with a move direction per cell. Enemies then look their direction up in
+O(1). The field is only recomputed when the player enters a different
+cell, so the cost per frame does not grow with the number of enemies.
+"""
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+import pygame
+
+Cell = Tuple[int, int]
+
+# 8-neighbourhood as (row, col) offsets
+_NEIGHBOURS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+_UNREACHABLE = -1
+
+
+class FlowField:
+    """
+    Distance map and per-cell move directions towards a target position.
+
+    Cells covered by a blocked rectangle (grown by `clearance`) are
+    impassable. Where the straight line from a cell to the target crosses
+    no blocked cell, detour_direction() returns None and the caller steers
+    straight at the exact target position, as before. Other cells get the
+    direction of their neighbour closest to the target. Diagonal moves
+    never cut the corner of a blocked cell.
+
+    Attributes:
+        x (float): Left edge of the covered area
+        y (float): Top edge of the covered area
+        cell_size (int): Edge length of a grid cell in pixels
+        cols (int): Number of grid columns
+        rows (int): Number of grid rows
+        target_cell (Optional[Cell]): (col, row) the field points to
+        recomputes (int): How many times the distance map was computed
+
+    Example:
+        >>> field = FlowField.for_room(room_manager)
+        >>> field.update(player.x, player.y)  # cheap unless the cell changed
+        >>> direction = field.detour_direction(enemy.x, enemy.y)
+    """
+
+    DEFAULT_CELL_SIZE = 48
+
+    def __init__(self, bounds: Tuple[float, float, float, float],
+                 blocked: Iterable[pygame.Rect] = (),
+                 cell_size: int = DEFAULT_CELL_SIZE, clearance: int = 0) -> None:
+        """
+        Build the grid for an area.
+
+        Args:
+            bounds: Covered area (x, y, width, height)
+            blocked: Impassable rectangles (walls, obstacles)
+            cell_size: Edge length of a grid cell in pixels
+            clearance: Margin added around blocked rectangles (about half
+                       the size of the moving objects)
+
+        Raises:
+            ValueError: If cell_size is not positive
+        """
+        if cell_size <= 0:
+            raise ValueError(f"Cell size must be positive, got {cell_size}")
+
+        self.x, self.y, width, height = bounds
+        self.cell_size = cell_size
+        self._inv_cell_size = 1.0 / cell_size
+        self.cols = max(1, int(np.ceil(width / cell_size)))
+        self.rows = max(1, int(np.ceil(height / cell_size)))
+        self.passable = np.ones((self.rows, self.cols), dtype=bool)
+        for rect in blocked:
+            self._block(pygame.Rect(rect).inflate(2 * clearance, 2 * clearance))
+
+        self.target_cell: Optional[Cell] = None
+        self.recomputes = 0
+        self.distance = np.full((self.rows, self.cols), _UNREACHABLE, dtype=np.int32)
+        # Per-cell detour direction (None where the straight line is free)
+        self._directions: List[List[Optional[Tuple[float, float]]]] = [
+            [None] * self.cols for _ in range(self.rows)]
+
+    @classmethod
+    def for_room(cls, room, cell_size: int = DEFAULT_CELL_SIZE,
+                 clearance: int = 0) -> 'FlowField':
+        """
+        Create a field covering a room manager's room rect.
+
+        Args:
+            room: RoomManager or FinalRoomManager (get_bounds() and optional walls)
+            cell_size: Edge length of a grid cell in pixels
+            clearance: Margin added around walls
+
+        Returns:
+            New FlowField without a target
+        """
+        bounds = room.get_bounds()
+        # Border walls lie just outside the room; only walls reaching into it block cells
+        area = pygame.Rect(bounds)
+        blocked = [wall for wall in getattr(room, "walls", ()) if area.colliderect(wall)]
+        return cls(bounds, blocked, cell_size, clearance)
+
+    def _block(self, rect: pygame.Rect) -> None:
+        """Mark every cell overlapped by a rectangle as impassable."""
+        c0 = int((rect.left - self.x) * self._inv_cell_size)
+        r0 = int((rect.top - self.y) * self._inv_cell_size)
+        c1 = int(np.ceil((rect.right - self.x) * self._inv_cell_size))
+        r1 = int(np.ceil((rect.bottom - self.y) * self._inv_cell_size))
+        c0, c1 = max(c0, 0), min(c1, self.cols)
+        r0, r1 = max(r0, 0), min(r1, self.rows)
+        if c0 < c1 and r0 < r1:
+            self.passable[r0:r1, c0:c1] = False
+
+    def cell_at(self, x: float, y: float) -> Cell:
+        """
+        Get the (col, row) cell containing a point (clamped to the grid).
+
+        Args:
+            x: X coordinate in pixels
+            y: Y coordinate in pixels
+
+        Returns:
+            (col, row) tuple
+        """
+        col = int((x - self.x) * self._inv_cell_size)
+        row = int((y - self.y) * self._inv_cell_size)
+        return min(max(col, 0), self.cols - 1), min(max(row, 0), self.rows - 1)
+
+    def update(self, target_x: float, target_y: float) -> bool:
+        """
+        Point the field at a target, recomputing only if its cell changed.
+
+        Args:
+            target_x: Target X coordinate in pixels
+            target_y: Target Y coordinate in pixels
+
+        Returns:
+            True if the distance map was recomputed
+        """
+        cell = self.cell_at(target_x, target_y)
+        if cell == self.target_cell:
+            return False
+        self.target_cell = cell
+        self._compute(cell)
+        return True
+
+    def _compute(self, target: Cell) -> None:
+        """Breadth-first wavefront from the target cell, then per-cell directions."""
+        rows, cols = self.rows, self.cols
+        col, row = target
+        self.recomputes += 1
+
+        if self.passable.all():
+            # Open area: 8-connected distance is the Chebyshev distance and
+            # every cell sees the target
+            r_idx, c_idx = np.indices((rows, cols))
+            self.distance = np.maximum(np.abs(r_idx - row), np.abs(c_idx - col)).astype(np.int32)
+            self._directions = [[None] * cols for _ in range(rows)]
+            return
+
+        distance = np.full((rows, cols), _UNREACHABLE, dtype=np.int32)
+        passable = self.passable.copy()
+        passable[row, col] = True  # The target itself is always reachable
+
+        visited = np.zeros((rows + 2, cols + 2), dtype=bool)
+        frontier = np.zeros((rows + 2, cols + 2), dtype=bool)
+        open_cells = np.zeros((rows + 2, cols + 2), dtype=bool)
+        open_cells[1:-1, 1:-1] = passable
+        frontier[row + 1, col + 1] = True
+        visited |= frontier
+        distance[row, col] = 0
+
+        # Diagonal steps need both orthogonal cells open (no corner cutting)
+        allowed = self._allowed_moves(open_cells)
+
+        # One wavefront step per distance (8-connected, all moves cost 1)
+        step = 0
+        while frontier.any():
+            step += 1
+            grown = np.zeros_like(frontier)
+            for (dr, dc), ok in zip(_NEIGHBOURS, allowed):
+                # Cell p is reached from p - (dr, dc)
+                grown[1:-1, 1:-1] |= frontier[1 - dr:rows + 1 - dr, 1 - dc:cols + 1 - dc] & ok
+            frontier = grown & open_cells & ~visited
+            visited |= frontier
+            distance[frontier[1:-1, 1:-1]] = step
+
+        self.distance = distance
+        self._directions = self._build_directions(distance, target, allowed)
+
+    def _allowed_moves(self, open_cells: np.ndarray) -> List[np.ndarray]:
+        """
+        For each neighbour offset, which cells may be entered by that move.
+
+        Args:
+            open_cells: Padded passability mask
+
+        Returns:
+            One (rows, cols) mask per entry of _NEIGHBOURS, indexed by the
+            destination cell
+        """
+        rows, cols = self.rows, self.cols
+        allowed = []
+        for dr, dc in _NEIGHBOURS:
+            if dr and dc:
+                # Moving from p - (dr, dc) to p passes p - (dr, 0) and p - (0, dc)
+                allowed.append(open_cells[1 - dr:rows + 1 - dr, 1:-1] &
+                               open_cells[1:-1, 1 - dc:cols + 1 - dc])
+            else:
+                allowed.append(np.ones((rows, cols), dtype=bool))
+        return allowed
+
+    def _visible_from(self, target: Cell) -> np.ndarray:
+        """Cells whose straight line to the target crosses no blocked cell."""
+        col, row = target
+        r_idx, c_idx = np.indices((self.rows, self.cols))
+        # Sample every line densely enough to visit each cell it crosses
+        samples = 2 * max(self.rows, self.cols) + 1
+        t = np.linspace(0.0, 1.0, samples)[:, None, None]
+        sample_r = np.rint(r_idx + (row - r_idx) * t).astype(np.intp)
+        sample_c = np.rint(c_idx + (col - c_idx) * t).astype(np.intp)
+        passable = self.passable.copy()
+        passable[row, col] = True
+        return passable[sample_r, sample_c].all(axis=0)
+
+    def _build_directions(self, distance: np.ndarray, target: Cell,
+                          allowed: List[np.ndarray]) -> List[List[Optional[Tuple[float, float]]]]:
+        """Direction towards the closest neighbour for every cell that needs a detour."""
+        rows, cols = self.rows, self.cols
+        unreachable = distance == _UNREACHABLE
+        # Blocked cells (e.g. inside the clearance margin) lead out to a reachable neighbour
+        detour = ((distance > 0) & ~self._visible_from(target)) | unreachable
+
+        if not detour.any():
+            return [[None] * cols for _ in range(rows)]
+
+        # Neighbour distances (unreachable, off-grid and corner-cutting
+        # neighbours count as infinitely far)
+        far = np.iinfo(np.int32).max
+        padded = np.full((rows + 2, cols + 2), far, dtype=np.int64)
+        padded[1:-1, 1:-1] = np.where(unreachable, far, distance)
+        neighbour_dist = []
+        for k, (dr, dc) in enumerate(_NEIGHBOURS):
+            # Stepping p -> p + d passes the same cells as the reverse step
+            # p + d -> p, whose offset -d is the mirrored entry of _NEIGHBOURS
+            ok = allowed[len(_NEIGHBOURS) - 1 - k] | unreachable
+            neighbour_dist.append(np.where(ok, padded[1 + dr:rows + 1 + dr, 1 + dc:cols + 1 + dc], far))
+        neighbour_dist = np.stack(neighbour_dist)
+        best = neighbour_dist.argmin(axis=0)
+        # Cells with no reachable neighbour fall back to steering straight
+        detour &= neighbour_dist.min(axis=0) < far
+
+        offsets = np.array(_NEIGHBOURS, dtype=float)
+        offsets /= np.hypot(offsets[:, 0], offsets[:, 1])[:, None]
+        dir_y = offsets[best, 0]
+        dir_x = offsets[best, 1]
+
+        directions: List[List[Optional[Tuple[float, float]]]] = []
+        for r in range(rows):
+            detour_row = detour[r]
+            directions.append([(float(dir_x[r, c]), float(dir_y[r, c])) if detour_row[c] else None
+                               for c in range(cols)])
+        return directions
+
+    def detour_direction(self, x: float, y: float) -> Optional[Tuple[float, float]]:
+        """
+        Get the move direction at a point.
+
+        Args:
+            x: X coordinate in pixels
+            y: Y coordinate in pixels
+
+        Returns:
+            Unit vector (dx, dy) to move along, or None if the straight line
+            to the target is free (or no target is set)
+        """
+        col = int((x - self.x) * self._inv_cell_size)
+        row = int((y - self.y) * self._inv_cell_size)
+        if col < 0:
+            col = 0
+        elif col >= self.cols:
+            col = self.cols - 1
+        if row < 0:
+            row = 0
+        elif row >= self.rows:
+            row = self.rows - 1
+        return self._directions[row][col]
+
+    def __repr__(self) -> str:
+        """
+        String representation for debugging.
+
+        Returns:
+            String showing grid size, target cell and recompute count
+        """
+        return (f"FlowField(grid={self.cols}x{self.rows}, cell_size={self.cell_size}, "
+                f"target={self.target_cell}, recomputes={self.recomputes})")
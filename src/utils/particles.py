@@ -3,15 +3,20 @@ Particle system for visual effects.
 
 This module provides a flexible particle system for creating visual effects
 such as blood splatters, explosions, and other particle-based animations.
+All live particles are simulated and drawn in bulk by a shared
+ParticleEngine; effect classes such as BloodParticleSystem are thin
+facades over it.
 It follows the Single Responsibility Principle by separating particle logic,
 rendering, and system management into distinct classes.
 """
 import pygame
-import random
 import math
-from typing import List, Tuple
+import numpy as np
+from typing import Dict, List, Optional, Tuple
 from abc import ABC, abstractmethod
 
+from src.core.rng import rng, PARTICLES
+
 
 class IParticle(ABC):
     """
@@ -72,7 +77,7 @@ class Particle(IParticle):
         self.vx, self.vy = velocity
         self.lifetime = lifetime
         self.max_lifetime = lifetime
-        self.size = random.randint(2, 5)
+        self.size = rng.stream(PARTICLES).randint(2, 5)
     
     def update(self) -> bool:
         """
@@ -130,19 +135,296 @@ class Particle(IParticle):
         )
 
 
+class ParticleEngine:
+    """
+    Batched particle simulation shared by all particle effects.
+
+    Every live particle is stored in one set of NumPy arrays (structure of
+    arrays) instead of one Python object per particle. Integration of
+    gravity and lifetime is a handful of vectorized operations, and drawing
+    uses a pre-baked table of alpha-faded circle stamps (size x alpha level,
+    per color) that is sent to the screen with a single Surface.blits call,
+    so no surfaces are allocated while the game runs.
+
+    Particles belong to a group (one per effect, e.g. one blood explosion),
+    which lets effect objects ask how many of their particles are alive.
+
+    Attributes:
+        count (int): Number of live particles
+        capacity (int): Allocated slots in every array
+        steps (int): Number of update() calls so far
+
+    Example:
+        >>> group = particle_engine.emit_burst(x, y, 25, (0, 255, 0))
+        >>> particle_engine.update()
+        >>> particle_engine.draw(screen)
+        >>> particle_engine.group_count(group)
+        25
+    """
+
+    GRAVITY = Particle.GRAVITY
+    MIN_SIZE = 2
+    MAX_SIZE = 5
+    ALPHA_LEVELS = 16
+    INITIAL_CAPACITY = 256
+
+    _FLOAT_FIELDS = ('x', 'y', 'vx', 'vy')
+    _INT_FIELDS = ('lifetime', 'max_lifetime', 'size', 'color_id', 'group')
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY, seed: Optional[int] = None) -> None:
+        """
+        Initialize an empty engine.
+
+        Args:
+            capacity: Initial number of particle slots (grows as needed)
+            seed: Optional seed for the random generator used by emit_burst
+        """
+        self.capacity = max(1, capacity)
+        self.count = 0
+        self.steps = 0
+        # Effect object that stepped the engine last and therefore draws it
+        self.draw_owner: Optional[object] = None
+        for name in self._FLOAT_FIELDS:
+            setattr(self, name, np.zeros(self.capacity, dtype=np.float32))
+        for name in self._INT_FIELDS:
+            setattr(self, name, np.zeros(self.capacity, dtype=np.int32))
+
+        self._rng = np.random.default_rng(seed)
+        self._next_group = 0
+        self._group_counts: Dict[int, int] = {}
+        self._color_ids: Dict[Tuple[int, int, int], int] = {}
+        # Flat stamp table: index = (color_id * sizes + size - MIN_SIZE) * ALPHA_LEVELS + level
+        self._stamps: List[pygame.Surface] = []
+
+    def _grow(self, needed: int) -> None:
+        """Grow all arrays so at least `needed` slots are available."""
+        new_capacity = self.capacity
+        while new_capacity < needed:
+            new_capacity *= 2
+        if new_capacity == self.capacity:
+            return
+        for name in self._FLOAT_FIELDS + self._INT_FIELDS:
+            old = getattr(self, name)
+            new = np.zeros(new_capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.capacity = new_capacity
+
+    def _color_id(self, color: Tuple[int, int, int]) -> int:
+        """Return the stamp table id for a color, baking its stamps on first use."""
+        color = tuple(color[:3])
+        color_id = self._color_ids.get(color)
+        if color_id is None:
+            color_id = len(self._color_ids)
+            self._color_ids[color] = color_id
+            self._stamps.extend(self._bake_stamps(color))
+        return color_id
+
+    @classmethod
+    def _bake_stamps(cls, color: Tuple[int, int, int]) -> List[pygame.Surface]:
+        """Draw all size/alpha variants of a circle particle in one color."""
+        stamps = []
+        for size in range(cls.MIN_SIZE, cls.MAX_SIZE + 1):
+            for level in range(cls.ALPHA_LEVELS):
+                alpha = 255 * (level + 1) // cls.ALPHA_LEVELS
+                stamp = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+                pygame.draw.circle(stamp, (*color, alpha), (size, size), size)
+                if pygame.display.get_surface() is not None:
+                    stamp = stamp.convert_alpha()
+                stamps.append(stamp)
+        return stamps
+
+    def emit(self, x, y, vx, vy, lifetime, size, color: Tuple[int, int, int]) -> int:
+        """
+        Add a batch of particles as a new group.
+
+        All arguments except color may be scalars or arrays of equal length.
+
+        Args:
+            x: Initial X positions
+            y: Initial Y positions
+            vx: X velocities in pixels per frame
+            vy: Y velocities in pixels per frame
+            lifetime: Lifetimes in frames
+            size: Radii in pixels (clamped to MIN_SIZE..MAX_SIZE)
+            color: RGB color shared by the whole batch
+
+        Returns:
+            Group id of the new particles
+        """
+        x, y, vx, vy, lifetime, size = np.broadcast_arrays(x, y, vx, vy, lifetime, size)
+        n = x.size
+        group = self._next_group
+        self._next_group += 1
+        if n == 0:
+            return group
+
+        self._grow(self.count + n)
+        start, end = self.count, self.count + n
+        self.x[start:end] = x.ravel()
+        self.y[start:end] = y.ravel()
+        self.vx[start:end] = vx.ravel()
+        self.vy[start:end] = vy.ravel()
+        self.lifetime[start:end] = lifetime.ravel()
+        self.max_lifetime[start:end] = lifetime.ravel()
+        self.size[start:end] = np.clip(size.ravel(), self.MIN_SIZE, self.MAX_SIZE)
+        self.color_id[start:end] = self._color_id(color)
+        self.group[start:end] = group
+        self.count = end
+        self._group_counts[group] = n
+        return group
+
+    def emit_burst(self, x: float, y: float, num_particles: int, color: Tuple[int, int, int],
+                   speed: Tuple[float, float] = (2, 8), lifetime: Tuple[int, int] = (30, 60)) -> int:
+        """
+        Emit particles flying out of a point in random directions.
+
+        Args:
+            x: Center X position
+            y: Center Y position
+            num_particles: Number of particles to create
+            color: RGB color of the particles
+            speed: (min, max) initial speed in pixels per frame
+            lifetime: (min, max) lifetime in frames (inclusive)
+
+        Returns:
+            Group id of the new particles
+        """
+        rng = self._rng
+        angle = rng.uniform(0, 2 * math.pi, num_particles)
+        spd = rng.uniform(speed[0], speed[1], num_particles)
+        return self.emit(x, y, np.cos(angle) * spd, np.sin(angle) * spd,
+                         rng.integers(lifetime[0], lifetime[1] + 1, num_particles),
+                         rng.integers(self.MIN_SIZE, self.MAX_SIZE + 1, num_particles),
+                         color)
+
+    def update(self) -> None:
+        """Advance all particles by one frame and drop expired ones."""
+        self.steps += 1
+        n = self.count
+        if n == 0:
+            return
+
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.vy[:n] += self.GRAVITY
+        self.lifetime[:n] -= 1
+
+        dead = self.lifetime[:n] <= 0
+        if not dead.any():
+            return
+
+        groups, counts = np.unique(self.group[:n][dead], return_counts=True)
+        for group, dead_count in zip(groups.tolist(), counts.tolist()):
+            remaining = self._group_counts.get(group, 0) - dead_count
+            if remaining > 0:
+                self._group_counts[group] = remaining
+            else:
+                self._group_counts.pop(group, None)
+
+        keep = ~dead
+        kept = int(keep.sum())
+        for name in self._FLOAT_FIELDS + self._INT_FIELDS:
+            arr = getattr(self, name)
+            arr[:kept] = arr[:n][keep]
+        self.count = kept
+
+    def draw(self, screen: pygame.Surface) -> List[pygame.Rect]:
+        """
+        Render all live particles with their lifetime-based fade.
+
+        Args:
+            screen: Pygame surface to draw on
+
+        Returns:
+            Bounding rect of each particle group that was drawn
+        """
+        n = self.count
+        if n == 0:
+            return []
+
+        size = self.size[:n]
+        level = np.minimum(self.lifetime[:n] * self.ALPHA_LEVELS // self.max_lifetime[:n],
+                           self.ALPHA_LEVELS - 1)
+        sizes = self.MAX_SIZE - self.MIN_SIZE + 1
+        stamp_idx = (self.color_id[:n] * sizes + size - self.MIN_SIZE) * self.ALPHA_LEVELS + level
+        # int() truncation toward zero, like the per-particle renderer
+        px = (self.x[:n] - size).astype(np.int32)
+        py = (self.y[:n] - size).astype(np.int32)
+
+        stamps = self._stamps
+        screen.blits(zip(map(stamps.__getitem__, stamp_idx.tolist()),
+                         zip(px.tolist(), py.tolist())), doreturn=False)
+
+        # Groups are stored contiguously, so one bounding box per group is a reduceat
+        starts = np.flatnonzero(np.r_[True, self.group[1:n] != self.group[:n - 1]])
+        left = np.minimum.reduceat(px, starts).tolist()
+        top = np.minimum.reduceat(py, starts).tolist()
+        right = np.maximum.reduceat(px + 2 * size, starts).tolist()
+        bottom = np.maximum.reduceat(py + 2 * size, starts).tolist()
+        return [pygame.Rect(l, t, r - l, b - t) for l, t, r, b in zip(left, top, right, bottom)]
+
+    def group_count(self, group: int) -> int:
+        """
+        Get the number of live particles in a group.
+
+        Args:
+            group: Group id returned by emit/emit_burst
+
+        Returns:
+            Number of live particles in the group
+        """
+        return self._group_counts.get(group, 0)
+
+    def clear(self) -> None:
+        """Remove all particles (e.g. when a new run starts)."""
+        self.count = 0
+        self._group_counts.clear()
+        self.draw_owner = None
+
+    def reseed(self, seed: Optional[int]) -> None:
+        """
+        Restart the random generator used by emit_burst.
+
+        Args:
+            seed: New seed (None = unseeded)
+        """
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self) -> int:
+        """Get the number of live particles."""
+        return self.count
+
+    def __repr__(self) -> str:
+        """
+        String representation for debugging.
+
+        Returns:
+            String showing live particles, groups and capacity
+        """
+        return (f"ParticleEngine(particles={self.count}, groups={len(self._group_counts)}, "
+                f"capacity={self.capacity})")
+
+
+# Global particle engine shared by all effects
+particle_engine = ParticleEngine()
+
+
 class BloodParticleSystem:
     """
     Particle system for blood splatter effects.
     
-    This class manages a collection of particles that simulate a blood
-    explosion effect (green blood for enemies). It creates particles in
-    a radial explosion pattern and manages their lifecycle.
-    
-    The system follows the Single Responsibility Principle by focusing
-    solely on managing particle lifecycle and rendering.
+    This class is a thin facade over the global ParticleEngine: it emits
+    one group of particles in a radial explosion pattern (green blood for
+    enemies) and reports whether that group is still alive. The particles
+    themselves are simulated and drawn in bulk by the engine.
+
+    update() and draw() may be called on every live system each frame, as
+    before; only one system per frame actually steps and draws the engine.
     
     Attributes:
-        particles (List[Particle]): Active particles in the system
+        engine (ParticleEngine): Engine holding the particles
+        group (int): Id of this system's particle group
         color (Tuple[int, int, int]): Color of the blood particles
     """
     
@@ -155,76 +437,57 @@ class BloodParticleSystem:
     MAX_LIFETIME = 60  # frames
     
     def __init__(self, x: float, y: float, num_particles: int = DEFAULT_NUM_PARTICLES, 
-                 color: Tuple[int, int, int] = DEFAULT_COLOR) -> None:
+                 color: Tuple[int, int, int] = DEFAULT_COLOR,
+                 engine: Optional[ParticleEngine] = None) -> None:
         """
         Initialize a blood particle explosion at the given position.
         
-        Creates particles in a radial explosion pattern with random speeds
-        and angles for a natural-looking splatter effect.
-        
         Args:
             x: X position of the explosion center
             y: Y position of the explosion center
             num_particles: Number of particles to create (default: 25)
             color: RGB color tuple for particles (default: green)
+            engine: Engine to emit into (default: global particle_engine)
         """
-        self.particles: List[Particle] = []
+        self.engine = engine if engine is not None else particle_engine
         self.color = color
+        # Engine step this system has last seen; see update()
+        self._seen_step = self.engine.steps
         
         # Create particles in an explosion pattern
-        self._create_explosion(x, y, num_particles)
-    
-    def _create_explosion(self, x: float, y: float, num_particles: int) -> None:
-        """
-        Create particles in a radial explosion pattern.
-        
-        This private method generates particles with random angles and speeds
-        to simulate an explosion effect. Uses polar coordinates to distribute
-        particles evenly in all directions.
-        
-        Args:
-            x: Center X position
-            y: Center Y position
-            num_particles: Number of particles to create
-        """
-        for _ in range(num_particles):
-            # Random angle for radial distribution (0 to 2π)
-            angle = random.uniform(0, 2 * math.pi)
-            
-            # Random speed for varied explosion intensity
-            speed = random.uniform(self.MIN_PARTICLE_SPEED, self.MAX_PARTICLE_SPEED)
-            
-            # Convert polar coordinates to Cartesian velocity
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            
-            # Random lifetime for varied particle duration
-            lifetime = random.randint(self.MIN_LIFETIME, self.MAX_LIFETIME)
-            
-            # Create and add particle to the system
-            particle = Particle(x, y, self.color, (vx, vy), lifetime)
-            self.particles.append(particle)
+        self.group = self.engine.emit_burst(
+            x, y, num_particles, color,
+            speed=(self.MIN_PARTICLE_SPEED, self.MAX_PARTICLE_SPEED),
+            lifetime=(self.MIN_LIFETIME, self.MAX_LIFETIME))
     
     def update(self) -> None:
         """
-        Update all particles and remove dead ones.
-        
-        This method updates each particle's physics and filters out particles
-        that have expired (lifetime <= 0), maintaining optimal performance
-        by not updating dead particles.
+        Advance the particle engine by one frame.
+
+        The engine is shared, so it is stepped only if no other system has
+        stepped it since this system's previous update - i.e. once per
+        frame no matter how many systems are alive.
         """
-        # Update all particles and keep only alive ones (list comprehension)
-        self.particles = [p for p in self.particles if p.update()]
+        engine = self.engine
+        if engine.steps == self._seen_step:
+            engine.update()
+            engine.draw_owner = self
+        self._seen_step = engine.steps
     
-    def draw(self, screen: pygame.Surface) -> None:
+    def draw(self, screen: pygame.Surface) -> Optional[List[pygame.Rect]]:
         """
-        Render all active particles.
+        Render all active particles (done by the system that stepped the engine).
         
         Args:
             screen: Pygame surface to draw particles on
+
+        Returns:
+            Bounding rects of the drawn particle groups, or None if this
+            system did not draw
         """
-        for particle in self.particles:
-            particle.draw(screen)
+        if self.engine.draw_owner is self:
+            return self.engine.draw(screen)
+        return None
     
     def is_alive(self) -> bool:
         """
@@ -233,7 +496,7 @@ class BloodParticleSystem:
         Returns:
             True if there are still particles to render, False otherwise
         """
-        return len(self.particles) > 0
+        return self.engine.group_count(self.group) > 0
     
     def __len__(self) -> int:
         """
@@ -242,7 +505,7 @@ class BloodParticleSystem:
         Returns:
             Number of particles currently in the system
         """
-        return len(self.particles)
+        return self.engine.group_count(self.group)
 
 
 class Gravestone:
@@ -0,0 +1,308 @@
+"""
+Frame-time profiler with per-subsystem timings.
+
+Phases of the game loop are wrapped in named sections. Each frame the time
+spent in every section is summed, and the last `window` frames are kept in
+ring buffers so rolling percentiles (p50/p95/p99) can be shown in an
+on-screen overlay or dumped to JSON/CSV. When the profiler is disabled a
+section is a shared no-op context manager, so leaving the instrumentation
+in the loop costs next to nothing.
+"""
+import csv
+import json
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+import pygame
+
+
+class _NullSection:
+    """Context manager that does nothing (used while profiling is disabled)."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class _Section:
+    """Timer for one named section; adds its elapsed time to the current frame."""
+
+    __slots__ = ("_totals", "name", "_start")
+
+    def __init__(self, totals: Dict[str, float], name: str) -> None:
+        self._totals = totals
+        self.name = name
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self._totals[self.name] += time.perf_counter() - self._start
+        return False
+
+
+class FrameProfiler:
+    """
+    Collects per-section frame timings and rolling percentiles.
+
+    A section may run several times per frame (its times are summed), but
+    a section must not be nested inside itself. Sections that did not run
+    in a frame record 0 ms for that frame, so the per-section means can be
+    compared directly with the frame time.
+
+    Attributes:
+        enabled (bool): Whether sections are timed
+        overlay_visible (bool): Whether draw_overlay() draws anything
+        window (int): Number of frames kept for the rolling statistics
+        frames (int): Frames recorded since the last reset
+
+    Example:
+        >>> profiler.begin_frame()
+        >>> with profiler.section("enemies"):
+        ...     update_enemies()
+        >>> profiler.end_frame()
+        >>> profiler.get_stats()["enemies"]["p95"]
+    """
+
+    DEFAULT_WINDOW = 300
+    FRAME = "frame"  # Section name of the whole frame
+    OVERLAY_REFRESH_FRAMES = 15  # Re-render overlay text every N frames
+    OVERLAY_COLOR = (255, 255, 255)
+    OVERLAY_BACKGROUND = (0, 0, 0, 170)
+
+    def __init__(self, enabled: bool = False, window: int = DEFAULT_WINDOW) -> None:
+        """
+        Initialize the profiler.
+
+        Args:
+            enabled: Start with timing enabled
+            window: Number of frames kept for the rolling statistics
+
+        Raises:
+            ValueError: If window is not positive
+        """
+        if window <= 0:
+            raise ValueError(f"window must be positive, got {window}")
+
+        self.enabled = enabled
+        self.overlay_visible = False
+        self.window = window
+        self.frames = 0
+        # Section order as first seen (keeps the overlay stable)
+        self._names: List[str] = []
+        self._sections: Dict[str, _Section] = {}
+        self._totals: Dict[str, float] = {}
+        self._samples: Dict[str, np.ndarray] = {}
+        self._frame_start: Optional[float] = None
+        self._overlay: Optional[pygame.Surface] = None
+        self._overlay_age = 0
+
+    def configure(self, enabled: Optional[bool] = None, window: Optional[int] = None) -> None:
+        """
+        Change settings of an existing profiler (changing the window drops recorded frames).
+
+        Args:
+            enabled: Enable or disable timing (None = unchanged)
+            window: New number of frames kept (None = unchanged)
+
+        Raises:
+            ValueError: If window is not positive
+        """
+        if enabled is not None:
+            self.enabled = enabled
+        if window is not None and window != self.window:
+            if window <= 0:
+                raise ValueError(f"window must be positive, got {window}")
+            self.window = window
+            self.reset()
+
+    def section(self, name: str):
+        """
+        Get a context manager timing a section of the current frame.
+
+        Args:
+            name: Section name (e.g. "enemies", "hud")
+
+        Returns:
+            Context manager (a shared no-op one while disabled)
+        """
+        if not self.enabled:
+            return _NULL_SECTION
+        section = self._sections.get(name)
+        if section is None:
+            section = self._add_section(name)
+        return section
+
+    def _add_section(self, name: str) -> _Section:
+        """Register a new section with an empty sample buffer."""
+        section = _Section(self._totals, name)
+        self._sections[name] = section
+        self._totals[name] = 0.0
+        # NaN marks frames recorded before the section existed
+        self._samples[name] = np.full(self.window, np.nan)
+        self._names.append(name)
+        return section
+
+    def begin_frame(self) -> None:
+        """Start timing a frame."""
+        if self.enabled:
+            self._frame_start = time.perf_counter()
+
+    def end_frame(self) -> None:
+        """Finish the frame and push its section times into the rolling window."""
+        if not self.enabled or self._frame_start is None:
+            return
+        frame_time = time.perf_counter() - self._frame_start
+        self._frame_start = None
+
+        if self.FRAME not in self._sections:
+            self._add_section(self.FRAME)
+        totals = self._totals
+        totals[self.FRAME] = frame_time
+
+        slot = self.frames % self.window
+        for name, samples in self._samples.items():
+            samples[slot] = totals[name] * 1000.0
+            totals[name] = 0.0
+        self.frames += 1
+        self._overlay_age += 1
+
+    def toggle_overlay(self) -> None:
+        """Show or hide the overlay (showing it also enables timing)."""
+        self.overlay_visible = not self.overlay_visible
+        if self.overlay_visible:
+            self.enabled = True
+            self._overlay = None
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get rolling statistics per section, in milliseconds.
+
+        Returns:
+            Dictionary mapping section name to mean, p50, p95, p99 and max
+            over the frames in the window (sections in first-seen order,
+            "frame" last)
+        """
+        stats = {}
+        names = [name for name in self._names if name != self.FRAME]
+        if self.FRAME in self._samples:
+            names.append(self.FRAME)
+        for name in names:
+            samples = self._samples[name][:min(self.frames, self.window)]
+            samples = samples[~np.isnan(samples)]
+            if not len(samples):
+                continue
+            p50, p95, p99 = np.percentile(samples, (50, 95, 99))
+            stats[name] = {
+                'mean': float(samples.mean()),
+                'p50': float(p50),
+                'p95': float(p95),
+                'p99': float(p99),
+                'max': float(samples.max()),
+                'frames': int(len(samples)),
+            }
+        return stats
+
+    def draw_overlay(self, screen: pygame.Surface, font: pygame.font.Font,
+                     pos: tuple = (20, 150)) -> Optional[pygame.Rect]:
+        """
+        Draw the timing table (re-rendered every few frames).
+
+        Args:
+            screen: Surface to draw on
+            font: Font for the table
+            pos: Top-left corner of the overlay
+
+        Returns:
+            Rect drawn to, or None if the overlay is hidden
+        """
+        if not self.overlay_visible:
+            return None
+        if self._overlay is None or self._overlay_age >= self.OVERLAY_REFRESH_FRAMES:
+            self._overlay = self._render_overlay(font)
+            self._overlay_age = 0
+        return screen.blit(self._overlay, pos)
+
+    def _render_overlay(self, font: pygame.font.Font) -> pygame.Surface:
+        """Render the current statistics into a new overlay surface."""
+        lines = [f"{'section':<14}{'p50':>8}{'p95':>8}{'p99':>8}  ms"]
+        for name, s in self.get_stats().items():
+            lines.append(f"{name:<14}{s['p50']:>8.2f}{s['p95']:>8.2f}{s['p99']:>8.2f}")
+        if len(lines) == 1:
+            lines.append("collecting...")
+
+        rendered = [font.render(line, True, self.OVERLAY_COLOR) for line in lines]
+        line_height = font.get_linesize()
+        width = max(text.get_width() for text in rendered) + 16
+        overlay = pygame.Surface((width, line_height * len(rendered) + 12), pygame.SRCALPHA)
+        overlay.fill(self.OVERLAY_BACKGROUND)
+        for i, text in enumerate(rendered):
+            overlay.blit(text, (8, 6 + i * line_height))
+        return overlay
+
+    def dump(self, path: str) -> bool:
+        """
+        Write the statistics to a file (CSV if the path ends in .csv, JSON otherwise).
+
+        The JSON file also contains the raw per-frame samples of the window.
+
+        Args:
+            path: Output file path
+
+        Returns:
+            True if anything was written, False if no frame was recorded
+        """
+        stats = self.get_stats()
+        if not stats:
+            return False
+
+        if path.lower().endswith(".csv"):
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["section", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms", "frames"])
+                for name, s in stats.items():
+                    writer.writerow([name, f"{s['mean']:.4f}", f"{s['p50']:.4f}", f"{s['p95']:.4f}",
+                                     f"{s['p99']:.4f}", f"{s['max']:.4f}", s['frames']])
+        else:
+            count = min(self.frames, self.window)
+            # Oldest frame first
+            order = np.roll(np.arange(count), -(self.frames % self.window)) if self.frames > self.window else np.arange(count)
+            samples = {name: [None if np.isnan(v) else round(float(v), 4) for v in self._samples[name][order]]
+                       for name in stats}
+            with open(path, "w") as f:
+                json.dump({'frames': self.frames, 'window': self.window, 'stats': stats,
+                           'samples_ms': samples}, f, indent=2)
+        return True
+
+    def reset(self) -> None:
+        """Drop all sections and recorded frames."""
+        self._names.clear()
+        self._sections.clear()
+        self._totals.clear()
+        self._samples.clear()
+        self._frame_start = None
+        self._overlay = None
+        self.frames = 0
+
+    def __repr__(self) -> str:
+        """
+        String representation for debugging.
+
+        Returns:
+            String showing state, recorded frames and section count
+        """
+        return (f"FrameProfiler(enabled={self.enabled}, frames={self.frames}, "
+                f"sections={len(self._names)})")
+
+
+# Global profiler instance (enabled by PROFILER_ENABLED or the overlay key)
+profiler = FrameProfiler()
@@ -0,0 +1,295 @@
+"""
+Uniform-grid spatial hash for broad-phase collision detection.
+
+This module bins a batch of circles (e.g. all live bullets of a
+BulletPool) into square cells once per tick. Every circle gets the key
+of its cell and the keys are sorted, so the circles of one grid column
+form a contiguous run that is found with a binary search. A query then
+only tests the circles in the cells around it instead of every circle,
+which keeps the cost of bullet/enemy tests roughly linear in the number
+of objects.
+
+The same grid serves single queries (a bullet pool against one hitbox),
+batches of queries (ECS attackers against targets) and the pairs within
+one batch (crowd separation).
+"""
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class SpatialHashGrid:
+    """
+    Cell-sorted grid over a fixed batch of circles.
+
+    build() bins the circles; query_circle() and query_hitbox() return the
+    indices of the circles overlapping a query circle and query_pairs() does
+    the same for a whole batch of query circles, all using the same
+    squared-distance test as HitBox.collide. candidate_pairs() lists the
+    pairs of built circles close enough to overlap. The grid is a snapshot:
+    it has to be rebuilt after the circles move or the batch changes.
+
+    Keys are ordered by (column, row) and sorted stably, so results only
+    depend on the positions and the order of the built circles.
+
+    Attributes:
+        min_cell_size (float): Smallest cell edge length in pixels
+        cell_size (float): Cell edge length of the current build
+        count (int): Number of circles in the current build
+        candidate_pairs_tested (int): Pairs looked at by the last
+            query_pairs() or candidate_pairs() call
+
+    Example:
+        >>> grid = SpatialHashGrid()
+        >>> grid.build(x, y, radius)
+        >>> hits = grid.query_hitbox(enemy.hit_box)
+    """
+
+    DEFAULT_CELL_SIZE = 64
+
+    def __init__(self, min_cell_size: float = DEFAULT_CELL_SIZE) -> None:
+        """
+        Initialize an empty grid.
+
+        Args:
+            min_cell_size: Smallest cell edge length in pixels
+
+        Raises:
+            ValueError: If min_cell_size is not positive
+        """
+        if min_cell_size <= 0:
+            raise ValueError(f"min_cell_size must be positive, got {min_cell_size}")
+
+        self.min_cell_size = float(min_cell_size)
+        self.cell_size = self.min_cell_size
+        self.count = 0
+        self._x = np.empty(0)
+        self._y = np.empty(0)
+        self._radius = np.empty(0)
+        self._max_radius = 0.0
+        self._order = np.empty(0, dtype=np.intp)
+        self._keys = np.empty(0, dtype=np.int64)
+        self._min_cx = 0
+        self._min_cy = 0
+        self._columns = 0
+        self._rows = 0
+        self._cx = np.empty(0, dtype=np.int64)
+        self._cy = np.empty(0, dtype=np.int64)
+        self.candidate_pairs_tested = 0
+
+    def build(self, x: np.ndarray, y: np.ndarray, radius: np.ndarray,
+              cell_size: Optional[float] = None) -> None:
+        """
+        Bin a batch of circles, replacing the previous build.
+
+        The arrays are kept by reference, so they must not be modified
+        while the grid is queried.
+
+        Args:
+            x: Circle centers X
+            y: Circle centers Y
+            radius: Circle radii
+            cell_size: Cell edge length (default: twice the largest radius,
+                       at least min_cell_size); query_pairs() callers can
+                       pass the largest reach to keep the cells small
+        """
+        self.count = len(x)
+        self._x, self._y, self._radius = x, y, radius
+        if self.count == 0:
+            return
+
+        self._max_radius = float(radius.max())
+        if cell_size is None:
+            cell_size = 2.0 * self._max_radius
+        self.cell_size = max(self.min_cell_size, float(cell_size))
+        cx = np.floor(x / self.cell_size).astype(np.int64)
+        cy = np.floor(y / self.cell_size).astype(np.int64)
+        self._min_cx = int(cx.min())
+        self._min_cy = int(cy.min())
+        self._columns = int(cx.max()) - self._min_cx + 1
+        self._rows = int(cy.max()) - self._min_cy + 1
+
+        self._cx = cx - self._min_cx
+        self._cy = cy - self._min_cy
+        keys = self._cx * self._rows + self._cy
+        self._order = np.argsort(keys, kind='stable')
+        self._keys = keys[self._order]
+
+    def query_circle(self, cx: float, cy: float, r: float) -> np.ndarray:
+        """
+        Find all circles of the build overlapping a circle.
+
+        Args:
+            cx: Circle center X
+            cy: Circle center Y
+            r: Circle radius
+
+        Returns:
+            Ascending array of indices into the built arrays
+        """
+        if self.count == 0:
+            return np.empty(0, dtype=np.intp)
+
+        # Any overlapping center lies within r + max radius of (cx, cy)
+        reach = r + self._max_radius
+        col_lo = max(math.floor((cx - reach) / self.cell_size) - self._min_cx, 0)
+        col_hi = min(math.floor((cx + reach) / self.cell_size) - self._min_cx, self._columns - 1)
+        row_lo = max(math.floor((cy - reach) / self.cell_size) - self._min_cy, 0)
+        row_hi = min(math.floor((cy + reach) / self.cell_size) - self._min_cy, self._rows - 1)
+        if col_lo > col_hi or row_lo > row_hi:
+            return np.empty(0, dtype=np.intp)
+
+        # One contiguous key run per column
+        columns = np.arange(col_lo, col_hi + 1, dtype=np.int64) * self._rows
+        starts = np.searchsorted(self._keys, columns + row_lo, side='left')
+        ends = np.searchsorted(self._keys, columns + row_hi, side='right')
+        candidates = np.concatenate([self._order[s:e] for s, e in zip(starts, ends)])
+        if len(candidates) == 0:
+            return candidates
+
+        dx = self._x[candidates] - cx
+        dy = self._y[candidates] - cy
+        reach = self._radius[candidates] + r
+        return np.sort(candidates[dx * dx + dy * dy <= reach * reach])
+
+    def query_hitbox(self, hit_box) -> np.ndarray:
+        """
+        Find all circles of the build overlapping a HitBox.
+
+        Args:
+            hit_box: HitBox to test
+
+        Returns:
+            Ascending array of indices into the built arrays
+        """
+        return self.query_circle(hit_box.x, hit_box.y, hit_box.r)
+
+    def query_pairs(self, x: np.ndarray, y: np.ndarray,
+                    radius: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find all overlaps between a batch of query circles and the build.
+
+        Args:
+            x: Query circle centers X
+            y: Query circle centers Y
+            radius: Query circle radii
+
+        Returns:
+            (query, circle) index arrays of the overlapping pairs, sorted by
+            query index and then by circle index
+        """
+        empty = np.empty(0, dtype=np.intp)
+        self.candidate_pairs_tested = 0
+        m = len(x)
+        if self.count == 0 or m == 0:
+            return empty, empty
+
+        # Overlapping centers are at most `span` cells apart on each axis
+        span = max(1, math.ceil((float(radius.max()) + self._max_radius) / self.cell_size))
+        qcx = np.floor(x / self.cell_size).astype(np.int64) - self._min_cx
+        qcy = np.floor(y / self.cell_size).astype(np.int64) - self._min_cy
+        row_lo = np.maximum(qcy - span, 0)
+        row_hi = np.minimum(qcy + span, self._rows - 1)
+        rows_valid = row_lo <= row_hi
+
+        queries, circles = [], []
+        for dx in range(-span, span + 1):
+            column = qcx + dx
+            valid = rows_valid & (column >= 0) & (column < self._columns)
+            # The rows of one column form one contiguous key run
+            lo = np.searchsorted(self._keys, column * self._rows + row_lo, side='left')
+            hi = np.searchsorted(self._keys, column * self._rows + row_hi, side='right')
+            counts = np.where(valid, hi - lo, 0)
+            query, circle = self._expand(counts, lo)
+            if len(query):
+                queries.append(query)
+                circles.append(circle)
+        if not queries:
+            return empty, empty
+        query = np.concatenate(queries)
+        circle = np.concatenate(circles)
+        self.candidate_pairs_tested = len(query)
+
+        dx = x[query] - self._x[circle]
+        dy = y[query] - self._y[circle]
+        reach = radius[query] + self._radius[circle]
+        overlap = dx * dx + dy * dy <= reach * reach
+        query = query[overlap]
+        circle = circle[overlap]
+        pair_order = np.lexsort((circle, query))
+        return query[pair_order], circle[pair_order]
+
+    # Half of the 3x3 neighbourhood (the other half is covered by symmetry)
+    _HALF_NEIGHBOURHOOD = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+
+    def candidate_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get all pairs of built circles in the same or adjacent cells.
+
+        Each pair is listed once. With the default cell size (at least twice
+        the largest radius) every overlapping pair is included; the caller
+        does the exact test.
+
+        Returns:
+            (first, second) index arrays into the built arrays
+        """
+        empty = np.empty(0, dtype=np.intp)
+        self.candidate_pairs_tested = 0
+        n = self.count
+        if n < 2:
+            return empty, empty
+
+        keys = self._cx * self._rows + self._cy
+        position = np.empty(n, dtype=np.intp)
+        position[self._order] = np.arange(n)
+
+        firsts, seconds = [], []
+        for dx, dy in self._HALF_NEIGHBOURHOOD:
+            row = self._cy + dy
+            target = keys + dx * self._rows + dy
+            lo = np.searchsorted(self._keys, target, side='left')
+            hi = np.searchsorted(self._keys, target, side='right')
+            if dx == 0 and dy == 0:
+                # Same cell: only partners after this circle in sorted order
+                lo = np.maximum(lo, position + 1)
+            # Rows outside the grid would wrap into the neighbouring column
+            counts = np.where((row >= 0) & (row < self._rows), np.maximum(hi - lo, 0), 0)
+            first, second = self._expand(counts, lo)
+            if len(first):
+                firsts.append(first)
+                seconds.append(second)
+
+        if not firsts:
+            return empty, empty
+        first = np.concatenate(firsts)
+        self.candidate_pairs_tested = len(first)
+        return first, np.concatenate(seconds)
+
+    def _expand(self, counts: np.ndarray, lo: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Turn per-query runs [lo, lo + count) of sorted keys into (query, circle) pairs."""
+        total = int(counts.sum())
+        if total == 0:
+            empty = np.empty(0, dtype=np.intp)
+            return empty, empty
+        start = np.cumsum(counts) - counts
+        within = np.arange(total) - np.repeat(start, counts)
+        return np.repeat(np.arange(len(counts)), counts), self._order[np.repeat(lo, counts) + within]
+
+    def clear(self) -> None:
+        """Forget the current build."""
+        self.build(np.empty(0), np.empty(0), np.empty(0))
+
+    def __len__(self) -> int:
+        """Get the number of circles in the current build."""
+        return self.count
+
+    def __repr__(self) -> str:
+        """
+        String representation for debugging.
+
+        Returns:
+            String showing the cell size, circle count and grid extent
+        """
+        return (f"SpatialHashGrid(cell_size={self.cell_size:g}, count={self.count}, "
+                f"cells={self._columns}x{self._rows})")